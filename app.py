@@ -1,22 +1,89 @@
-import json
+from contextlib import nullcontext
+import logging
 from pathlib import Path
+import time
 
-from dash import Dash, Input, Output, dcc, html
+from dash import MATCH, ClientsideFunction, Dash, Input, Output, Patch, State, ctx, dcc, html, no_update
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
-
-BASE = Path(__file__).parent
-PROSPECTS_DATA = json.loads((BASE / "data" / "prospects.json").read_text())
-SNIPPETS_DATA = json.loads((BASE / "data" / "knowledge-snippets.json").read_text())
-
-SCENARIO_FILES = {
-    "NovaThera Labs • Audit Push": BASE / "data" / "call-studio-sample.json",
-    "Federal Pulse • Security Consolidation": BASE / "data" / "dashboard-preload-sample.json",
-}
-SCENARIOS = {label: json.loads(path.read_text()) for label, path in SCENARIO_FILES.items()}
-
-PROSPECT_MAP = {p["companyName"]: p for p in PROSPECTS_DATA["prospects"]}
-DEFAULT_PROSPECT = PROSPECTS_DATA["prospects"][0]["companyName"]
-DEFAULT_SCENARIO = next(iter(SCENARIOS.keys()))
+import flask
+from plotly.io.json import to_json_plotly
+
+from dealcast import render
+from dealcast.cache import FragmentCache, LRUCache
+from dealcast.cards import CardDeck
+from dealcast.citations import CitationIndex, ScenarioCitations
+from dealcast.config import (
+    BASE_DIR,
+    CACHE_DIR,
+    CARDS_PATH,
+    CLIENTSIDE_PROSPECTS,
+    COMPRESS,
+    DATA_DIR,
+    METRICS_ENABLED,
+    RESPONSE_CACHE_MB,
+    SCENARIO_DIR,
+)
+from dealcast.datapack import open_pack
+from dealcast.metrics import Metrics
+from dealcast.prospect_store import open_prospect_store
+from dealcast.ranking import ProspectRanker
+from dealcast.render import to_dash
+from dealcast.response_cache import ResponseCache, cache_key, install_response_cache, source_version
+from dealcast.scenario_registry import ScenarioRegistry
+from dealcast.snippet_index import SnippetIndex
+from dealcast.watcher import DataVersions, DataWatcher
+
+log = logging.getLogger(__name__)
+
+# Opt-in instrumentation; while it is None the render path does no extra work.
+METRICS = Metrics() if METRICS_ENABLED else None
+
+
+def timed_load(source):
+    return METRICS.time_load(source) if METRICS is not None else nullcontext()
+
+
+SNIPPETS_PATH = DATA_DIR / "knowledge-snippets.json"
+# Sources compiled by scripts/compile_data.py are read from the pack until
+# they are edited; anything newer than the pack comes from the JSON.
+with timed_load("prospects"):
+    PROSPECTS = open_prospect_store(DATA_DIR / "prospects.json")
+with timed_load("snippets"):
+    SNIPPETS = SnippetIndex(SNIPPETS_PATH)
+# Scenarios without curated knowledge_snippets show the library's best matches
+# for the selected prospect, capped at this many cards.
+SNIPPET_LIMIT = 12
+# Snippet cards, host script rows and cue sheet lines render this many
+# items at a time; turn_page sends the other pages on request.
+PAGE_SIZE = 20
+# [src-id] citations resolve against a scenario's own snippets, then the library.
+LIBRARY_CITATIONS = CitationIndex(SNIPPETS.documents)
+CITATIONS = LRUCache(maxsize=256)
+
+# Every JSON file under SCENARIO_DIR that carries a session_context is a scenario.
+with timed_load("scenarios"):
+    SCENARIOS = ScenarioRegistry(SCENARIO_DIR, exclude={PROSPECTS.path.name, SNIPPETS_PATH.name}, pack=open_pack())
+# The registry lists scenarios newest air date first; the segment and host
+# filters narrow the rest.
+SCENARIO_OPTION_LIMIT = 200
+
+# File versions of the data each source was loaded from, updated by the data
+# watcher; the fragment cache and the browser-side data-version store both
+# key on these, and every worker serving the same files agrees on them.
+DATA_VERSIONS = DataVersions()
+# How often open sessions ask whether the data under data/ has moved on.
+DATA_POLL_MS = 5000
+
+# Precomputed by scripts/build_cards.py; the roster overview reads nothing else.
+with timed_load("cards"):
+    CARDS = CardDeck(CARDS_PATH)
+
+# The roster is searched server-side; the dropdown only ever holds a page of matches.
+PROSPECT_OPTION_LIMIT = 50
+# Orders the dropdown: best prospects for the selected show first.
+with timed_load("ranking"):
+    RANKER = ProspectRanker(PROSPECTS.path)
 
 FONT_LINK = "https://fonts.googleapis.com/css2?family=Inter:wght@400;600&family=Space+Grotesk:wght@500&display=swap"
 
@@ -26,371 +93,695 @@ app = Dash(
     title="DealCast Control Surface",
 )
 
-PAGE_STYLE = {
-    "backgroundColor": "#05060a",
-    "color": "#f5f7ff",
-    "fontFamily": "Inter, system-ui, -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",
-    "minHeight": "100vh",
-    "padding": "32px 32px 90px",
-}
+if COMPRESS:
+    try:
+        from flask_compress import Compress
+    except ImportError:
+        log.warning("DEALCAST_COMPRESS is set but flask-compress is not installed; serving uncompressed")
+    else:
+        # Configured before Compress() reads it; Dash's own compress flag pins gzip only.
+        app.server.config.update(
+            COMPRESS_ALGORITHM=["br", "gzip"],
+            COMPRESS_BR_LEVEL=4,
+            COMPRESS_MIN_SIZE=1024,
+            COMPRESS_MIMETYPES=["application/json", "application/javascript", "text/css", "text/html"],
+        )
+        Compress(app.server)
 
-CARD_STYLE = {
-    "background": "#0e111a",
-    "border": "1px solid rgba(255,255,255,0.05)",
-    "borderRadius": "16px",
-    "padding": "20px",
-    "marginBottom": "20px",
-}
 
-CHIP_STYLE = {
-    "display": "inline-flex",
-    "alignItems": "center",
-    "gap": "8px",
-    "background": "rgba(255,255,255,0.04)",
-    "border": "1px solid rgba(255,255,255,0.07)",
-    "borderRadius": "999px",
-    "padding": "8px 16px",
-    "fontSize": "13px",
-    "fontWeight": "600",
-}
+def prospect_options(names):
+    return [{"label": name, "value": name} for name in names]
 
 
-def build_stat_grid(prospect: dict) -> html.Div:
-    stats = [
-        ("Industry", prospect["industry"]),
-        ("HQ", prospect["headquarters"]),
-        ("Revenue", prospect["annualRevenue"]),
-        ("Stage", prospect["growthStage"]),
-    ]
-    return html.Div(
-        [
-            html.Div(
-                [html.Div(label, className="stat-label"), html.Div(value, className="stat-value")],
-                className="stat-card",
-            )
-            for label, value in stats
-        ],
-        className="stat-grid",
-    )
+def prospect_records(names):
+    """The prospect panels of ``names`` as render JSON, keyed by panel id."""
+    return {name: render.prospect_panels_json(PROSPECTS.get(name)) for name in names if name in PROSPECTS}
 
 
-def build_list_section(items, title):
-    return html.Div(
-        [
-            html.Div(title, className="section-title"),
-            html.Ul([html.Li(item) for item in items], className="bullets"),
-        ],
-        style=CARD_STYLE,
-    )
+def prospect_panel_data(names):
+    """The prospect-data store for the browser to expand (clientside mode).
 
+    ``panels`` is the clientside callback's output order (the render core's
+    PROSPECT_PANELS), so dealcast.js never hardcodes how many there are.
+    """
+    return {"panels": list(render.PROSPECT_PANELS), "prospects": prospect_records(names)}
 
-def build_persona_cards(personas):
-    return html.Div(
-        [
-            html.Div(
-                [
-                    html.Div(person["title"], className="persona-title"),
-                    html.Div(person["name"], className="persona-name"),
-                    html.P(person["personaBio"], className="persona-bio"),
-                ],
-                className="persona-card",
-            )
-            for person in personas
-        ],
-        className="persona-grid",
-    )
 
+def ranked_prospects(request_id, names=None):
+    """Order ``names`` (or the whole roster, capped) by fit with the scenario's show."""
+    profile = RANKER.profile_for_scenario(SCENARIOS.get(request_id) if request_id in SCENARIOS else None)
+    if names is None:
+        return RANKER.top(profile, limit=PROSPECT_OPTION_LIMIT)
+    return RANKER.order(names, profile)
 
-def build_tech_stack_cards(stack):
-    return html.Div(
-        [
-            html.Div(
-                [html.Div(label.title(), className="tech-label"), html.Div(value, className="tech-value")],
-                className="tech-card",
-            )
-            for label, value in stack.items()
-        ],
-        className="tech-grid",
-    )
 
+def scenario_options(segment=None, host=None, current=None):
+    entries = SCENARIOS.entries(segment=segment, host=host)[:SCENARIO_OPTION_LIMIT]
+    if current in SCENARIOS and all(entry.request_id != current for entry in entries):
+        entries.append(SCENARIOS.entry(current))
+    return [{"label": entry.label, "value": entry.request_id} for entry in entries]
 
-def build_snippet_cards(snippets):
-    return html.Div(
-        [
-            html.Div(
-                [
-                    html.Div(snippet.get("title"), className="snippet-title"),
-                    html.P(snippet.get("excerpt") or snippet.get("snippet"), className="snippet-body"),
-                    html.Div(snippet.get("source") or snippet.get("path"), className="snippet-source"),
-                ],
-                className="snippet-card",
-            )
-            for snippet in snippets
-        ],
-        className="snippet-grid",
-    )
 
+def filter_options(values):
+    return [{"label": value, "value": value} for value in values]
 
-def build_signal_stack(signals):
-    return html.Ul(
-        [
-            html.Li(
-                [
-                    html.Span(signal["label"], className="chip"),
-                    html.Span(signal["detail"], className="signal-detail"),
-                ]
-            )
-            for signal in signals
-        ],
-        className="signal-stack",
-    )
 
+def scenario_source(request_id):
+    return f"scenario:{request_id}"
+
+
+def record_loaded_versions():
+    """Record the versions of everything loaded at startup; the reload handlers keep them current."""
+    DATA_VERSIONS.set("prospects", PROSPECTS.version)
+    DATA_VERSIONS.set("snippets", SNIPPETS.version)
+    DATA_VERSIONS.set("cards", CARDS.version)
+    for entry in SCENARIOS.entries():
+        DATA_VERSIONS.set(scenario_source(entry.request_id), entry.version)
+
+
+record_loaded_versions()
+
+
+def page_bounds(total, page):
+    """Clamp ``page`` to a list of ``total`` items; returns (page, start, stop)."""
+    page = min(max(page, 0), max(0, (total - 1) // PAGE_SIZE))
+    return page, page * PAGE_SIZE, min(total, (page + 1) * PAGE_SIZE)
+
+
+def page_status(total, page):
+    _, start, stop = page_bounds(total, page)
+    return f"{start + 1}–{stop} of {total}"
 
-def build_talk_tracks(tracks):
-    cards = []
-    for track in tracks:
-        cards.append(
-            html.Div(
-                [
-                    html.Div(track["title"], className="talktrack-title"),
-                    html.Ul([html.Li(beat) for beat in track.get("beats", [])], className = "bullets"),
-                    html.Div(f"Overlay: {track.get('overlay')}", className="overlay-tag"),
-                ],
-                className="talktrack-card",
-            )
-        )
-    return html.Div(cards, className="talktrack-grid")
 
+def build_paged(list_id, items, build):
+    """The first page of ``items`` through ``build``, with pager controls when the list runs long.
 
-def build_cta_blocks(ctas):
+    This is the ``paged`` hook of the render core's list panels; ``build``
+    returns render nodes.
+
+    Later pages are fetched by turn_page, which reads the list again from
+    the selected scenario and prospect and renders only that slice.
+    """
+    if len(items) <= PAGE_SIZE:
+        return build(items)
     return html.Div(
         [
+            html.Div(to_dash(build(items[:PAGE_SIZE])), id={"role": "page-body", "list": list_id}),
             html.Div(
                 [
-                    html.Div(cta["label"], className="cta-label"),
-                    html.P(cta.get("microcopy"), className="cta-copy"),
-                    html.Div(cta.get("asset"), className="cta-asset"),
+                    html.Button(
+                        "‹ Prev",
+                        id={"role": "page-prev", "list": list_id},
+                        disabled=True,
+                        className="pager-button",
+                    ),
+                    html.Span(page_status(len(items), 0), id={"role": "page-status", "list": list_id}),
+                    html.Button(
+                        "Next ›",
+                        id={"role": "page-next", "list": list_id},
+                        className="pager-button",
+                    ),
                 ],
-                className="cta-card",
-            )
-            for cta in ctas
-        ],
-        className="cta-grid",
+                className="pager",
+            ),
+            dcc.Store(id={"role": "page-state", "list": list_id}, data=0),
+        ]
     )
 
 
-def build_host_script(script):
-    rows = []
-    for row in script:
-        rows.append(
+def serve_layout():
+    names = ranked_prospects(SCENARIOS.default)
+    if PROSPECTS.default not in names:
+        names.append(PROSPECTS.default)
+    # In clientside mode each session receives a prospect's panels once, with
+    # the dropdown page that lists it, and expands them locally.
+    client_stores = [dcc.Store(id="prospect-data", data=prospect_panel_data(names))] if CLIENTSIDE_PROSPECTS else []
+    return html.Div(
+        [
+            dcc.Interval(id="data-poll", interval=DATA_POLL_MS),
+            dcc.Store(id="data-version", data={"versions": DATA_VERSIONS.snapshot(), "changed": []}),
+            *client_stores,
             html.Div(
+                html.Div(
+                    [
+                        html.Div("DealCast Control Surface", className="hero-title"),
+                        html.Div("Control room ready view of prospects, signals, and scripted actions.", className="hero-subtitle"),
+                    ]
+                ),
+                className="hero",
+            ),
+            dbc.Row(
                 [
-                    html.Div(row.get("timestamp"), className="script-timestamp"),
-                    html.Div(row.get("copy"), className="script-copy"),
-                    html.Div(row.get("delivery"), className="script-delivery"),
-                ],
-                className="script-row",
-            )
-        )
-    return html.Div(rows, className="script-table")
-
-
-def build_cue_sheet(cues):
-    return html.Ul([html.Li(f"{cue.get('time')}: {cue.get('action')}") for cue in cues], className="bullets")
-
-
-app.layout = html.Div(
-    [
-        html.Div(
-            [
-                html.Div("DealCast Control Surface", className="hero-title"),
-                html.Div("Control room ready view of prospects, signals, and scripted actions.", className="hero-subtitle"),
-            ],
-            className="hero",
-        ),
-        dbc.Row(
-            [
-                dbc.Col(
-                    html.Div(
-                        [
-                            html.Div("Prospect", className="field-label"),
-                            dcc.Dropdown(
-                                id="prospect-select",
-                                value=DEFAULT_PROSPECT,
-                                options=[{"label": p, "value": p} for p in PROSPECT_MAP.keys()],
-                                clearable=False,
-                                className="dropdown",
-                            ),
-                        ],
-                        style=CARD_STYLE,
+                    dbc.Col(
+                        html.Div(
+                            [
+                                html.Div("Prospect", className="field-label"),
+                                dcc.Dropdown(
+                                    id="prospect-select",
+                                    value=PROSPECTS.default,
+                                    options=prospect_options(names),
+                                    placeholder="Search prospects…",
+                                    clearable=False,
+                                    className="dropdown",
+                                ),
+                            ],
+                            className="section-card",
+                        ),
+                        md=6,
                     ),
-                    md=6,
-                ),
-                dbc.Col(
-                    html.Div(
-                        [
-                            html.Div("Scenario", className="field-label"),
-                            dcc.Dropdown(
-                                id="scenario-select",
-                                value=DEFAULT_SCENARIO,
-                                options=[{"label": label, "value": label} for label in SCENARIOS.keys()],
-                                clearable=False,
-                                className="dropdown",
-                            ),
-                        ],
-                        style=CARD_STYLE,
+                    dbc.Col(
+                        html.Div(
+                            [
+                                html.Div("Scenario", className="field-label"),
+                                dcc.Dropdown(
+                                    id="scenario-select",
+                                    value=SCENARIOS.default,
+                                    options=scenario_options(),
+                                    clearable=False,
+                                    className="dropdown",
+                                ),
+                                dbc.Row(
+                                    [
+                                        dbc.Col(
+                                            dcc.Dropdown(
+                                                id="segment-filter",
+                                                options=filter_options(SCENARIOS.segments()),
+                                                placeholder="All segments",
+                                                className="dropdown",
+                                            ),
+                                        ),
+                                        dbc.Col(
+                                            dcc.Dropdown(
+                                                id="host-filter",
+                                                options=filter_options(SCENARIOS.hosts()),
+                                                placeholder="All hosts",
+                                                className="dropdown",
+                                            ),
+                                        ),
+                                    ],
+                                    className="mt-2 g-2",
+                                ),
+                            ],
+                            className="section-card",
+                        ),
+                        md=6,
                     ),
-                    md=6,
-                ),
-            ],
-            className="mb-4",
-        ),
-        dbc.Row(
-            [
-                dbc.Col(
-                    html.Div(
-                        [
-                            html.Div(id="company-meta", style=CARD_STYLE),
-                            html.Div(id="personas", style=CARD_STYLE),
-                            html.Div(id="tech-stack", style=CARD_STYLE),
-                            html.Div(id="challenges", style=CARD_STYLE),
-                            html.Div(id="triggers", style=CARD_STYLE),
-                            html.Div(id="competition", style=CARD_STYLE),
-                            html.Div(id="snippet-feed", style=CARD_STYLE),
-                        ]
+                ],
+                className="mb-4",
+            ),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        html.Div(
+                            [
+                                html.Div(id="company-meta", className="section-card"),
+                                html.Div(id="personas", className="section-card"),
+                                html.Div(id="tech-stack", className="section-card"),
+                                html.Div(id="challenges", className="section-card"),
+                                html.Div(id="triggers", className="section-card"),
+                                html.Div(id="competition", className="section-card"),
+                                html.Div(id="snippet-feed", className="section-card"),
+                            ]
+                        ),
+                        lg=5,
                     ),
-                    lg=5,
-                ),
-                dbc.Col(
-                    html.Div(
-                        [
-                            html.Div(id="intel-brief", style=CARD_STYLE),
-                            html.Div(id="playbook", style=CARD_STYLE),
-                            html.Div(id="call-studio", style=CARD_STYLE),
-                        ]
+                    dbc.Col(
+                        html.Div(
+                            [
+                                html.Div(id="intel-brief", className="section-card"),
+                                html.Div(id="playbook", className="section-card"),
+                                html.Div(id="call-studio", className="section-card"),
+                            ]
+                        ),
+                        lg=7,
                     ),
-                    lg=7,
-                ),
-            ],
-            className="g-4",
-        ),
-    ],
-    style=PAGE_STYLE,
-)
+                ],
+                className="g-4",
+            ),
+            html.Div(id="roster-grid", className="section-card"),
+        ],
+        className="app-shell",
+    )
+
+
+app.layout = serve_layout
+
+
+def snippet_feed_items(scenario, prospect):
+    return scenario.knowledge_snippets or SNIPPETS.for_prospect(prospect, SNIPPET_LIMIT)
+
+
+def render_snippet_feed(scenario, prospect):
+    return to_dash(render.render_snippet_feed(snippet_feed_items(scenario, prospect), paged=build_paged))
+
+
+def roster_cards(scenario):
+    """Summary cards for the whole roster, best fit for the show first."""
+    return CARDS.ordered(RANKER.top(RANKER.profile_for_scenario(scenario)))
+
+
+def render_roster_grid(scenario):
+    return to_dash(render.render_roster(roster_cards(scenario), paged=build_paged))
+
+
+def render_intel(scenario, citations):
+    return to_dash(render.render_intel(scenario, citations))
+
+
+def render_playbook(scenario, citations):
+    return to_dash(render.render_playbook(scenario, citations))
+
+
+def render_call_studio(scenario, citations):
+    return to_dash(render.render_call_studio(scenario, citations, paged=build_paged))
+
+
+def prospect_panel(build):
+    return lambda prospect: to_dash(build(prospect))
+
+
+# Output order of refresh_view. Prospect panels only depend on prospect-select,
+# scenario panels only on scenario-select, paired panels on both.
+PROSPECT_PANELS = {panel: prospect_panel(build) for panel, build in render.PROSPECT_PANELS.items()}
+SCENARIO_PANELS = {
+    "intel-brief": render_intel,
+    "playbook": render_playbook,
+    "call-studio": render_call_studio,
+}
+PAIRED_PANELS = {
+    "snippet-feed": render_snippet_feed,
+}
+# Lists build_paged splits into pages: list id -> (items of a scenario and
+# prospect, render-node builder taking a slice of them and the scenario's citations).
+PAGED_LISTS = {
+    "snippet-feed": (snippet_feed_items, lambda items, citations: render.snippet_cards(items)),
+    "host-script": (
+        lambda scenario, prospect: scenario.call_studio.get("host_script", []),
+        render.host_script,
+    ),
+    "cue-sheet": (
+        lambda scenario, prospect: scenario.call_studio.get("cue_sheet", []),
+        lambda items, citations: render.cue_sheet(items),
+    ),
+    "roster-grid": (
+        lambda scenario, prospect: roster_cards(scenario),
+        lambda items, citations: render.summary_cards(items),
+    ),
+}
+# Prospect panels rendered by refresh_view; the browser owns them in clientside mode.
+SERVER_PROSPECT_PANELS = {} if CLIENTSIDE_PROSPECTS else PROSPECT_PANELS
+
+FRAGMENTS = FragmentCache(maxsize=2048)
+
+
+def scenario_citations(request_id, scenario, version):
+    """Tokenise a scenario's citations once per scenario and snippet version."""
+    key = (request_id, version)
+    citations = CITATIONS.get(key)
+    if citations is None:
+        citations = ScenarioCitations(scenario, LIBRARY_CITATIONS)
+        if citations.dangling:
+            log.warning("Scenario %s cites unknown snippets: %s", request_id, ", ".join(citations.dangling))
+        CITATIONS.put(key, citations)
+    return citations
+
+
+def render_panel(stats, panel, key, version, build):
+    """FRAGMENTS.render, plus build time and payload size in ``stats`` when metrics are on."""
+    if stats is None:
+        return FRAGMENTS.render(panel, key, version, build)
+    timing = {}
+
+    def timed_build():
+        started = time.perf_counter()
+        component = build()
+        timing["seconds"] = time.perf_counter() - started
+        return component
+
+    component = FRAGMENTS.render(panel, key, version, timed_build)
+    size = len(to_json_plotly(component).encode("utf-8"))
+    METRICS.observe("dealcast_panel_payload_bytes", size, panel=panel)
+    if "seconds" in timing:
+        METRICS.observe("dealcast_panel_render_seconds", timing["seconds"], panel=panel)
+    else:
+        METRICS.inc("dealcast_panel_cache_hits_total", panel=panel)
+    stats[panel] = {"ms": round(timing.get("seconds", 0.0) * 1000, 3), "bytes": size, "cached": "seconds" not in timing}
+    return component
 
 
 @app.callback(
-    Output("company-meta", "children"),
-    Output("personas", "children"),
-    Output("tech-stack", "children"),
-    Output("challenges", "children"),
-    Output("triggers", "children"),
-    Output("competition", "children"),
-    Output("snippet-feed", "children"),
-    Output("intel-brief", "children"),
-    Output("playbook", "children"),
-    Output("call-studio", "children"),
+    *[Output(panel, "children") for panel in (*SERVER_PROSPECT_PANELS, *SCENARIO_PANELS, *PAIRED_PANELS)],
     Input("prospect-select", "value"),
     Input("scenario-select", "value"),
+    Input("data-version", "data"),
 )
-def refresh_view(prospect_name, scenario_label):
-    prospect = PROSPECT_MAP.get(prospect_name) or next(iter(PROSPECT_MAP.values()))
-    scenario = SCENARIOS.get(scenario_label) or next(iter(SCENARIOS.values()))
-
-    knowledge_snippets = scenario.get("knowledge_snippets") or SNIPPETS_DATA.get("documents", [])
-
-    company_meta = html.Div([
-        html.Div("Company Capsule", className="section-title"),
-        build_stat_grid(prospect),
-    ])
-
-    personas = html.Div([
-        html.Div("Personas", className="section-title"),
-        build_persona_cards(prospect["personas"]),
-    ])
-
-    tech_stack = html.Div([
-        html.Div("Tech Stack", className="section-title"),
-        build_tech_stack_cards(prospect["techStack"]),
-    ])
-
-    challenges = html.Div([
-        html.Div("Challenges", className="section-title"),
-        html.Ul([html.Li(item) for item in prospect["challenges"]], className="bullets"),
-    ])
-
-    triggers = html.Div([
-        html.Div("Buying Triggers", className="section-title"),
-        html.Ul([html.Li(item) for item in prospect["buyingTriggers"]], className="bullets"),
-    ])
-
-    competition = html.Div([
-        html.Div("Competitive Notes", className="section-title"),
-        html.Ul([html.Li(item) for item in prospect["competitiveNotes"]], className="bullets"),
-    ])
-
-    snippet_feed = html.Div([
-        html.Div("Knowledge Snippets", className="section-title"),
-        build_snippet_cards(knowledge_snippets),
-    ])
-
-    intel_section = scenario.get("intel_scout_brief", {})
-    intel = html.Div(
-        [
-            html.Div("Intel Scout", className="section-title"),
-            html.Div(intel_section.get("headline"), className="intel-headline"),
-            html.P(intel_section.get("why_now"), className="intel-why"),
-            html.Div("Signal Stack", className="subheading"),
-            build_signal_stack(intel_section.get("signal_stack", [])),
-            html.Div("Risks", className="subheading"),
-            html.Ul([html.Li(risk) for risk in intel_section.get("risk_flags", [])], className="bullets"),
-            html.Div("Gaps", className="subheading"),
-            html.Ul([html.Li(gap) for gap in intel_section.get("gaps", [])], className="bullets"),
+def refresh_view(prospect_name, scenario_label, data_version):
+    started = time.perf_counter()
+    stats = {} if METRICS is not None else None
+    triggered = ctx.triggered_id
+
+    if scenario_label not in SCENARIOS:
+        scenario_label = SCENARIOS.default
+
+    if triggered == "data-version":
+        changed = set(data_version["changed"])
+        refresh_prospect = "prospects" in changed
+        refresh_snippets = "snippets" in changed
+        # Citation chips resolve against the snippet library too.
+        refresh_scenario = scenario_source(scenario_label) in changed or refresh_snippets
+    else:
+        refresh_prospect = triggered != "scenario-select"
+        refresh_scenario = triggered != "prospect-select"
+        refresh_snippets = False
+
+    if prospect_name not in PROSPECTS:
+        prospect_name = PROSPECTS.default
+
+    if refresh_prospect and SERVER_PROSPECT_PANELS:
+        prospect = PROSPECTS.get(prospect_name)
+        prospect_fragments = [
+            render_panel(stats, panel, prospect_name, DATA_VERSIONS["prospects"], lambda render=render: render(prospect))
+            for panel, render in SERVER_PROSPECT_PANELS.items()
+        ]
+    else:
+        prospect_fragments = [no_update] * len(SERVER_PROSPECT_PANELS)
+
+    if refresh_scenario:
+        scenario = SCENARIOS.get(scenario_label)
+        version = (DATA_VERSIONS[scenario_source(scenario_label)], DATA_VERSIONS["snippets"])
+        citations = scenario_citations(scenario_label, scenario, version)
+        scenario_fragments = [
+            render_panel(stats, panel, scenario_label, version, lambda render=render: render(scenario, citations))
+            for panel, render in SCENARIO_PANELS.items()
         ]
+    else:
+        scenario_fragments = [no_update] * len(SCENARIO_PANELS)
+
+    if refresh_prospect or refresh_scenario or refresh_snippets:
+        scenario = SCENARIOS.get(scenario_label)
+        prospect = PROSPECTS.get(prospect_name)
+        version = (
+            DATA_VERSIONS[scenario_source(scenario_label)],
+            DATA_VERSIONS["prospects"],
+            DATA_VERSIONS["snippets"],
+        )
+        paired_fragments = [
+            render_panel(
+                stats, panel, (scenario_label, prospect_name), version, lambda render=render: render(scenario, prospect)
+            )
+            for panel, render in PAIRED_PANELS.items()
+        ]
+    else:
+        paired_fragments = [no_update] * len(PAIRED_PANELS)
+
+    if stats is not None:
+        METRICS.log_callback(
+            "refresh_view",
+            time.perf_counter() - started,
+            stats,
+            trigger=triggered,
+            prospect=prospect_name,
+            scenario=scenario_label,
+        )
+    return (*prospect_fragments, *scenario_fragments, *paired_fragments)
+
+
+@app.callback(
+    Output({"role": "page-body", "list": MATCH}, "children"),
+    Output({"role": "page-state", "list": MATCH}, "data"),
+    Output({"role": "page-status", "list": MATCH}, "children"),
+    Output({"role": "page-prev", "list": MATCH}, "disabled"),
+    Output({"role": "page-next", "list": MATCH}, "disabled"),
+    Input({"role": "page-prev", "list": MATCH}, "n_clicks"),
+    Input({"role": "page-next", "list": MATCH}, "n_clicks"),
+    State({"role": "page-state", "list": MATCH}, "data"),
+    State("prospect-select", "value"),
+    State("scenario-select", "value"),
+    prevent_initial_call=True,
+)
+def turn_page(_prev_clicks, _next_clicks, page, prospect_name, scenario_label):
+    started = time.perf_counter()
+    stats = {} if METRICS is not None else None
+    triggered = ctx.triggered_id
+    list_id = triggered["list"]
+    if list_id not in PAGED_LISTS:
+        raise PreventUpdate
+
+    if scenario_label not in SCENARIOS:
+        scenario_label = SCENARIOS.default
+    if prospect_name not in PROSPECTS:
+        prospect_name = PROSPECTS.default
+    scenario = SCENARIOS.get(scenario_label)
+    prospect = PROSPECTS.get(prospect_name)
+    items_for, build = PAGED_LISTS[list_id]
+    # Building the list can be a full ranking pass (roster-grid), so it only
+    # runs when the list's length or the requested page is not cached yet.
+    built = {}
+
+    def items():
+        if "items" not in built:
+            built["items"] = items_for(scenario, prospect)
+        return built["items"]
+
+    citations_version = (DATA_VERSIONS[scenario_source(scenario_label)], DATA_VERSIONS["snippets"])
+    version = (*citations_version, DATA_VERSIONS["prospects"], DATA_VERSIONS["cards"])
+    total = FRAGMENTS.render(f"{list_id}-length", (scenario_label, prospect_name), version, lambda: len(items()))
+
+    step = 1 if triggered["role"] == "page-next" else -1
+    # The list may have shrunk under a reload since the page was rendered.
+    page, start, stop = page_bounds(total, (page or 0) + step)
+    citations = scenario_citations(scenario_label, scenario, citations_version)
+    body = render_panel(
+        stats,
+        f"{list_id}-page",
+        (scenario_label, prospect_name, page),
+        version,
+        lambda: to_dash(build(items()[start:stop], citations)),
     )
 
-    playbook_section = scenario.get("playbook", {})
-    playbook = html.Div(
-        [
-            html.Div("Playbook Crafter", className="section-title"),
-            html.P(playbook_section.get("opening_angle"), className="intel-why"),
-            html.Div("Talk Tracks", className="subheading"),
-            build_talk_tracks(playbook_section.get("talk_tracks", [])),
-            html.Div("CTA Blocks", className="subheading"),
-            build_cta_blocks(playbook_section.get("cta_blocks", [])),
-            html.Div("Producer Notes", className="subheading"),
-            html.P(playbook_section.get("producer_notes")),
-        ]
+    if stats is not None:
+        METRICS.log_callback(
+            "turn_page",
+            time.perf_counter() - started,
+            stats,
+            list=list_id,
+            page=page,
+            prospect=prospect_name,
+            scenario=scenario_label,
+        )
+    return body, page, page_status(total, page), page == 0, stop >= total
+
+
+@app.callback(
+    Output("roster-grid", "children"),
+    Input("scenario-select", "value"),
+    Input("data-version", "data"),
+)
+def refresh_roster_grid(scenario_label, data_version):
+    started = time.perf_counter()
+    stats = {} if METRICS is not None else None
+    if scenario_label not in SCENARIOS:
+        scenario_label = SCENARIOS.default
+    sources = {"cards", "prospects", scenario_source(scenario_label)}
+    if ctx.triggered_id == "data-version" and not sources & set(data_version["changed"]):
+        raise PreventUpdate
+
+    scenario = SCENARIOS.get(scenario_label)
+    # Ordering depends on the roster's ranking columns, contents on the card file.
+    version = (DATA_VERSIONS["cards"], DATA_VERSIONS["prospects"], DATA_VERSIONS[scenario_source(scenario_label)])
+    grid = render_panel(stats, "roster-grid", scenario_label, version, lambda: render_roster_grid(scenario))
+
+    if stats is not None:
+        METRICS.log_callback("refresh_roster_grid", time.perf_counter() - started, stats, scenario=scenario_label)
+    return grid
+
+
+# The callback_map key Dash routes refresh_view requests by.
+REFRESH_OUTPUT = next(output for output in app.callback_map if "intel-brief.children" in output)
+
+
+# The app and every dealcast module feed the cached markup (render code,
+# pager ids, citation chips), so a deploy that changes any of them starts
+# from fresh keys.
+CODE_VERSION = source_version([Path(__file__), *(BASE_DIR / "dealcast").glob("*.py")])
+
+
+def refresh_cache_key(body):
+    """Key a refresh_view request by its inputs and the files behind them.
+
+    The loaded data's file versions go into the key, as they do into
+    DATA_VERSIONS, so every worker process agrees on it. The code version,
+    page size and prospect render mode change the markup for the same
+    inputs, so they go in as well.
+    """
+    if body.get("output") != REFRESH_OUTPUT:
+        return None
+    values = {f"{item['id']}.{item['property']}": item.get("value") for item in body.get("inputs", [])}
+    triggered = sorted(body.get("changedPropIds") or [])
+    scenario_id = values.get("scenario-select.value")
+    entry = SCENARIOS.entry(scenario_id) or SCENARIOS.entry(SCENARIOS.default)
+    changed = (values.get("data-version.data") or {}).get("changed") if "data-version.data" in triggered else None
+    return cache_key(
+        CODE_VERSION,
+        PAGE_SIZE,
+        CLIENTSIDE_PROSPECTS,
+        triggered,
+        values.get("prospect-select.value"),
+        scenario_id,
+        changed,
+        PROSPECTS.version,
+        SNIPPETS.version,
+        entry.version,
     )
 
-    call_section = scenario.get("call_studio", {})
-    call = html.Div(
-        [
-            html.Div("Call Studio", className="section-title"),
-            html.Div("Host Script", className="subheading"),
-            build_host_script(call_section.get("host_script", [])),
-            html.Div("Cue Sheet", className="subheading"),
-            build_cue_sheet(call_section.get("cue_sheet", [])),
-            html.Div("Safety Checks", className="subheading"),
-            html.Ul([html.Li(item) for item in call_section.get("safety_checks", [])], className="bullets"),
-            html.Div("Fallback", className="subheading"),
-            html.P(call_section.get("fallback_line")),
-        ]
+
+RESPONSES = None
+if RESPONSE_CACHE_MB > 0:
+    RESPONSES = ResponseCache(CACHE_DIR / "responses.sqlite", max_bytes=RESPONSE_CACHE_MB << 20)
+    install_response_cache(app.server, RESPONSES, refresh_cache_key)
+
+
+def export_response_cache(metrics):
+    metrics.set("dealcast_response_cache_hits_total", RESPONSES.hits)
+    metrics.set("dealcast_response_cache_misses_total", RESPONSES.misses)
+
+
+if METRICS is not None:
+    if RESPONSES is not None:
+        METRICS.collect(export_response_cache)
+
+    @app.server.route("/metrics")
+    def metrics_endpoint():
+        return flask.Response(METRICS.render(), mimetype="text/plain; version=0.0.4")
+
+
+if CLIENTSIDE_PROSPECTS:
+    app.clientside_callback(
+        ClientsideFunction(namespace="dealcast", function_name="renderProspect"),
+        *[Output(panel, "children") for panel in PROSPECT_PANELS],
+        Input("prospect-select", "value"),
+        Input("prospect-data", "data"),
     )
 
+
+@app.callback(
+    Output("prospect-select", "options"),
+    *([Output("prospect-data", "data")] if CLIENTSIDE_PROSPECTS else []),
+    Input("prospect-select", "search_value"),
+    Input("scenario-select", "value"),
+    Input("data-version", "data"),
+    State("prospect-select", "value"),
+    prevent_initial_call=True,
+)
+def search_prospects(search_value, scenario_id, data_version, current):
+    triggered = ctx.triggered_id
+    if triggered == "prospect-select":
+        if not search_value:
+            raise PreventUpdate
+        matches = ranked_prospects(scenario_id, PROSPECTS.search(search_value, limit=PROSPECT_OPTION_LIMIT))
+    elif triggered == "data-version" and not set(data_version["changed"]) & {"prospects", scenario_source(scenario_id)}:
+        raise PreventUpdate
+    else:
+        matches = ranked_prospects(scenario_id)
+    if current and current not in matches:
+        # Keep the active selection in the list so its label stays rendered.
+        matches.append(current)
+    if not CLIENTSIDE_PROSPECTS:
+        return prospect_options(matches)
+    if triggered == "data-version":
+        # The roster was reparsed: replace what the browser holds.
+        return prospect_options(matches), prospect_panel_data(matches)
+    records = Patch()
+    records["prospects"].update(prospect_records(matches))
+    return prospect_options(matches), records
+
+
+@app.callback(
+    Output("data-version", "data"),
+    Input("data-poll", "n_intervals"),
+    State("data-version", "data"),
+)
+def poll_data_version(_, seen):
+    versions = DATA_VERSIONS.snapshot()
+    if seen and seen["versions"] == versions:
+        raise PreventUpdate
+    previous = seen["versions"] if seen else {}
+    # Sources present on only one side (a scenario added or removed) count as changed too.
+    changed = sorted(source for source in versions.keys() | previous.keys() if versions.get(source) != previous.get(source))
+    return {"versions": versions, "changed": changed}
+
+
+@app.callback(
+    Output("scenario-select", "options"),
+    Output("segment-filter", "options"),
+    Output("host-filter", "options"),
+    Input("segment-filter", "value"),
+    Input("host-filter", "value"),
+    Input("data-version", "data"),
+    State("scenario-select", "value"),
+)
+def filter_scenarios(segment, host, _, current):
     return (
-        company_meta,
-        personas,
-        tech_stack,
-        challenges,
-        triggers,
-        competition,
-        snippet_feed,
-        intel,
-        playbook,
-        call,
+        scenario_options(segment=segment, host=host, current=current),
+        filter_options(SCENARIOS.segments()),
+        filter_options(SCENARIOS.hosts()),
     )
 
 
+def reload_prospects(path):
+    global PROSPECTS
+    with timed_load("prospects"):
+        PROSPECTS = open_prospect_store(path)
+    with timed_load("ranking"):
+        RANKER.reload()
+    DATA_VERSIONS.set("prospects", PROSPECTS.version)
+    log.info("Reloaded %s (%d prospects)", path.name, len(PROSPECTS))
+
+
+def reload_snippets(path):
+    global LIBRARY_CITATIONS
+    with timed_load("snippets"):
+        SNIPPETS.reload()
+    LIBRARY_CITATIONS = CitationIndex(SNIPPETS.documents)
+    DATA_VERSIONS.set("snippets", SNIPPETS.version)
+    log.info("Reloaded %s (%d snippets)", path.name, len(SNIPPETS))
+
+
+def reload_cards(path):
+    with timed_load("cards"):
+        CARDS.reload()
+    DATA_VERSIONS.set("cards", CARDS.version)
+    log.info("Reloaded %s (%d cards)", path.name, len(CARDS))
+
+
+def reload_scenario(path):
+    with timed_load("scenarios"):
+        request_ids = SCENARIOS.refresh(path)
+    for request_id in request_ids:
+        entry = SCENARIOS.entry(request_id)
+        DATA_VERSIONS.set(scenario_source(request_id), entry.version if entry else None)
+    if request_ids:
+        log.info("Reloaded %s (%s)", path.name, ", ".join(sorted(request_ids)))
+
+
+def start_data_watcher(interval=1.0):
+    # One watcher per directory; exact file names are registered before the scenario glob.
+    watchers = {}
+
+    def watch(directory, pattern, handler):
+        key = directory.resolve()
+        if key not in watchers:
+            watchers[key] = DataWatcher(directory, interval=interval)
+        watchers[key].on(pattern, handler)
+
+    watch(DATA_DIR, PROSPECTS.path.name, reload_prospects)
+    watch(DATA_DIR, SNIPPETS_PATH.name, reload_snippets)
+    watch(CARDS_PATH.parent, CARDS_PATH.name, reload_cards)
+    watch(SCENARIO_DIR, "*.json", reload_scenario)
+    return [watcher.start() for watcher in watchers.values()]
+
+
 if __name__ == "__main__":
-    app.run_server(debug=True)
+    logging.basicConfig(level=logging.INFO)
+    start_data_watcher()
+    app.run(debug=True)
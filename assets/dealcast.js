@@ -0,0 +1,40 @@
+// Clientside renderers for the DealCast control surface.
+//
+// Used when the app runs with DEALCAST_CLIENTSIDE_PROSPECTS=1: the prospect
+// panels arrive in the prospect-data store already built, as the render
+// core's JSON (dealcast/render.py, to_json), and are expanded here into
+// Dash components instead of going through a refresh_view round-trip.
+(function () {
+  // [tag, className, children, attrs] -> a Dash html component.
+  function toDash(node) {
+    if (typeof node === 'string') {
+      return node;
+    }
+    const [tag, className, children, attrs] = node;
+    const props = Object.assign({}, attrs);
+    const expanded = children.map(toDash);
+    props.children = expanded.length === 1 && typeof expanded[0] === 'string' ? expanded[0] : expanded;
+    if (className) {
+      props.className = className;
+    }
+    const type = tag.charAt(0).toUpperCase() + tag.slice(1);
+    return { type: type, namespace: 'dash_html_components', props: props };
+  }
+
+  window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    dealcast: {
+      // The store lists the panel ids in the callback's output order
+      // (PROSPECT_PANELS), so adding or removing a panel needs no change here.
+      renderProspect: function (name, data) {
+        if (!data) {
+          throw window.dash_clientside.PreventUpdate;
+        }
+        const prospect = data.prospects[name];
+        if (!prospect) {
+          return data.panels.map(() => window.dash_clientside.no_update);
+        }
+        return data.panels.map(id => toDash(prospect[id]));
+      },
+    },
+  });
+})();
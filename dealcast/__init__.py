@@ -0,0 +1 @@
+"""Shared building blocks for the DealCast control surface and static builders."""
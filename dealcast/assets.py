@@ -0,0 +1,200 @@
+"""Fingerprinted, precompressed assets for the static bundles.
+
+``AssetStage`` writes each asset once under a content-hashed name
+(``dealcast.3f9c0a1b2d.css``), so hosts can serve it with a far-future
+cache lifetime. A rebuild that leaves the content alone leaves the file and
+its URL alone as well. Every text file the stage publishes or is pointed at
+gets ``.gz`` and, when the ``brotli`` package is installed, ``.br`` siblings
+for hosts that serve precompressed files.
+
+``vendor_fonts`` downloads the Google Fonts stylesheet the pages use and
+keeps only the ``@font-face`` blocks of the requested unicode-range subsets,
+with their woff2 files published through the stage. Downloads are cached
+under ``CACHE_DIR/fonts``, so later builds work offline.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+from pathlib import Path
+import re
+from typing import Callable, Iterable
+from urllib.request import Request, urlopen
+import zlib
+
+from dealcast.config import CACHE_DIR
+
+try:
+    import brotli
+except ImportError:  # requirements-prod.txt; without it only .gz siblings are written
+    brotli = None
+
+# What decompressing a truncated or foreign sibling raises.
+_DECOMPRESS_ERRORS = (OSError, EOFError, zlib.error) + ((brotli.error,) if brotli is not None else ())
+
+log = logging.getLogger(__name__)
+
+FONT_CACHE_DIR = CACHE_DIR / "fonts"
+# Google Fonts picks the font format from the user agent; this one gets woff2.
+FONT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+HASH_LENGTH = 10
+# Precompressed siblings are only worth it above this size.
+COMPRESS_MIN_SIZE = 256
+COMPRESSIBLE = {".css", ".js", ".json", ".html", ".svg", ".xml"}
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE = re.compile(r"\s*([{};,>])\s*")
+_FONT_FACE = re.compile(r"/\*\s*([\w-]+)\s*\*/\s*(@font-face\s*\{[^}]*\})")
+_FONT_URL = re.compile(r"url\((https://[^)]+)\)")
+
+
+def minify_css(css: str) -> str:
+    """Drop comments and the whitespace around punctuation; values are left as written."""
+    css = _CSS_COMMENT.sub("", css)
+    css = _CSS_SPACE.sub(r"\1", " ".join(css.split()))
+    return css.replace(";}", "}").strip()
+
+
+def minify_js(js: str) -> str:
+    """Drop indentation, blank lines and whole-line ``//`` comments.
+
+    Line breaks are kept, so automatic semicolon insertion still applies.
+    Lines are trimmed, so scripts must not hold multi-line string literals;
+    the bundles' scripts don't.
+    """
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    if path.exists() and path.stat().st_size == len(data) and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+def precompress(path: Path) -> list[Path]:
+    """Write ``.gz`` (and ``.br``) siblings of ``path``; return every sibling it now has."""
+    data = path.read_bytes()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return []
+    # mtime=0 keeps the .gz bytes, and so rebuilds, deterministic.
+    siblings = [(path.with_name(path.name + ".gz"), lambda: gzip.compress(data, 9, mtime=0), gzip.decompress)]
+    if brotli is not None:
+        siblings.append(
+            (path.with_name(path.name + ".br"), lambda: brotli.compress(data, quality=11), brotli.decompress)
+        )
+    written = []
+    for sibling, compress, decompress in siblings:
+        # Compressing at the highest level is the slow part and decompressing
+        # is cheap, so a sibling that already holds these bytes is left alone.
+        # Timestamps can't decide that: checkouts and cache restores reset them.
+        if not _holds(sibling, data, decompress):
+            _write_if_changed(sibling, compress())
+        written.append(sibling)
+    return written
+
+
+def _holds(sibling: Path, data: bytes, decompress: Callable[[bytes], bytes]) -> bool:
+    """Whether the compressed file ``sibling`` decompresses to ``data``."""
+    try:
+        return decompress(sibling.read_bytes()) == data
+    except _DECOMPRESS_ERRORS:
+        return False
+
+
+def remove_precompressed(paths: Iterable[Path]) -> int:
+    """Delete the ``.gz``/``.br`` siblings of ``paths``, e.g. after a build without the stage."""
+    removed = 0
+    for path in paths:
+        for suffix in (".gz", ".br"):
+            sibling = path.with_name(path.name + suffix)
+            if sibling.exists():
+                sibling.unlink()
+                removed += 1
+    return removed
+
+
+class AssetStage:
+    """Publishes content-hashed files under ``out_dir``/``prefix`` and tracks what it wrote."""
+
+    def __init__(self, out_dir: Path, prefix: str = "assets"):
+        self.out_dir = Path(out_dir)
+        self.prefix = prefix
+        self._published: set[Path] = set()
+        if brotli is None:
+            log.warning("brotli is not installed; writing .gz siblings only")
+
+    @property
+    def asset_dir(self) -> Path:
+        return self.out_dir / self.prefix
+
+    def publish(self, stem: str, suffix: str, data: bytes | str) -> str:
+        """Write ``data`` as ``<stem>.<hash><suffix>`` and return its URL relative to ``out_dir``."""
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        path = self.asset_dir / f"{stem}.{content_hash(data)}{suffix}"
+        _write_if_changed(path, data)
+        self._published.add(path)
+        if suffix in COMPRESSIBLE:
+            self._published.update(precompress(path))
+        return f"{self.prefix}/{path.name}"
+
+    def precompress(self, paths: Iterable[Path]) -> int:
+        """Add compressed siblings to files written outside the stage (pages, data shards)."""
+        count = 0
+        for path in paths:
+            if path.suffix in COMPRESSIBLE and path.is_file():
+                count += bool(precompress(path))
+        return count
+
+    def prune(self) -> int:
+        """Delete files in the asset directory that this build did not publish."""
+        removed = 0
+        if self.asset_dir.is_dir():
+            for path in self.asset_dir.iterdir():
+                if path.is_file() and path not in self._published:
+                    path.unlink()
+                    removed += 1
+        return removed
+
+
+def _fetch(url: str) -> bytes:
+    """``url``'s body, from the font cache when it was downloaded before."""
+    cached = FONT_CACHE_DIR / hashlib.sha256(url.encode("utf-8")).hexdigest()
+    if cached.exists():
+        return cached.read_bytes()
+    with urlopen(Request(url, headers={"User-Agent": FONT_USER_AGENT}), timeout=30) as response:
+        data = response.read()
+    _write_if_changed(cached, data)
+    return data
+
+
+def vendor_fonts(stylesheet_url: str, stage: AssetStage, subsets: Iterable[str] = ("latin",)) -> str:
+    """``@font-face`` rules for the ``subsets`` of a Google Fonts stylesheet, pointing at local copies.
+
+    Google splits each family by script and labels each block with a
+    ``/* latin */``-style comment. Only the labelled blocks are kept, so the
+    page downloads the glyph ranges it needs and nothing else.
+    """
+
+    def localise(match: re.Match) -> str:
+        url = match.group(1)
+        # fonts.gstatic.com/s/<family>/<version>/<opaque id>.woff2
+        name = url.split("/s/", 1)[-1].split("/", 1)[0]
+        # The rules end up in the stylesheet, which sits next to the font files.
+        return f"url({stage.publish('font-' + name, '.woff2', _fetch(url)).rsplit('/', 1)[-1]})"
+
+    wanted = set(subsets)
+    css = _fetch(stylesheet_url).decode("utf-8")
+    rules = [_FONT_URL.sub(localise, rule) for subset, rule in _FONT_FACE.findall(css) if subset in wanted]
+    if not rules:
+        raise ValueError(f"no @font-face rules for subsets {sorted(wanted)} in {stylesheet_url}")
+    return "\n".join(rules)
@@ -0,0 +1,312 @@
+"""Prospect summary cards derived from the roster and the scenarios that fit it.
+
+Each card (``company``, ``company_capsule``, ``opportunity_angle``) is
+built from one prospect record. When a scenario targets that prospect, i.e.
+names the company in its brief, playbook or script, the scenario supplies
+the angle's headline and recommended play. Otherwise both come from the
+prospect's own challenges and buying triggers.
+
+``build_cards`` is incremental. Every card is keyed by a content hash of
+its prospect record plus the scenario fields it uses. The keys are kept in
+``CACHE_DIR/cards.state.json``, and a rebuild re-derives only the cards
+whose key moved. The others are copied from the previous card file. A
+card written by hand opts out with ``"curated": true`` and is then kept as
+it is; every other card is the builder's to replace.
+
+The app reads the card file through :class:`CardDeck`, so the roster
+overview never opens ``prospects.json``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, NamedTuple
+
+from dealcast.citations import strip_citations
+from dealcast.config import CACHE_DIR, CARDS_PATH, file_version
+from dealcast.datapack import iter_collection
+from dealcast.records import Prospect, Scenario
+from dealcast.schema import iter_valid_prospects
+from dealcast.streaming import iter_records
+
+log = logging.getLogger(__name__)
+
+STATE_FORMAT = 3
+# Trailing words a scenario may leave off when it names a company.
+COMPANY_SUFFIXES = {"co", "corp", "corporation", "group", "inc", "labs", "llc", "ltd", "plc"}
+STATE_PATH = CACHE_DIR / "cards.state.json"
+
+
+def record_key(*parts: Any) -> str:
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()
+
+
+def _plain(text: str | None) -> str | None:
+    return strip_citations(text) if text else None
+
+
+def _first_sentence(text: str | None) -> str | None:
+    if not text:
+        return None
+    sentence, _, _ = text.partition(". ")
+    return sentence.rstrip(".")
+
+
+def _strings(value: Any) -> Iterable[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _strings(item)
+
+
+def scenario_text(scenario: Scenario) -> str:
+    """Every string of the scenario's brief, playbook and call studio, casefolded."""
+    return " ".join(_strings(list(scenario.sections))).casefold()
+
+
+def company_pattern(company: str) -> re.Pattern:
+    """``company`` as a whole phrase, with or without a corporate suffix ("NovaThera Labs", "NovaThera")."""
+    words = company.casefold().replace(".", "").replace(",", "").split()
+    while len(words) > 1 and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    names = {company.casefold(), " ".join(words)}
+    alternatives = "|".join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+    return re.compile(rf"(?<!\w)(?:{alternatives})(?!\w)")
+
+
+def match_scenario(company: str, shows: list[tuple[str, str]]) -> str | None:
+    """The first show whose text names ``company``, else None.
+
+    Shared vocabulary is not enough: a brief written for one company reads
+    as a good match for every prospect in the same market.
+    """
+    pattern = company_pattern(company)
+    for request_id, text in shows:
+        if pattern.search(text):
+            return request_id
+    return None
+
+
+def scenario_card_key(scenario: Scenario) -> str:
+    """Hash of the scenario fields a card takes."""
+    return record_key(
+        scenario.request_id,
+        scenario.intel_scout_brief.get("headline"),
+        scenario.playbook.get("opening_angle"),
+    )
+
+
+def derive_card(prospect: Prospect, scenario: Scenario | None = None) -> dict:
+    """The summary card of ``prospect``, angled by ``scenario`` when one fits."""
+    intel = scenario.intel_scout_brief if scenario else {}
+    playbook = scenario.playbook if scenario else {}
+    challenge = prospect.challenges[0] if prospect.challenges else None
+    trigger = prospect.triggers[0] if prospect.triggers else None
+    tagline = " — ".join(part for part in (prospect.industry, trigger) if part)
+    own_play = " ".join(
+        part for part in (f"Open on: {trigger}." if trigger else None, f"Tie it to: {challenge}." if challenge else None) if part
+    )
+    return {
+        "company": prospect.name,
+        "company_capsule": {
+            "tagline": tagline or None,
+            "industry": prospect.industry,
+            "headquarters": prospect.headquarters,
+            "scale": {"annual_revenue": prospect.revenue, "growth_stage": prospect.stage},
+            "tech_stack_highlights": [f"{lane.title()}: {value}" for lane, value in prospect.tech_stack],
+            "primary_personas": [
+                {"name": persona.name, "title": persona.title, "focus": _first_sentence(persona.bio)}
+                for persona in prospect.personas
+            ],
+        },
+        "opportunity_angle": {
+            "headline": _plain(intel.get("headline")) or challenge,
+            "scenario": scenario.request_id if scenario else None,
+            "pain_signals": list(prospect.challenges),
+            "buying_triggers": list(prospect.triggers),
+            "recommended_play": _plain(playbook.get("opening_angle")) or own_play or None,
+            "competitive_considerations": "; ".join(prospect.competitive_notes) or None,
+        },
+    }
+
+
+def _read_state(path: Path) -> dict:
+    try:
+        state = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return state if state.get("format") == STATE_FORMAT else {}
+
+
+def _read_cards(path: Path) -> dict[str, dict]:
+    try:
+        return {card["company"]: card for card in iter_records(path, "cards")}
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+
+def _write_atomic(path: Path, content: str) -> bool:
+    """Write ``content`` unless ``path`` already holds it, replacing the file in one step."""
+    data = content.encode("utf-8")
+    if path.exists() and path.stat().st_size == len(data) and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return True
+
+
+def is_curated(card: dict | None) -> bool:
+    """Whether ``card`` opted out of derivation with ``"curated": true``."""
+    return card is not None and card.get("curated") is True
+
+
+class CardBuild(NamedTuple):
+    cards: int
+    derived: int
+    reused: int
+    curated: int
+    written: bool
+
+
+def build_cards(
+    prospects_path: Path,
+    scenarios: Iterable[Scenario],
+    out_path: Path = CARDS_PATH,
+    state_path: Path = STATE_PATH,
+    force: bool = False,
+) -> CardBuild:
+    """Write one card per roster prospect to ``out_path``, re-deriving only what changed.
+
+    ``scenarios`` are matched in the order given, so pass them newest first
+    for a company named by several shows to get the latest. ``force`` drops
+    the saved keys and derives every card again, except the curated ones.
+    """
+    scenarios = {scenario.request_id: scenario for scenario in scenarios}
+    shows = [(request_id, scenario_text(scenario)) for request_id, scenario in scenarios.items()]
+    show_keys = {request_id: scenario_card_key(scenario) for request_id, scenario in scenarios.items()}
+    # Matches only move when a show's text does; otherwise each prospect keeps its last match.
+    shows_key = record_key(shows)
+
+    state = _read_state(state_path)
+    known = state.get("cards", {})
+    previous = {} if force or state.get("shows") != shows_key else known
+    old_cards = _read_cards(out_path)
+
+    cards: list[dict] = []
+    entries: dict[str, list] = {}
+    derived = curated = 0
+    for record in iter_collection(prospects_path, "prospects", iter_valid_prospects):
+        name = record["companyName"]
+        old = old_cards.get(name)
+        if is_curated(old):
+            cards.append(old)
+            curated += 1
+            continue
+        prospect_key = record_key(record)
+        # Entries are [prospect key, scenario, card key].
+        entry = previous.get(name)
+        if entry is not None and entry[0] == prospect_key:
+            request_id = entry[1]
+        else:
+            request_id = match_scenario(name, shows)
+        card_key = record_key(prospect_key, show_keys.get(request_id))
+        card = old if entry is not None and entry[2] == card_key else None
+        if card is None:
+            card = derive_card(Prospect.from_dict(record), scenarios.get(request_id))
+            derived += 1
+        cards.append(card)
+        entries[name] = [prospect_key, request_id, card_key]
+
+    if not derived and list(old_cards) == [card["company"] for card in cards]:
+        # Nothing new to say: leave the file, and its hand-written layout, alone.
+        written = False
+    else:
+        # One card per line: diffs stay readable and the C encoder does the work.
+        lines = ",\n".join(json.dumps(card, ensure_ascii=False) for card in cards)
+        written = _write_atomic(out_path, f'{{"cards": [\n{lines}\n]}}\n')
+    _write_atomic(
+        state_path,
+        json.dumps({"format": STATE_FORMAT, "shows": shows_key, "cards": entries}, ensure_ascii=False),
+    )
+    return CardBuild(len(cards), derived, len(cards) - derived - curated, curated, written)
+
+
+@dataclass(frozen=True, slots=True)
+class CardSummary:
+    """The few card fields the roster overview shows."""
+
+    company: str
+    industry: str | None
+    stage: str | None
+    revenue: str | None
+    headline: str | None
+    signal: str | None
+    scenario: str | None
+
+    @classmethod
+    def from_card(cls, card: dict) -> "CardSummary":
+        capsule = card.get("company_capsule") or {}
+        scale = capsule.get("scale") or {}
+        angle = card.get("opportunity_angle") or {}
+        signals = angle.get("pain_signals") or []
+        return cls(
+            company=card["company"],
+            industry=capsule.get("industry"),
+            stage=scale.get("growth_stage"),
+            revenue=scale.get("annual_revenue"),
+            headline=angle.get("headline"),
+            signal=signals[0] if signals else None,
+            scenario=angle.get("scenario"),
+        )
+
+
+class CardDeck:
+    """The card file, as company name -> CardSummary, reloaded in place."""
+
+    def __init__(self, path: Path = CARDS_PATH):
+        self.path = Path(path)
+        self._state: tuple[dict[str, CardSummary], tuple[int, int] | None] = ({}, None)
+        try:
+            self.reload()
+        except (OSError, ValueError, KeyError) as error:
+            log.warning("No summary cards loaded from %s (%s); run scripts/build_cards.py", self.path, error)
+
+    def reload(self) -> None:
+        version = file_version(self.path)
+        cards = {}
+        for card in iter_records(self.path, "cards"):
+            summary = CardSummary.from_card(card)
+            cards[summary.company] = summary
+        # One assignment so a concurrent render never sees half a deck.
+        self._state = (cards, version)
+
+    @property
+    def version(self) -> tuple[int, int] | None:
+        return self._state[1]
+
+    def __len__(self) -> int:
+        return len(self._state[0])
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._state[0]
+
+    def get(self, name: str) -> CardSummary | None:
+        return self._state[0].get(name)
+
+    def ordered(self, names: Iterable[str]) -> list[CardSummary]:
+        """The cards of ``names`` in that order, skipping names without a card."""
+        cards = self._state[0]
+        return [cards[name] for name in names if name in cards]
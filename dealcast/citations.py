@@ -0,0 +1,110 @@
+"""Resolve inline ``[src-id]`` citations against knowledge snippet ids.
+
+The agent prompt contract has every fact in a scenario cite its evidence as
+``[src-id]``. Rather than each panel builder rescanning its strings, a
+scenario is walked once when it loads: every string that carries a citation
+is split into text and snippet references, and the builders look their
+strings up in the result.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import ChainMap
+from typing import Any, Iterable, Mapping, NamedTuple
+
+from dealcast.records import Scenario, Snippet
+
+CITATION = re.compile(r"\[(src-[A-Za-z0-9_.:-]+)\]")
+
+
+class Citation(NamedTuple):
+    """One ``[src-id]`` token; ``snippet`` is None when the id does not resolve."""
+
+    id: str
+    snippet: Snippet | None
+
+
+class CitationIndex:
+    """Snippet id -> snippet, for every snippet that carries an ``id``."""
+
+    def __init__(self, snippets: Iterable[Snippet] = (), parent: Mapping[str, Snippet] | None = None):
+        own = {snippet.id: snippet for snippet in snippets if snippet.id}
+        self._by_id: Mapping[str, Snippet] = ChainMap(own, parent) if parent is not None else own
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, snippet_id: object) -> bool:
+        return snippet_id in self._by_id
+
+    def get(self, snippet_id: str) -> Snippet | None:
+        return self._by_id.get(snippet_id)
+
+    def overlay(self, snippets: Iterable[Snippet]) -> "CitationIndex":
+        """An index where ``snippets`` (e.g. a scenario's own) shadow this one, without copying it."""
+        return CitationIndex(snippets, parent=self._by_id)
+
+
+def strip_citations(text: str) -> str:
+    """``text`` without its ``[src-id]`` tokens, for plain-text output."""
+    return " ".join(CITATION.sub("", text).split()) if "[src-" in text else text
+
+
+def split_citations(text: str, index: CitationIndex) -> list[str | Citation] | None:
+    """Split ``text`` into plain strings and citations; None if it cites nothing."""
+    pieces = CITATION.split(text)
+    if len(pieces) == 1:
+        return None
+    # re.split with one group alternates text, id, text, ...
+    parts: list[str | Citation] = []
+    for position, piece in enumerate(pieces):
+        if position % 2:
+            parts.append(Citation(piece, index.get(piece)))
+        elif piece:
+            parts.append(piece)
+    return parts
+
+
+class ScenarioCitations:
+    """Every cited string of one scenario, tokenised once."""
+
+    def __init__(self, scenario: Scenario, index: CitationIndex):
+        self.index = index.overlay(scenario.knowledge_snippets)
+        self._parts: dict[str, list[str | Citation]] = {}
+        self._cited: dict[str, None] = {}
+        for section in scenario.sections:
+            self._walk(section)
+
+    def _walk(self, value: Any) -> None:
+        if isinstance(value, str):
+            if value in self._parts or "[src-" not in value:
+                return
+            parts = split_citations(value, self.index)
+            if parts is not None:
+                self._parts[value] = parts
+                for part in parts:
+                    if isinstance(part, Citation):
+                        self._cited[part.id] = None
+        elif isinstance(value, dict):
+            for item in value.values():
+                self._walk(item)
+        elif isinstance(value, list):
+            for item in value:
+                self._walk(item)
+
+    def parts(self, text: str | None) -> list[str | Citation]:
+        """``text`` split around its citations (a single plain part if it has none)."""
+        if not text:
+            return []
+        return self._parts.get(text) or [text]
+
+    @property
+    def cited(self) -> list[str]:
+        """Every cited id, in first-seen order."""
+        return list(self._cited)
+
+    @property
+    def dangling(self) -> list[str]:
+        """Cited ids with no matching snippet, in first-seen order."""
+        return [snippet_id for snippet_id in self._cited if snippet_id not in self.index]
@@ -0,0 +1,29 @@
+"""Filesystem locations shared by the app and the build scripts."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+DATA_DIR = Path(os.environ.get("DEALCAST_DATA_DIR", BASE_DIR / "data"))
+SCENARIO_DIR = Path(os.environ.get("DEALCAST_SCENARIO_DIR", DATA_DIR))
+CACHE_DIR = Path(os.environ.get("DEALCAST_CACHE_DIR", BASE_DIR / ".dealcast-cache"))
+# Written by scripts/compile_data.py; used instead of the JSON while it is fresh.
+PACK_PATH = Path(os.environ.get("DEALCAST_PACK", CACHE_DIR / "dealcast.pack"))
+# Summary cards derived by scripts/build_cards.py; the roster overview reads only these.
+CARDS_PATH = Path(os.environ.get("DEALCAST_CARDS", BASE_DIR / "prospect-summary-cards.json"))
+# Size budget of the on-disk callback response cache; 0 turns it off.
+RESPONSE_CACHE_MB = int(os.environ.get("DEALCAST_RESPONSE_CACHE_MB", "0"))
+# Render the prospect-only panels in the browser (assets/dealcast.js).
+CLIENTSIDE_PROSPECTS = os.environ.get("DEALCAST_CLIENTSIDE_PROSPECTS", "") not in ("", "0")
+# Brotli/gzip responses through flask-compress; wsgi.py turns this on.
+COMPRESS = os.environ.get("DEALCAST_COMPRESS", "") not in ("", "0")
+# Per-panel timings, /metrics and a structured log line per callback.
+METRICS_ENABLED = os.environ.get("DEALCAST_METRICS", "") not in ("", "0")
+
+
+def file_version(path: Path) -> tuple[int, int]:
+    """Identify one revision of a data file; render caches key on it."""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,391 @@
+"""Compact binary pack of prospects, snippets and scenarios, read through mmap.
+
+``scripts/compile_data.py`` turns the JSON sources into one file:
+
+* a header with a table of named sections;
+* ``strings`` — every distinct string once, addressed through a fixed-width
+  ``(offset, length)`` table;
+* for each collection ``<name>.records`` — fixed-width record offsets
+  followed by the tagged binary records, and ``<name>.index`` — ``(key
+  string id, record number)`` pairs sorted by key for binary search;
+* ``meta`` — JSON with the source file versions the pack was built from.
+
+Opening a pack maps the file read-only, so every worker process shares the
+same pages, and a single record decodes without touching the rest.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import struct
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from dealcast.cache import LRUCache
+from dealcast.config import PACK_PATH, file_version
+
+log = logging.getLogger(__name__)
+
+MAGIC = b"DCPK"
+# 2: records are schema-checked and snippets stored in the contract shape.
+FORMAT = 2
+
+_HEADER = struct.Struct("<4sHH")
+_SECTION = struct.Struct("<32sQQ")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_STRING_REF = struct.Struct("<II")
+_INDEX_ROW = struct.Struct("<II")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+_NULL, _FALSE, _TRUE, _INT, _FLOAT, _STR, _ARRAY, _OBJECT = range(8)
+
+
+class PackError(ValueError):
+    """Raised for files that are not DealCast packs or use another format."""
+
+
+# --------------------------------------------------------------------- writing
+
+
+class _StringTable:
+    def __init__(self):
+        self.ids: dict[str, int] = {}
+
+    def add(self, value: str) -> int:
+        string_id = self.ids.get(value)
+        if string_id is None:
+            string_id = self.ids[value] = len(self.ids)
+        return string_id
+
+    def encode(self) -> bytes:
+        blobs = [value.encode("utf-8") for value in self.ids]
+        table = bytearray(_U32.pack(len(blobs)))
+        offset = 0
+        for blob in blobs:
+            table += _STRING_REF.pack(offset, len(blob))
+            offset += len(blob)
+        return bytes(table) + b"".join(blobs)
+
+
+def _encode_value(value: Any, strings: _StringTable, out: bytearray) -> None:
+    if value is None:
+        out.append(_NULL)
+    elif value is True:
+        out.append(_TRUE)
+    elif value is False:
+        out.append(_FALSE)
+    elif isinstance(value, int):
+        out.append(_INT)
+        out += _I64.pack(value)
+    elif isinstance(value, float):
+        out.append(_FLOAT)
+        out += _F64.pack(value)
+    elif isinstance(value, str):
+        out.append(_STR)
+        out += _U32.pack(strings.add(value))
+    elif isinstance(value, list):
+        out.append(_ARRAY)
+        out += _U32.pack(len(value))
+        for item in value:
+            _encode_value(item, strings, out)
+    elif isinstance(value, dict):
+        out.append(_OBJECT)
+        out += _U32.pack(len(value))
+        for key, item in value.items():
+            out += _U32.pack(strings.add(key))
+            _encode_value(item, strings, out)
+    else:
+        raise TypeError(f"cannot pack {type(value).__name__}")
+
+
+def _encode_collection(records: Iterable[tuple[str, Any]], strings: _StringTable) -> tuple[bytes, bytes]:
+    offsets: list[int] = []
+    blob = bytearray()
+    keys: dict[str, int] = {}
+    for key, record in records:
+        if key in keys:
+            continue
+        keys[key] = len(offsets)
+        offsets.append(len(blob))
+        _encode_value(record, strings, blob)
+    offsets.append(len(blob))
+    header = _U32.pack(len(keys)) + b"".join(_U64.pack(offset) for offset in offsets)
+    index = bytearray(_U32.pack(len(keys)))
+    for key in sorted(keys):
+        index += _INDEX_ROW.pack(strings.add(key), keys[key])
+    return header + bytes(blob), bytes(index)
+
+
+def write_pack(
+    path: Path,
+    collections: dict[str, Iterable[tuple[str, Any]]],
+    sources: Iterable[Path] = (),
+) -> dict[str, int]:
+    """Write ``collections`` (name -> iterable of (key, record)) to ``path``.
+
+    Records with a key already seen in the same collection are skipped.
+    Returns the record count per collection.
+    """
+    strings = _StringTable()
+    sections: list[tuple[str, bytes]] = []
+    counts = {}
+    for name, records in collections.items():
+        record_section, index_section = _encode_collection(records, strings)
+        counts[name] = _U32.unpack_from(record_section)[0]
+        sections.append((f"{name}.records", record_section))
+        sections.append((f"{name}.index", index_section))
+    meta = {"sources": {source.name: list(file_version(source)) for source in sources}, "counts": counts}
+    sections.append(("meta", json.dumps(meta).encode("utf-8")))
+    sections.insert(0, ("strings", strings.encode()))
+
+    offset = _HEADER.size + _SECTION.size * len(sections)
+    table = bytearray()
+    for name, data in sections:
+        if len(name) > 32:
+            raise ValueError(f"section name {name!r} is longer than 32 bytes")
+        table += _SECTION.pack(name.encode("ascii"), offset, len(data))
+        offset += len(data)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with tmp.open("wb") as handle:
+        handle.write(_HEADER.pack(MAGIC, FORMAT, len(sections)))
+        handle.write(table)
+        for _, data in sections:
+            handle.write(data)
+    tmp.replace(path)
+    return counts
+
+
+# --------------------------------------------------------------------- reading
+
+
+class PackedCollection:
+    """Read-only, key-addressable view of one collection in a pack."""
+
+    def __init__(self, pack: "DataPack", name: str):
+        self._pack = pack
+        self.name = name
+        self._records_at, _ = pack._section(f"{name}.records")
+        self._index_at, _ = pack._section(f"{name}.index")
+        self._count = _U32.unpack_from(pack._buf, self._records_at)[0]
+        self._blob_at = self._records_at + _U32.size + _U64.size * (self._count + 1)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Any]:
+        for number in range(self._count):
+            yield self.record(number)
+
+    def _record_offset(self, number: int) -> int:
+        return self._blob_at + _U64.unpack_from(self._pack._buf, self._records_at + _U32.size + _U64.size * number)[0]
+
+    def record(self, number: int) -> Any:
+        if not 0 <= number < self._count:
+            raise IndexError(number)
+        return self._pack._decode(self._record_offset(number))[0]
+
+    def field(self, number: int, key: str) -> Any:
+        """Decode a single top-level field of a record, skipping the rest."""
+        return self._pack._decode_field(self._record_offset(number), key)
+
+    def _index_row(self, position: int) -> tuple[int, int]:
+        return _INDEX_ROW.unpack_from(self._pack._buf, self._index_at + _U32.size + _INDEX_ROW.size * position)
+
+    def keys(self) -> list[str]:
+        """All keys in sorted order."""
+        return [self._pack.string(self._index_row(position)[0]) for position in range(self._count)]
+
+    def key_numbers(self) -> Iterator[tuple[str, int]]:
+        """``(key, record number)`` for every record, in sorted key order."""
+        for position in range(self._count):
+            string_id, number = self._index_row(position)
+            yield self._pack.string(string_id), number
+
+    def find(self, key: str) -> int | None:
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            string_id, number = self._index_row(middle)
+            probe = self._pack.string(string_id)
+            if probe == key:
+                return number
+            if probe < key:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def get(self, key: str) -> Any | None:
+        number = self.find(key)
+        return None if number is None else self.record(number)
+
+
+class DataPack:
+    """A compiled pack mapped into memory."""
+
+    def __init__(self, path: Path, cache_size: int = 512):
+        self.path = Path(path)
+        with self.path.open("rb") as handle:
+            self._buf = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count = _HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC:
+            raise PackError(f"{path} is not a DealCast pack")
+        if version != FORMAT:
+            raise PackError(f"{path} uses pack format {version}, expected {FORMAT}")
+        self._sections = {}
+        for number in range(count):
+            name, offset, length = _SECTION.unpack_from(self._buf, _HEADER.size + _SECTION.size * number)
+            self._sections[name.rstrip(b"\0").decode("ascii")] = (offset, length)
+        self._strings_at, _ = self._section("strings")
+        self._string_count = _U32.unpack_from(self._buf, self._strings_at)[0]
+        self._string_blob_at = self._strings_at + _U32.size + _STRING_REF.size * self._string_count
+        offset, length = self._section("meta")
+        self.meta = json.loads(self._buf[offset:offset + length])
+        self._strings = LRUCache(cache_size)
+        self._collections: dict[str, PackedCollection] = {}
+
+    def _section(self, name: str) -> tuple[int, int]:
+        try:
+            return self._sections[name]
+        except KeyError:
+            raise PackError(f"{self.path} has no section {name!r}") from None
+
+    def close(self) -> None:
+        self._buf.close()
+
+    def collection(self, name: str) -> PackedCollection:
+        collection = self._collections.get(name)
+        if collection is None:
+            collection = self._collections[name] = PackedCollection(self, name)
+        return collection
+
+    def source_version(self, name: str) -> tuple[int, int] | None:
+        """The version of source file ``name`` the pack was compiled from."""
+        recorded = self.meta["sources"].get(name)
+        return None if recorded is None else tuple(recorded)
+
+    def is_fresh(self, source: Path) -> bool:
+        """True when ``source`` is unchanged since the pack was compiled."""
+        recorded = self.source_version(Path(source).name)
+        try:
+            return recorded is not None and recorded == file_version(Path(source))
+        except FileNotFoundError:
+            return False
+
+    def string(self, string_id: int) -> str:
+        value = self._strings.get(string_id)
+        if value is None:
+            offset, length = _STRING_REF.unpack_from(self._buf, self._strings_at + _U32.size + _STRING_REF.size * string_id)
+            start = self._string_blob_at + offset
+            value = self._buf[start:start + length].decode("utf-8")
+            self._strings.put(string_id, value)
+        return value
+
+    def _decode(self, pos: int) -> tuple[Any, int]:
+        buf = self._buf
+        tag = buf[pos]
+        pos += 1
+        if tag == _STR:
+            return self.string(_U32.unpack_from(buf, pos)[0]), pos + _U32.size
+        if tag == _OBJECT:
+            count = _U32.unpack_from(buf, pos)[0]
+            pos += _U32.size
+            result = {}
+            for _ in range(count):
+                key = self.string(_U32.unpack_from(buf, pos)[0])
+                result[key], pos = self._decode(pos + _U32.size)
+            return result, pos
+        if tag == _ARRAY:
+            count = _U32.unpack_from(buf, pos)[0]
+            pos += _U32.size
+            items = []
+            for _ in range(count):
+                item, pos = self._decode(pos)
+                items.append(item)
+            return items, pos
+        if tag == _INT:
+            return _I64.unpack_from(buf, pos)[0], pos + _I64.size
+        if tag == _FLOAT:
+            return _F64.unpack_from(buf, pos)[0], pos + _F64.size
+        if tag == _NULL:
+            return None, pos
+        if tag == _TRUE:
+            return True, pos
+        if tag == _FALSE:
+            return False, pos
+        raise PackError(f"unknown tag {tag} at byte {pos - 1}")
+
+    def _skip(self, pos: int) -> int:
+        buf = self._buf
+        tag = buf[pos]
+        pos += 1
+        if tag == _STR:
+            return pos + _U32.size
+        if tag in (_INT, _FLOAT):
+            return pos + 8
+        if tag in (_ARRAY, _OBJECT):
+            count = _U32.unpack_from(buf, pos)[0]
+            pos += _U32.size
+            for _ in range(count):
+                if tag == _OBJECT:
+                    pos += _U32.size
+                pos = self._skip(pos)
+            return pos
+        return pos
+
+    def _decode_field(self, pos: int, key: str) -> Any:
+        if self._buf[pos] != _OBJECT:
+            return None
+        count = _U32.unpack_from(self._buf, pos + 1)[0]
+        pos += 1 + _U32.size
+        for _ in range(count):
+            name = self.string(_U32.unpack_from(self._buf, pos)[0])
+            pos += _U32.size
+            if name == key:
+                return self._decode(pos)[0]
+            pos = self._skip(pos)
+        return None
+
+
+def open_pack(path: Path = PACK_PATH) -> DataPack | None:
+    """Open the pack at ``path`` if one has been compiled (and still opens)."""
+    try:
+        return DataPack(path)
+    except FileNotFoundError:
+        return None
+    except PackError as error:
+        log.warning("Ignoring data pack: %s; re-run scripts/compile_data.py", error)
+        return None
+
+
+def open_fresh_pack(source: Path, path: Path = PACK_PATH) -> DataPack | None:
+    """Open the pack only if it was compiled from the current ``source``."""
+    pack = open_pack(path)
+    if pack is not None and not pack.is_fresh(source):
+        pack.close()
+        return None
+    return pack
+
+
+def iter_collection(
+    source: Path,
+    name: str,
+    fallback: Callable[[Path], Iterable[Any]],
+    path: Path = PACK_PATH,
+) -> Iterator[Any]:
+    """Yield collection ``name`` from the pack, or ``fallback(source)`` if it is stale."""
+    pack = open_fresh_pack(source, path)
+    if pack is None:
+        yield from fallback(source)
+        return
+    try:
+        yield from pack.collection(name)
+    finally:
+        pack.close()
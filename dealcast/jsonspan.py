@@ -0,0 +1,110 @@
+"""Locate JSON values by byte offset without decoding the whole document.
+
+The scanner only understands enough JSON to skip over values: strings are
+matched with a regex and nesting is tracked by counting brackets, so the
+cost is proportional to the number of structural characters rather than to
+building Python objects. It works on ``bytes`` and ``mmap`` buffers alike.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Iterator
+
+_STRUCTURAL = re.compile(rb'["{}\[\]]')
+_STRING = re.compile(rb'"(?:[^"\\]|\\.)*"', re.S)
+_SCALAR_END = re.compile(rb"[,\]}\s]")
+_WHITESPACE = re.compile(rb"\s*")
+
+
+class SpanError(ValueError):
+    """Raised when the buffer is not shaped like the JSON we expect."""
+
+
+def skip_whitespace(buf, pos: int) -> int:
+    return _WHITESPACE.match(buf, pos).end()
+
+
+def skip_value(buf, pos: int) -> int:
+    """Return the offset just past the JSON value that starts at ``pos``."""
+    head = buf[pos:pos + 1]
+    if head == b'"':
+        match = _STRING.match(buf, pos)
+        if match is None:
+            raise SpanError(f"unterminated string at byte {pos}")
+        return match.end()
+    if head in (b"{", b"["):
+        depth = 0
+        cursor = pos
+        while True:
+            match = _STRUCTURAL.search(buf, cursor)
+            if match is None:
+                raise SpanError(f"unterminated container at byte {pos}")
+            token = match.group()
+            if token == b'"':
+                cursor = skip_value(buf, match.start())
+                continue
+            cursor = match.end()
+            depth += 1 if token in (b"{", b"[") else -1
+            if depth == 0:
+                return cursor
+    match = _SCALAR_END.search(buf, pos)
+    return match.start() if match else len(buf)
+
+
+def iter_array_spans(buf, pos: int) -> Iterator[tuple[int, int]]:
+    """Yield ``(start, end)`` of every item of the array opening at ``pos``."""
+    if buf[pos:pos + 1] != b"[":
+        raise SpanError(f"expected '[' at byte {pos}")
+    cursor = skip_whitespace(buf, pos + 1)
+    if buf[cursor:cursor + 1] == b"]":
+        return
+    while True:
+        end = skip_value(buf, cursor)
+        yield cursor, end
+        cursor = skip_whitespace(buf, end)
+        token = buf[cursor:cursor + 1]
+        if token == b"]":
+            return
+        if token != b",":
+            raise SpanError(f"expected ',' or ']' at byte {cursor}")
+        cursor = skip_whitespace(buf, cursor + 1)
+
+
+def iter_member_spans(buf, pos: int = 0) -> Iterator[tuple[str, int, int]]:
+    """Yield ``(key, start, end)`` for each member of the object at ``pos``."""
+    cursor = skip_whitespace(buf, pos)
+    if buf[cursor:cursor + 1] != b"{":
+        raise SpanError(f"expected '{{' at byte {cursor}")
+    cursor = skip_whitespace(buf, cursor + 1)
+    if buf[cursor:cursor + 1] == b"}":
+        return
+    while True:
+        key_end = skip_value(buf, cursor)
+        key = json.loads(bytes(buf[cursor:key_end]))
+        cursor = skip_whitespace(buf, key_end)
+        if buf[cursor:cursor + 1] != b":":
+            raise SpanError(f"expected ':' at byte {cursor}")
+        start = skip_whitespace(buf, cursor + 1)
+        end = skip_value(buf, start)
+        yield key, start, end
+        cursor = skip_whitespace(buf, end)
+        token = buf[cursor:cursor + 1]
+        if token == b"}":
+            return
+        if token != b",":
+            raise SpanError(f"expected ',' or '}}' at byte {cursor}")
+        cursor = skip_whitespace(buf, cursor + 1)
+
+
+def find_member(buf, key: str, pos: int = 0) -> tuple[int, int] | None:
+    """Return the value span of ``key`` in the object at ``pos``, if present.
+
+    Scanning stops as soon as the member is found, so for keys near the top
+    of a file only the leading pages are touched.
+    """
+    for member, start, end in iter_member_spans(buf, pos):
+        if member == key:
+            return start, end
+    return None
@@ -0,0 +1,386 @@
+"""Fill the instant-kit shells in ``instant-kit-templates.md`` from show data.
+
+Each fenced shell (or, for the presentation outline, its table) is compiled
+once into a plan: literal text interleaved with slots whose placeholder
+paths (``{{segment.A.headline}}``, ``{{producer.queue.watchpoints |
+join(', ')}}``) are pre-split into getters. Binding a plan to a context
+folds every slot that context resolves into the surrounding text, so a
+batch binds the show once, each prospect once, and per recipient only fills
+the few slots that still vary. Placeholders nothing resolves are left as
+written for the producer to fill by hand.
+
+Values come from three levels:
+
+* show — ``dealcast.*``, ``segment.A``/``B`` (first two talk tracks),
+  ``cta.one``/``two``, ``ai.quote_pack``, ``producer.queue`` and
+  ``notes`` from the scenario, plus anything passed in ``extra`` (ticker,
+  assets, sender, guest... which the data does not carry);
+* prospect — ``prospect.*`` and ``analysis.implication_1``/``2`` (its top
+  challenge and buying trigger);
+* recipient — ``recipient.*`` for one of the prospect's personas.
+
+A template is rendered once per show, per prospect or per recipient,
+depending on the deepest level it refers to.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping, NamedTuple
+
+from dealcast.citations import CITATION, CitationIndex, strip_citations
+from dealcast.config import BASE_DIR
+from dealcast.records import Persona, Prospect, Scenario
+
+KIT_TEMPLATES_PATH = BASE_DIR / "instant-kit-templates.md"
+
+PLACEHOLDER = re.compile(r"\{\{\s*([A-Za-z0-9_.]+)\s*(?:\|\s*([a-z_]+)\(([^)]*)\)\s*)?\}\}")
+_HEADING = re.compile(r"^##\s+(?:\d+\.\s*)?([^(]+)")
+_MISSING = object()
+
+PROSPECT_ROOTS = frozenset({"prospect", "analysis"})
+RECIPIENT_ROOTS = frozenset({"recipient"})
+
+
+def _text(value: Any) -> str:
+    """Display text for a resolved value; citation tokens are dropped."""
+    if isinstance(value, (list, tuple)):
+        return ", ".join(_text(item) for item in value)
+    if isinstance(value, str):
+        return strip_citations(value)
+    return str(value)
+
+
+def _join(value: Any, separator: str = ", ") -> str:
+    items = value if isinstance(value, (list, tuple)) else [value]
+    return separator.join(_text(item) for item in items)
+
+
+FILTERS: dict[str, Callable[..., str]] = {
+    "join": _join,
+    "upper": lambda value: _text(value).upper(),
+    "lower": lambda value: _text(value).lower(),
+}
+
+
+def _getter(path: tuple[str, ...]) -> Callable[[Mapping], Any]:
+    def get(values: Any) -> Any:
+        for key in path:
+            if isinstance(values, Mapping):
+                values = values.get(key, _MISSING)
+            elif isinstance(values, (list, tuple)) and key.isdigit() and int(key) < len(values):
+                values = values[int(key)]
+            else:
+                return _MISSING
+            if values is _MISSING or values is None:
+                return _MISSING
+        return values
+
+    return get
+
+
+class Slot(NamedTuple):
+    raw: str
+    path: tuple[str, ...]
+    get: Callable[[Mapping], Any]
+    format: Callable[[Any], str]
+
+    def resolve(self, values: Mapping) -> str | None:
+        value = self.get(values)
+        return None if value is _MISSING else self.format(value)
+
+
+def _slot(match: re.Match) -> Slot:
+    path = tuple(match.group(1).split("."))
+    name = match.group(2)
+    if name is None:
+        format = _text
+    else:
+        if name not in FILTERS:
+            raise ValueError(f"unknown kit filter {name!r} in {match.group(0)}")
+        args = ast.literal_eval(f"({match.group(3)},)") if match.group(3).strip() else ()
+        function = FILTERS[name]
+
+        def format(value, function=function, args=args):
+            return function(value, *args)
+
+    return Slot(match.group(0), path, _getter(path), format)
+
+
+def _merge(parts: Iterable[str | Slot]) -> tuple[str | Slot, ...]:
+    merged: list[str | Slot] = []
+    for part in parts:
+        if isinstance(part, str):
+            if not part:
+                continue
+            if merged and isinstance(merged[-1], str):
+                merged[-1] += part
+                continue
+        merged.append(part)
+    return tuple(merged)
+
+
+class KitTemplate:
+    """A compiled kit shell; ``bind`` returns a copy with more of it filled in."""
+
+    def __init__(self, name: str, source: str, parts: tuple[str | Slot, ...] | None = None):
+        self.name = name
+        self.source = source
+        if parts is None:
+            pieces: list[str | Slot] = []
+            position = 0
+            for match in PLACEHOLDER.finditer(source):
+                pieces.append(source[position:match.start()])
+                pieces.append(_slot(match))
+                position = match.end()
+            pieces.append(source[position:])
+            parts = _merge(pieces)
+        self._parts = parts
+
+    @property
+    def slots(self) -> list[Slot]:
+        return [part for part in self._parts if isinstance(part, Slot)]
+
+    @property
+    def unresolved(self) -> list[str]:
+        """Placeholders still open, in order, without repeats."""
+        return list(dict.fromkeys(slot.raw for slot in self.slots))
+
+    @property
+    def scope(self) -> str:
+        """``recipient``, ``prospect`` or ``show``: how often the template renders."""
+        roots = {slot.path[0] for slot in self.slots}
+        if roots & RECIPIENT_ROOTS:
+            return "recipient"
+        if roots & PROSPECT_ROOTS:
+            return "prospect"
+        return "show"
+
+    def bind(self, values: Mapping) -> "KitTemplate":
+        """Fold every slot ``values`` resolves into literal text."""
+        parts = []
+        for part in self._parts:
+            if isinstance(part, Slot):
+                text = part.resolve(values)
+                if text is not None:
+                    part = text
+            parts.append(part)
+        return KitTemplate(self.name, self.source, _merge(parts))
+
+    def render(self, values: Mapping | None = None) -> str:
+        """The text, with ``values`` filling what is still open and the rest left as written."""
+        out = []
+        for part in self._parts:
+            if isinstance(part, str):
+                out.append(part)
+            else:
+                text = part.resolve(values) if values is not None else None
+                out.append(part.raw if text is None else text)
+        return "".join(out)
+
+
+def _slugify(value: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-")
+
+
+def parse_kit_templates(markdown: str) -> dict[str, KitTemplate]:
+    """One template per ``##`` section: its first fenced block, else its table."""
+    templates = {}
+    for section in re.split(r"(?m)^(?=## )", markdown):
+        heading = _HEADING.match(section)
+        if heading is None:
+            continue
+        name = _slugify(heading.group(1))
+        fenced = re.search(r"```[^\n]*\n(.*?)```", section, re.S)
+        if fenced:
+            body = fenced.group(1)
+        else:
+            body = "".join(line + "\n" for line in section.splitlines() if line.startswith("|"))
+        if body.strip():
+            templates[name] = KitTemplate(name, body)
+    return templates
+
+
+def load_kit_templates(path: Path = KIT_TEMPLATES_PATH) -> dict[str, KitTemplate]:
+    return parse_kit_templates(Path(path).read_text(encoding="utf-8"))
+
+
+def merge_context(base: dict, extra: Mapping | None) -> dict:
+    """``base`` with ``extra`` layered over it, nested objects merged key by key."""
+    if not extra:
+        return base
+    merged = dict(base)
+    for key, value in extra.items():
+        if isinstance(value, Mapping) and isinstance(merged.get(key), dict):
+            merged[key] = merge_context(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _first_source(texts: Iterable[str], citations: CitationIndex | None) -> str | None:
+    if citations is None:
+        return None
+    for text in texts:
+        for snippet_id in CITATION.findall(text or ""):
+            snippet = citations.get(snippet_id)
+            if snippet is not None:
+                return snippet.source or snippet.title
+    return None
+
+
+def show_context(scenario: Scenario, extra: Mapping | None = None, citations: CitationIndex | None = None) -> dict:
+    """Show-level values from a scenario; ``extra`` adds or overrides any of them."""
+    context = scenario.session_context
+    intel, playbook, call = scenario.sections
+    tracks = playbook.get("talk_tracks") or []
+    ctas = playbook.get("cta_blocks") or []
+    script = call.get("host_script") or []
+    if citations is not None:
+        citations = citations.overlay(scenario.knowledge_snippets)
+
+    def segment(number: int) -> dict:
+        if number >= len(tracks):
+            return {}
+        track = tracks[number]
+        beats = track.get("beats") or []
+        return {
+            "headline": track.get("title"),
+            "key_stat": beats[0] if beats else None,
+            "metric": beats[0] if beats else None,
+            "overlay_asset": track.get("overlay"),
+            "cta": ctas[number].get("label") if number < len(ctas) else None,
+            "source": _first_source(beats, citations),
+        }
+
+    def cta(number: int) -> dict:
+        if number >= len(ctas):
+            return {}
+        block = ctas[number]
+        return {"label": block.get("label"), "description": block.get("microcopy"), "asset": block.get("asset")}
+
+    values = {
+        "dealcast": {
+            "session": {
+                "id": scenario.request_id,
+                "title": intel.get("headline"),
+                "short_title": intel.get("headline"),
+                "topic": context.get("segment") or context.get("show_block"),
+                "anchor": context.get("host"),
+            },
+            "broadcast": {"opening_hook": playbook.get("opening_angle") or intel.get("why_now")},
+        },
+        "segment": {"A": segment(0), "B": segment(1)},
+        "cta": {"one": cta(0), "two": cta(1)},
+        "ai": {"quote_pack": {"top_quote": script[0].get("copy") if script else None}},
+        "producer": {"queue": {"watchpoints": [*intel.get("risk_flags", []), *intel.get("gaps", [])]}},
+        "notes": {"presenter": playbook.get("producer_notes")},
+    }
+    return merge_context(values, extra)
+
+
+def prospect_context(prospect: Prospect) -> dict:
+    return {
+        "prospect": {
+            "name": prospect.name,
+            "industry": prospect.industry,
+            "stage": prospect.stage,
+            "headquarters": prospect.headquarters,
+        },
+        "analysis": {
+            "implication_1": prospect.challenges[0] if prospect.challenges else None,
+            "implication_2": prospect.triggers[0] if prospect.triggers else None,
+        },
+    }
+
+
+def recipient_context(prospect: Prospect, persona: Persona) -> dict:
+    return {
+        "recipient": {
+            "name": persona.name,
+            "first_name": persona.name.split()[0] if persona.name else None,
+            "title": persona.title,
+            "company": prospect.name,
+        }
+    }
+
+
+class _Output:
+    """A file written through a temp name and moved into place on success."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._tmp = path.with_name(path.name + ".tmp")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.handle = self._tmp.open("w", encoding="utf-8", buffering=1 << 20)
+
+    def commit(self) -> None:
+        self.handle.close()
+        os.replace(self._tmp, self.path)
+
+    def discard(self) -> None:
+        self.handle.close()
+        self._tmp.unlink(missing_ok=True)
+
+
+def render_show_kits(
+    templates: Mapping[str, KitTemplate],
+    scenario: Scenario,
+    prospects: Iterable[Prospect],
+    out_dir: Path,
+    extra: Mapping | None = None,
+    citations: CitationIndex | None = None,
+) -> dict[str, dict]:
+    """Render every template for one show into ``out_dir``, streaming as it goes.
+
+    Show-scoped templates are written as ``<name>.md``; prospect and
+    recipient-scoped ones as ``<name>.jsonl``, one JSON object per line
+    (``prospect``, ``recipient``, ``title``, ``text``). Returns, per
+    template, the number of renders and the placeholders left open.
+    """
+    out_dir = Path(out_dir)
+    bound = {name: template.bind(show_context(scenario, extra, citations)) for name, template in templates.items()}
+    summary = {name: {"scope": plan.scope, "rendered": 0, "unresolved": set()} for name, plan in bound.items()}
+
+    for name, plan in bound.items():
+        if plan.scope == "show":
+            output = _Output(out_dir / f"{name}.md")
+            output.handle.write(plan.render())
+            output.commit()
+            summary[name]["rendered"] = 1
+            summary[name]["unresolved"].update(plan.unresolved)
+
+    streamed = {name: plan for name, plan in bound.items() if plan.scope != "show"}
+    outputs = {name: _Output(out_dir / f"{name}.jsonl") for name in streamed}
+    try:
+        for prospect in prospects:
+            values = prospect_context(prospect)
+            for name, plan in streamed.items():
+                per_prospect = plan.bind(values)
+                write = outputs[name].handle.write
+                if plan.scope == "prospect":
+                    rows = [(None, None, per_prospect)]
+                else:
+                    rows = [
+                        (persona.name, persona.title, per_prospect.bind(recipient_context(prospect, persona)))
+                        for persona in prospect.personas
+                    ]
+                for recipient, title, final in rows:
+                    record = {"prospect": prospect.name, "recipient": recipient, "title": title, "text": final.render()}
+                    write(json.dumps(record, ensure_ascii=False) + "\n")
+                    summary[name]["rendered"] += 1
+                    summary[name]["unresolved"].update(final.unresolved)
+    except BaseException:
+        for output in outputs.values():
+            output.discard()
+        raise
+    for output in outputs.values():
+        output.commit()
+
+    for entry in summary.values():
+        entry["unresolved"] = sorted(entry["unresolved"])
+    return summary
@@ -0,0 +1,142 @@
+"""Opt-in render and load instrumentation with a Prometheus text exporter.
+
+Enabled with ``DEALCAST_METRICS=1``. When it is off the app holds no
+``Metrics`` object at all and the hot paths skip instrumentation with one
+``is None`` check. Each worker process keeps its own numbers; the exporter
+labels them with the pid so scrapes from a multi-worker host stay distinct.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+log = logging.getLogger("dealcast.metrics")
+# Matches gunicorn's error log, where the lines end up next to its own.
+LOG_FORMAT = "[%(asctime)s] [%(process)d] [%(name)s] %(message)s"
+
+
+def configure_logging() -> None:
+    """Send the structured lines to stderr at INFO.
+
+    Servers that configure only their own loggers (gunicorn) would otherwise
+    drop them. Idempotent; the lines do not propagate, so a root handler
+    added later does not print them twice.
+    """
+    if log.handlers:
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(LOG_FORMAT, "%Y-%m-%d %H:%M:%S %z"))
+    log.addHandler(handler)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
+
+SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+BYTES_BUCKETS = (1 << 10, 4 << 10, 16 << 10, 64 << 10, 256 << 10, 1 << 20, 4 << 20)
+
+# name -> (type, help, buckets)
+_METRICS = {
+    "dealcast_panel_render_seconds": ("histogram", "Time spent building a panel (fragment cache misses only).", SECONDS_BUCKETS),
+    "dealcast_panel_payload_bytes": ("histogram", "Serialized size of a panel's component tree.", BYTES_BUCKETS),
+    "dealcast_panel_cache_hits_total": ("counter", "Panels served from the fragment cache.", None),
+    "dealcast_callback_seconds": ("histogram", "Wall time of a server callback.", SECONDS_BUCKETS),
+    "dealcast_callback_payload_bytes": ("histogram", "Serialized size of all panels a callback returned.", BYTES_BUCKETS),
+    "dealcast_data_load_seconds": ("gauge", "Duration of the most recent load of a data source.", None),
+    "dealcast_data_loads_total": ("counter", "Loads (startup and reloads) of a data source.", None),
+    "dealcast_response_cache_hits_total": ("counter", "Callback responses served from the on-disk cache.", None),
+    "dealcast_response_cache_misses_total": ("counter", "Callback responses that missed the on-disk cache.", None),
+}
+
+
+def _escape(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+class Metrics:
+    """Thread-safe counters, gauges and histograms for one process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # name -> {label tuple -> value | [bucket counts..., sum, count]}
+        self._series: dict[str, dict[tuple, object]] = {name: {} for name in _METRICS}
+        self._external: list = []
+
+    def _key(self, labels: dict[str, str]) -> tuple:
+        return tuple(sorted(labels.items()))
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        buckets = _METRICS[name][2]
+        key = self._key(labels)
+        with self._lock:
+            series = self._series[name].get(key)
+            if series is None:
+                series = self._series[name][key] = [0] * len(buckets) + [0.0, 0]
+            for position, bound in enumerate(buckets):
+                if value <= bound:
+                    series[position] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def inc(self, name: str, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._series[name][key] = self._series[name].get(key, 0) + amount
+
+    def set(self, name: str, value: float, **labels: str) -> None:
+        with self._lock:
+            self._series[name][self._key(labels)] = value
+
+    def collect(self, callback) -> None:
+        """Call ``callback(metrics)`` before every export, e.g. to copy external counters."""
+        self._external.append(callback)
+
+    @contextmanager
+    def time_load(self, source: str) -> Iterator[None]:
+        started = time.perf_counter()
+        yield
+        seconds = time.perf_counter() - started
+        self.set("dealcast_data_load_seconds", seconds, source=source)
+        self.inc("dealcast_data_loads_total", source=source)
+        log.info(json.dumps({"event": "data_load", "source": source, "ms": round(seconds * 1000, 3)}))
+
+    def log_callback(self, callback: str, seconds: float, panels: dict[str, dict], **fields) -> None:
+        """Record one callback and emit its structured log line."""
+        total = sum(panel["bytes"] for panel in panels.values())
+        self.observe("dealcast_callback_seconds", seconds, callback=callback)
+        self.observe("dealcast_callback_payload_bytes", total, callback=callback)
+        record = {"event": "callback", "callback": callback, "ms": round(seconds * 1000, 3), "bytes": total, **fields, "panels": panels}
+        log.info(json.dumps(record, ensure_ascii=False, default=str))
+
+    def render(self) -> str:
+        """The Prometheus text exposition format (version 0.0.4)."""
+        for callback in self._external:
+            callback(self)
+        pid = str(os.getpid())
+        lines = []
+        with self._lock:
+            for name, (kind, help_text, buckets) in _METRICS.items():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for key, value in sorted(self._series[name].items()):
+                    labels = dict(key, pid=pid)
+                    if kind != "histogram":
+                        lines.append(f"{name}{_labels(labels)} {value}")
+                        continue
+                    for bound, count in zip(buckets, value):
+                        lines.append(f"{name}_bucket{_labels({**labels, 'le': repr(float(bound))})} {count}")
+                    lines.append(f"{name}_bucket{_labels({**labels, 'le': '+Inf'})} {value[-1]}")
+                    lines.append(f"{name}_sum{_labels(labels)} {value[-2]}")
+                    lines.append(f"{name}_count{_labels(labels)} {value[-1]}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,249 @@
+"""Indexed prospect roster with lazily loaded records.
+
+``prospects.json`` is scanned once to record where each prospect lives in
+the file. The index (name, industry, stage, byte offset, length) is kept on
+disk next to the other caches and reused until the source file changes, so
+workers start without decoding the roster and only pull full records in as
+they are looked up.
+
+Offsets are only good for the bytes they were taken from, so each load
+copies the roster into an unlinked temporary file and lookups read that
+copy. A rewrite of ``prospects.json``, whether rejected or not yet picked
+up by the watcher, cannot shift records under a live index.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from pathlib import Path
+import shutil
+import tempfile
+from threading import Lock
+from typing import BinaryIO, NamedTuple
+
+from dealcast.cache import LRUCache
+from dealcast.config import CACHE_DIR, PACK_PATH, file_version
+from dealcast.datapack import DataPack, open_fresh_pack
+from dealcast.jsonspan import find_member, iter_array_spans
+from dealcast.records import Prospect
+from dealcast.schema import PROSPECT
+
+INDEX_FORMAT = 1
+
+
+class ProspectEntry(NamedTuple):
+    """Index row; ``offset`` is a record number when the store is pack-backed."""
+
+    name: str
+    industry: str
+    stage: str
+    offset: int
+    length: int
+
+
+# Attempts at copying a roster that keeps changing mid-copy before giving up.
+SNAPSHOT_ATTEMPTS = 5
+
+
+def build_index(handle: BinaryIO, path: Path) -> list[ProspectEntry]:
+    """Index the roster in ``handle``; ``path`` names it in errors."""
+    entries = []
+    with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        span = find_member(buf, "prospects")
+        if span is None:
+            raise ValueError(f"{path} has no 'prospects' array")
+        for number, (start, end) in enumerate(iter_array_spans(buf, span[0])):
+            # Every record is decoded here anyway, so a bad one fails the load
+            # instead of a later lookup.
+            record = PROSPECT.validate(json.loads(buf[start:end]), path, number)
+            entries.append(
+                ProspectEntry(
+                    record["companyName"],
+                    record.get("industry", ""),
+                    record.get("growthStage", ""),
+                    start,
+                    end - start,
+                )
+            )
+    return entries
+
+
+_seek_lock = Lock()
+
+
+def _read_at(handle: BinaryIO, offset: int, length: int) -> bytes:
+    # pread leaves the file position alone, which threads and forked workers
+    # sharing the snapshot's descriptor all depend on.
+    if hasattr(os, "pread"):
+        return os.pread(handle.fileno(), length, offset)
+    with _seek_lock:
+        handle.seek(offset)
+        return handle.read(length)
+
+
+class ProspectStore:
+    """Name-addressable view over ``prospects.json``."""
+
+    def __init__(self, path: Path, index_dir: Path = CACHE_DIR, cache_size: int = 1024):
+        self.path = Path(path)
+        self.index_dir = Path(index_dir)
+        self.index_path = self.index_dir / f"{self.path.stem}.index.json"
+        self._records = LRUCache(cache_size)
+        self._load()
+
+    def _copy(self) -> tuple[tuple[int, int], BinaryIO]:
+        """A private copy of the roster and the file version it was taken at."""
+        for _ in range(SNAPSHOT_ATTEMPTS):
+            version = file_version(self.path)
+            try:
+                self.index_dir.mkdir(parents=True, exist_ok=True)
+                snapshot = tempfile.TemporaryFile(dir=self.index_dir)
+            except OSError:
+                # Read-only deploy: the system temp directory will do.
+                snapshot = tempfile.TemporaryFile()
+            with self.path.open("rb") as source:
+                shutil.copyfileobj(source, snapshot)
+            snapshot.flush()
+            # A writer got in between: the copy may hold half of each version.
+            if file_version(self.path) == version and snapshot.tell() == version[1]:
+                return version, snapshot
+            snapshot.close()
+        raise OSError(f"{self.path} kept changing while it was copied")
+
+    def _load(self) -> None:
+        version, snapshot = self._copy()
+        try:
+            entries = self._read_index(version)
+            if entries is None:
+                entries = build_index(snapshot, self.path)
+                self._write_index(version, entries)
+        except BaseException:
+            snapshot.close()
+            raise
+        self._publish(version, entries, snapshot)
+
+    def _publish(
+        self, version: tuple[int, int], entries: list[ProspectEntry], snapshot: BinaryIO | None = None
+    ) -> None:
+        by_name = {entry.name: entry for entry in entries}
+        folded = [entry.name.casefold() for entry in entries]
+        # Swap everything in one assignment so readers never see a mix of
+        # old offsets and a new file.
+        self._state = (version, entries, by_name, folded, snapshot)
+        self._records.clear()
+
+    def _read_index(self, version: tuple[int, int]) -> list[ProspectEntry] | None:
+        try:
+            payload = json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if payload.get("format") != INDEX_FORMAT or tuple(payload.get("version", ())) != version:
+            return None
+        return [ProspectEntry(*row) for row in payload["entries"]]
+
+    def _write_index(self, version: tuple[int, int], entries: list[ProspectEntry]) -> None:
+        payload = {"format": INDEX_FORMAT, "version": list(version), "entries": entries}
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(payload, ensure_ascii=False))
+            tmp.replace(self.index_path)
+        except OSError:
+            # A read-only deploy still works; it just rebuilds on start.
+            pass
+
+    @property
+    def version(self) -> tuple[int, int]:
+        return self._state[0]
+
+    @property
+    def entries(self) -> list[ProspectEntry]:
+        return self._state[1]
+
+    @property
+    def default(self) -> str:
+        return self._state[1][0].name
+
+    def __len__(self) -> int:
+        return len(self._state[1])
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._state[2]
+
+    def names(self) -> list[str]:
+        return [entry.name for entry in self._state[1]]
+
+    def entry(self, name: str) -> ProspectEntry | None:
+        return self._state[2].get(name)
+
+    def get(self, name: str) -> Prospect | None:
+        version, _, by_name, _, snapshot = self._state
+        entry = by_name.get(name)
+        if entry is None:
+            return None
+        key = (version, name)
+        record = self._records.get(key)
+        if record is None:
+            record = Prospect.from_dict(json.loads(_read_at(snapshot, entry.offset, entry.length)))
+            self._records.put(key, record)
+        return record
+
+    def search(self, query: str, limit: int = 50) -> list[str]:
+        _, entries, _, folded, _ = self._state
+        needle = query.casefold().strip()
+        matches = []
+        for entry, name in zip(entries, folded):
+            if needle in name:
+                matches.append(entry.name)
+                if len(matches) >= limit:
+                    break
+        return matches
+
+    def reload(self) -> None:
+        """Re-index the file; on failure the previous index and its copy stay live."""
+        self._load()
+
+
+class PackedProspectStore(ProspectStore):
+    """ProspectStore that decodes records out of a compiled, memory-mapped pack."""
+
+    def __init__(self, path: Path, pack: DataPack, cache_size: int = 1024):
+        self.pack = pack
+        self._collection = pack.collection("prospects")
+        super().__init__(path, cache_size=cache_size)
+
+    def _load(self) -> None:
+        collection = self._collection
+        entries = [
+            ProspectEntry(
+                collection.field(number, "companyName"),
+                collection.field(number, "industry") or "",
+                collection.field(number, "growthStage") or "",
+                number,
+                0,
+            )
+            for number in range(len(collection))
+        ]
+        self._publish(file_version(self.path), entries)
+
+    def get(self, name: str) -> Prospect | None:
+        version, _, by_name, _, _ = self._state
+        entry = by_name.get(name)
+        if entry is None:
+            return None
+        key = (version, name)
+        record = self._records.get(key)
+        if record is None:
+            record = Prospect.from_dict(self._collection.record(entry.offset))
+            self._records.put(key, record)
+        return record
+
+
+def open_prospect_store(path: Path, pack_path: Path = PACK_PATH) -> ProspectStore:
+    """Serve from the compiled pack when it matches ``path``, else from the JSON."""
+    pack = open_fresh_pack(path, pack_path)
+    if pack is not None:
+        return PackedProspectStore(path, pack)
+    return ProspectStore(path)
@@ -0,0 +1,194 @@
+"""Score and order the whole prospect roster in one vectorised pass.
+
+The roster is loaded once into a pandas frame: industry and stage as
+categoricals, ``annualRevenue`` parsed to a number, and the lengths of the
+list fields. A :class:`WeightingProfile` turns those columns into a score
+with a handful of NumPy operations, so ranking grows with the number of
+categories, not with a Python loop per prospect.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Iterable, Mapping, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from dealcast.datapack import iter_collection
+from dealcast.records import Scenario
+from dealcast.streaming import iter_prospects
+
+_REVENUE_UNITS = {"": 1.0, "K": 1e3, "M": 1e6, "B": 1e9, "T": 1e12}
+_WORD = re.compile(r"[a-z0-9]+")
+# Generic words that would otherwise match every industry to every show.
+_IGNORED_WORDS = frozenset("and for of the to in on with at by dealcast segment".split())
+
+DEFAULT_STAGE_WEIGHTS = {
+    "Seed": 0.0,
+    "Series A": 0.1,
+    "Series B": 0.25,
+    "Series C": 0.4,
+    "Series D": 0.5,
+    "Pre-IPO": 0.6,
+    "Public": 0.5,
+}
+
+
+class WeightingProfile(NamedTuple):
+    """Weights applied to the normalised roster columns."""
+
+    revenue: float = 1.0
+    triggers: float = 0.5
+    challenges: float = 0.25
+    stages: Mapping[str, float] = DEFAULT_STAGE_WEIGHTS
+    industries: Mapping[str, float] = {}
+
+
+DEFAULT_PROFILE = WeightingProfile()
+
+
+def parse_revenue(values: pd.Series) -> pd.Series:
+    """Parse revenue labels such as ``"62M"`` or ``"$1.2B"`` into floats (NaN if unparseable)."""
+    parts = values.astype("string").str.upper().str.replace(",", "", regex=False).str.extract(
+        r"([0-9]*\.?[0-9]+)(?:\s*[-–]\s*[0-9]*\.?[0-9]+)?\s*([KMBT]?)"
+    )
+    amount = pd.to_numeric(parts[0], errors="coerce").astype("float64")
+    unit = parts[1].fillna("").map(_REVENUE_UNITS).astype("float64")
+    return amount * unit
+
+
+def roster_frame(prospects: Iterable[dict]) -> pd.DataFrame:
+    """Columnar view of the roster, one row per company in file order."""
+    columns: dict[str, list] = {
+        "name": [], "industry": [], "stage": [], "revenue": [], "triggers": [], "challenges": [],
+    }
+    for prospect in prospects:
+        columns["name"].append(prospect["companyName"])
+        columns["industry"].append(prospect.get("industry"))
+        columns["stage"].append(prospect.get("growthStage"))
+        columns["revenue"].append(prospect.get("annualRevenue"))
+        columns["triggers"].append(len(prospect.get("buyingTriggers") or ()))
+        columns["challenges"].append(len(prospect.get("challenges") or ()))
+    frame = pd.DataFrame(columns).drop_duplicates("name", keep="last").reset_index(drop=True)
+    frame["industry"] = frame["industry"].astype("category")
+    frame["stage"] = frame["stage"].astype("category")
+    frame["revenue"] = parse_revenue(frame["revenue"])
+    frame["triggers"] = frame["triggers"].astype(np.int32)
+    frame["challenges"] = frame["challenges"].astype(np.int32)
+    return frame
+
+
+def _scaled(values: np.ndarray) -> np.ndarray:
+    """Min-max scale to 0..1; missing values score 0."""
+    values = values.astype(np.float64)
+    low, high = np.nanmin(values, initial=np.inf), np.nanmax(values, initial=-np.inf)
+    if not np.isfinite(low) or high <= low:
+        return np.zeros(len(values))
+    return np.nan_to_num((values - low) / (high - low), nan=0.0)
+
+
+def _category_weights(column: pd.Series, weights: Mapping[str, float]) -> np.ndarray:
+    codes = column.cat.codes.to_numpy()
+    # One lookup per category; the trailing 0 is where missing values (code -1) land.
+    table = np.array([weights.get(category, 0.0) for category in column.cat.categories] + [0.0])
+    return table[codes]
+
+
+def _words(text: str) -> set[str]:
+    return {word for word in _WORD.findall(text.casefold()) if len(word) > 2 and word not in _IGNORED_WORDS}
+
+
+def _scenario_text(scenario: Scenario) -> str:
+    intel = scenario.intel_scout_brief
+    parts = [scenario.session_context.get("segment"), intel.get("headline"), intel.get("why_now")]
+    parts.extend(signal.get("detail") for signal in intel.get("signal_stack", []))
+    parts.extend(snippet.title for snippet in scenario.knowledge_snippets)
+    return " ".join(part for part in parts if part)
+
+
+def text_words(text: str) -> set[str]:
+    """The distinctive words of ``text``, as show and industry matching compare them."""
+    return _words(text)
+
+
+def scenario_words(scenario: Scenario) -> set[str]:
+    """The distinctive words of a show's brief: segment, headline, signals, snippet titles."""
+    return _words(_scenario_text(scenario))
+
+
+class ProspectRanker:
+    """Scores every prospect of a roster file against weighting profiles."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.reload()
+
+    def reload(self) -> None:
+        frame = roster_frame(iter_collection(self.path, "prospects", iter_prospects))
+        names = frame["name"].to_numpy()
+        base = {
+            "revenue": _scaled(np.log1p(frame["revenue"].to_numpy())),
+            "triggers": _scaled(frame["triggers"].to_numpy()),
+            "challenges": _scaled(frame["challenges"].to_numpy()),
+        }
+        # One assignment so a concurrent ranking never mixes two rosters.
+        self._state = (frame, names, pd.Index(names), base)
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        return self._state[0]
+
+    def __len__(self) -> int:
+        return len(self._state[1])
+
+    def profile_for_scenario(self, scenario: Scenario | None, base: WeightingProfile = DEFAULT_PROFILE) -> WeightingProfile:
+        """Boost industries whose name shares words with the show's brief."""
+        if not scenario:
+            return base
+        show = scenario_words(scenario)
+        industries = dict(base.industries)
+        for industry in self.frame["industry"].cat.categories:
+            words = _words(industry)
+            if words:
+                industries[industry] = industries.get(industry, 0.0) + len(words & show) / len(words)
+        return base._replace(industries=industries)
+
+    @staticmethod
+    def _scores(state: tuple, profile: WeightingProfile) -> np.ndarray:
+        frame, _, _, base = state
+        return (
+            profile.revenue * base["revenue"]
+            + profile.triggers * base["triggers"]
+            + profile.challenges * base["challenges"]
+            + _category_weights(frame["stage"], profile.stages)
+            + _category_weights(frame["industry"], profile.industries)
+        )
+
+    def scores(self, profile: WeightingProfile = DEFAULT_PROFILE) -> np.ndarray:
+        """One score per roster row, in roster order."""
+        return self._scores(self._state, profile)
+
+    def top(self, profile: WeightingProfile = DEFAULT_PROFILE, limit: int | None = None) -> list[str]:
+        """Prospect names ordered best first; ties keep roster order."""
+        state = self._state
+        names, scores = state[1], self._scores(state, profile)
+        if limit is not None and limit <= 0:
+            return []
+        if limit is not None and limit < len(scores):
+            # Partition first so only the top ``limit`` rows are sorted.
+            candidates = np.argpartition(-scores, limit)[:limit]
+            order = candidates[np.lexsort((candidates, -scores[candidates]))]
+        else:
+            order = np.lexsort((np.arange(len(scores)), -scores))
+        return names[order].tolist()
+
+    def order(self, names: Iterable[str], profile: WeightingProfile = DEFAULT_PROFILE) -> list[str]:
+        """Sort an arbitrary subset of names (e.g. search hits) by score."""
+        state = self._state
+        names = list(names)
+        positions = state[2].get_indexer(names)
+        # Names missing from the roster (-1) sort last.
+        known = np.append(self._scores(state, profile), -np.inf)[positions]
+        return [names[position] for position in np.lexsort((np.arange(len(names)), -known))]
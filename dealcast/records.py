@@ -0,0 +1,155 @@
+"""Compact, immutable record types for prospects, snippets and scenarios.
+
+Records come out of ``json.loads`` as nested dicts, and a dict per
+prospect, persona, tech-stack lane map and snippet is most of what a
+worker holds once the roster and library are loaded. The stores convert
+each validated record (``dealcast.schema``) into these slotted frozen
+dataclasses instead: fixed attributes, no per-instance ``__dict__``,
+tuples instead of lists, and interned copies of the strings that repeat
+across the roster (industries, stages, headquarters, lane names, persona
+titles, snippet sources). Renderers read attributes; ``to_dict`` gives the
+contract's JSON shape back wherever a record leaves the process.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from sys import intern
+from typing import Any
+
+
+def _interned(value: str | None) -> str | None:
+    return intern(value) if value is not None else None
+
+
+def _compact(record: dict[str, Any]) -> dict[str, Any]:
+    """Drop optional members that were absent (None) on the way back to JSON."""
+    return {key: value for key, value in record.items() if value is not None}
+
+
+@dataclass(frozen=True, slots=True)
+class Persona:
+    name: str
+    title: str
+    bio: str | None = None
+
+    @classmethod
+    def from_dict(cls, record: dict) -> "Persona":
+        return cls(record["name"], intern(record["title"]), record.get("personaBio"))
+
+    def to_dict(self) -> dict:
+        return _compact({"name": self.name, "title": self.title, "personaBio": self.bio})
+
+
+@dataclass(frozen=True, slots=True)
+class Prospect:
+    name: str
+    industry: str | None
+    headquarters: str | None
+    revenue: str | None
+    stage: str | None
+    # (lane, value) pairs in file order; lanes are interned.
+    tech_stack: tuple[tuple[str, str], ...]
+    challenges: tuple[str, ...]
+    triggers: tuple[str, ...]
+    competitive_notes: tuple[str, ...]
+    personas: tuple[Persona, ...]
+
+    @classmethod
+    def from_dict(cls, record: dict) -> "Prospect":
+        return cls(
+            name=record["companyName"],
+            industry=_interned(record.get("industry")),
+            headquarters=_interned(record.get("headquarters")),
+            revenue=record.get("annualRevenue"),
+            stage=_interned(record.get("growthStage")),
+            tech_stack=tuple((intern(lane), value) for lane, value in record["techStack"].items()),
+            challenges=tuple(record["challenges"]),
+            triggers=tuple(record["buyingTriggers"]),
+            competitive_notes=tuple(record["competitiveNotes"]),
+            personas=tuple(Persona.from_dict(persona) for persona in record["personas"]),
+        )
+
+    def to_dict(self) -> dict:
+        return _compact(
+            {
+                "companyName": self.name,
+                "industry": self.industry,
+                "headquarters": self.headquarters,
+                "annualRevenue": self.revenue,
+                "growthStage": self.stage,
+                "techStack": dict(self.tech_stack),
+                "challenges": list(self.challenges),
+                "buyingTriggers": list(self.triggers),
+                "competitiveNotes": list(self.competitive_notes),
+                "personas": [persona.to_dict() for persona in self.personas],
+            }
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Snippet:
+    title: str
+    excerpt: str
+    id: str | None = None
+    source: str | None = None
+    url: str | None = None
+    type: str | None = None
+    freshness: str | None = None
+
+    @classmethod
+    def from_dict(cls, record: dict) -> "Snippet":
+        """From the contract shape (see ``dealcast.schema.normalize_snippet``)."""
+        return cls(
+            title=record["title"],
+            excerpt=record["excerpt"],
+            id=record.get("id"),
+            source=_interned(record.get("source")),
+            url=record.get("url"),
+            type=_interned(record.get("type")),
+            freshness=record.get("freshness"),
+        )
+
+    def to_dict(self) -> dict:
+        return _compact(
+            {
+                "id": self.id,
+                "source": self.source,
+                "type": self.type,
+                "title": self.title,
+                "excerpt": self.excerpt,
+                "url": self.url,
+                "freshness": self.freshness,
+            }
+        )
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Scenario:
+    """A scenario file. The three agent sections stay the parsed JSON objects
+    the prompt contract defines; only the snippets, which can run long, are
+    records."""
+
+    request_id: str
+    session_context: dict
+    knowledge_snippets: tuple[Snippet, ...]
+    intel_scout_brief: dict
+    playbook: dict
+    call_studio: dict
+
+    @classmethod
+    def from_dict(cls, record: dict, request_id: str | None = None) -> "Scenario":
+        context = record.get("session_context") or {}
+        return cls(
+            request_id=request_id or str(context.get("request_id") or ""),
+            session_context=context,
+            knowledge_snippets=tuple(Snippet.from_dict(snippet) for snippet in record.get("knowledge_snippets") or ()),
+            intel_scout_brief=record.get("intel_scout_brief") or {},
+            playbook=record.get("playbook") or {},
+            call_studio=record.get("call_studio") or {},
+        )
+
+    @property
+    def sections(self) -> tuple[dict, dict, dict]:
+        """The rendered sections, in panel order."""
+        return self.intel_scout_brief, self.playbook, self.call_studio
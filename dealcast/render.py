@@ -0,0 +1,457 @@
+"""One panel model for the Dash app and both static builders.
+
+Panels are built once, from records, as a tree of :class:`Node` objects
+and then emitted in whichever form the caller needs:
+
+* ``to_dash`` — Dash html components, for the app's callbacks;
+* ``to_html`` — HTML-escaped markup, for pages and fragments rendered at
+  build time;
+* ``to_json`` — compact ``[tag, class, children, attrs?]`` arrays that the
+  browser expands itself: into DOM nodes in the static bundles
+  (``CLIENT_RENDER_JS``), into Dash components in the app's clientside
+  mode (``assets/dealcast.js``).
+
+Every ``(tag, class)`` pair is compiled once into an :class:`Element`
+holding its opening and closing markup and its Dash component class, so
+emitting a tree only concatenates or instantiates. The styles for every
+class used here live in ``assets/dealcast.css``, which Dash serves and the
+static builders inline.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from html import escape
+from typing import Any, Callable, Iterable, NamedTuple, Sequence
+from urllib.parse import urlsplit
+
+from dash import html as dash_html
+
+from dealcast.citations import Citation
+from dealcast.records import Persona, Prospect, Scenario, Snippet
+
+
+class Element(NamedTuple):
+    """A compiled ``(tag, class)`` template."""
+
+    tag: str
+    class_name: str | None
+    # "<div class=\"x\"" without the closing ">", so attributes can follow.
+    prefix: str
+    start: str
+    end: str
+    component: type
+
+
+@lru_cache(maxsize=None)
+def element(tag: str, class_name: str | None = None) -> Element:
+    prefix = f"<{tag}" + (f' class="{escape(class_name)}"' if class_name else "")
+    return Element(tag, class_name, prefix, prefix + ">", f"</{tag}>", getattr(dash_html, tag.title()))
+
+
+class Node(NamedTuple):
+    element: Element
+    children: tuple
+    attrs: dict | None = None
+
+
+def _flatten(children: Iterable, out: list) -> list:
+    for child in children:
+        if child is None:
+            continue
+        if isinstance(child, (list, tuple)) and not isinstance(child, Node):
+            _flatten(child, out)
+        elif isinstance(child, (int, float)):
+            out.append(str(child))
+        else:
+            out.append(child)
+    return out
+
+
+def h(tag: str, class_name: str | None = None, *children: Any, **attrs: Any) -> Node:
+    """A node; ``children`` may be strings, nodes or (nested) lists of them, and None is skipped."""
+    return Node(element(tag, class_name), tuple(_flatten(children, [])), attrs or None)
+
+
+# ---------------------------------------------------------------- emitters
+
+
+def to_dash(node: Any) -> Any:
+    """Dash components for ``node``. Children that are neither nodes nor text
+    (the app's pager controls) are passed through unchanged."""
+    if not isinstance(node, Node):
+        return node
+    children = [to_dash(child) for child in node.children]
+    props = dict(node.attrs) if node.attrs else {}
+    if node.element.class_name:
+        props["className"] = node.element.class_name
+    if len(children) == 1 and isinstance(children[0], str):
+        return node.element.component(children[0], **props)
+    return node.element.component(children, **props)
+
+
+def _write_html(node: Any, write: Callable[[str], Any]) -> None:
+    if isinstance(node, str):
+        write(escape(node, quote=False))
+        return
+    if not isinstance(node, Node):
+        raise TypeError(f"cannot render {type(node).__name__} as HTML")
+    element = node.element
+    if node.attrs:
+        write(element.prefix + "".join(f' {name}="{escape(str(value))}"' for name, value in node.attrs.items()) + ">")
+    else:
+        write(element.start)
+    for child in node.children:
+        _write_html(child, write)
+    write(element.end)
+
+
+def to_html(node: Node | str | Sequence) -> str:
+    """HTML for ``node`` (or a list of nodes), with all text and attributes escaped."""
+    out: list[str] = []
+    for item in node if isinstance(node, list) else (node,):
+        _write_html(item, out.append)
+    return "".join(out)
+
+
+def to_json(node: Any) -> Any:
+    """``[tag, class, children]`` (plus ``attrs`` when set) for the browser-side expanders."""
+    if isinstance(node, str):
+        return node
+    if not isinstance(node, Node):
+        raise TypeError(f"cannot render {type(node).__name__} as JSON")
+    encoded = [node.element.tag, node.element.class_name, [to_json(child) for child in node.children]]
+    if node.attrs:
+        encoded.append(node.attrs)
+    return encoded
+
+
+# Static bundles: turns to_json output into DOM. Text goes through text
+# nodes, never innerHTML, so record contents cannot inject markup.
+CLIENT_RENDER_JS = """function renderNode(node) {
+      if (typeof node === 'string') {
+        return document.createTextNode(node);
+      }
+      const [tag, className, children, attrs] = node;
+      const element = document.createElement(tag);
+      if (className) {
+        element.className = className;
+      }
+      Object.entries(attrs || {}).forEach(([name, value]) => element.setAttribute(name, value));
+      children.forEach(child => element.appendChild(renderNode(child)));
+      return element;
+    }
+
+    async function hydrate(companyName) {
+      const panels = await loadProspect(companyName);
+      if (!panels || document.getElementById('prospect-select').value !== companyName) {
+        return;
+      }
+      Object.entries(panels).forEach(([id, node]) => document.getElementById(id).replaceChildren(renderNode(node)));
+    }"""
+
+
+# ---------------------------------------------------------------- building blocks
+
+
+def whole(list_id: str, items: Sequence, build: Callable[[Sequence], Node]) -> Node:
+    """The default for a panel's ``paged`` hook: every item at once."""
+    return build(items)
+
+
+def section(title: str, *body: Any) -> Node:
+    return h("div", None, h("div", "section-title", title), *body)
+
+
+def subheading(text: str) -> Node:
+    return h("div", "subheading", text)
+
+
+def container(panel_id: str, content: Any = None) -> Node:
+    """The card a panel is rendered into; the app and the static pages share its id and class."""
+    return h("div", "section-card", content, id=panel_id)
+
+
+# Snippet URLs come from the data drop; anything else (javascript:, data:) stays plain text.
+LINK_SCHEMES = {"", "http", "https"}
+
+
+def safe_href(url: str | None) -> str | None:
+    """``url`` when it is an http(s) or relative URL, else None."""
+    if not url:
+        return None
+    try:
+        # urlsplit drops the tabs, newlines and leading controls browsers ignore, as in "java\tscript:".
+        scheme = urlsplit(url.strip()).scheme
+    except ValueError:
+        return None
+    return url if scheme.lower() in LINK_SCHEMES else None
+
+
+def citation_chip(citation: Citation) -> Node:
+    snippet = citation.snippet
+    if snippet is None:
+        return h("span", "citation-chip citation-missing", citation.id, title="No knowledge snippet with this id")
+    label = snippet.title or citation.id
+    tooltip = " — ".join(part for part in (snippet.source, snippet.excerpt) if part)
+    href = safe_href(snippet.url)
+    if href:
+        return h("a", "citation-chip", label, href=href, target="_blank", title=tooltip)
+    return h("span", "citation-chip", label, title=tooltip)
+
+
+def cited(text: str | None, citations: Any = None) -> list:
+    """Text with its ``[src-id]`` tokens swapped for chips; ``citations`` is a ScenarioCitations."""
+    if citations is None or not text:
+        return [text]
+    return [citation_chip(part) if isinstance(part, Citation) else part for part in citations.parts(text)]
+
+
+def bullet_list(items: Iterable, citations: Any = None) -> Node:
+    return h("ul", "bullet-list", [h("li", None, cited(item, citations)) for item in items])
+
+
+def stat_grid(prospect: Prospect) -> Node:
+    stats = (
+        ("Industry", prospect.industry),
+        ("HQ", prospect.headquarters),
+        ("Revenue", prospect.revenue),
+        ("Stage", prospect.stage),
+    )
+    return h(
+        "div",
+        "stat-grid",
+        [h("div", "stat-card", h("div", "stat-label", label), h("div", "stat-value", value)) for label, value in stats],
+    )
+
+
+def persona_cards(personas: Iterable[Persona]) -> Node:
+    return h(
+        "div",
+        "persona-grid",
+        [
+            h(
+                "div",
+                "persona-card",
+                h("div", "persona-name", person.name),
+                h("div", "persona-title", person.title),
+                h("p", "persona-bio", person.bio),
+            )
+            for person in personas
+        ],
+    )
+
+
+def tech_stack_cards(stack: Iterable[tuple[str, str]]) -> Node:
+    return h(
+        "div",
+        "tech-grid",
+        [h("div", "tech-card", h("div", "tech-label", lane.title()), h("div", "tech-value", value)) for lane, value in stack],
+    )
+
+
+def snippet_card(snippet: Snippet) -> Node:
+    return h(
+        "div",
+        "snippet-card",
+        h("div", "snippet-title", snippet.title),
+        h("p", "snippet-body", snippet.excerpt),
+        h("div", "snippet-footnote", snippet.source),
+    )
+
+
+def snippet_cards(snippets: Iterable[Snippet]) -> Node:
+    return h("div", "snippet-grid", [snippet_card(snippet) for snippet in snippets])
+
+
+def signal_stack(signals: Iterable[dict], citations: Any = None) -> Node:
+    return h(
+        "ul",
+        "signal-stack",
+        [
+            h("li", None, h("span", "chip", signal["label"]), " ", h("span", "signal-detail", cited(signal["detail"], citations)))
+            for signal in signals
+        ],
+    )
+
+
+def talk_tracks(tracks: Iterable[dict], citations: Any = None) -> Node:
+    return h(
+        "div",
+        "talktrack-grid",
+        [
+            h(
+                "div",
+                "talktrack-card",
+                h("div", "talktrack-title", track["title"]),
+                bullet_list(track.get("beats", []), citations),
+                h("div", "overlay-tag", f"Overlay: {track.get('overlay')}"),
+            )
+            for track in tracks
+        ],
+    )
+
+
+def cta_blocks(ctas: Iterable[dict]) -> Node:
+    return h(
+        "div",
+        "cta-grid",
+        [
+            h(
+                "div",
+                "cta-card",
+                h("div", "cta-label", cta["label"]),
+                h("p", "cta-copy", cta.get("microcopy")),
+                h("div", "cta-asset", cta.get("asset")),
+            )
+            for cta in ctas
+        ],
+    )
+
+
+def host_script(rows: Iterable[dict], citations: Any = None) -> Node:
+    return h(
+        "div",
+        "script-table",
+        [
+            h(
+                "div",
+                "script-row",
+                h("div", "script-timestamp", row.get("timestamp")),
+                h("div", "script-copy", cited(row.get("copy"), citations)),
+                h("div", "script-delivery", row.get("delivery")),
+            )
+            for row in rows
+        ],
+    )
+
+
+def cue_sheet(cues: Iterable[dict]) -> Node:
+    return bullet_list(f"{cue.get('time')}: {cue.get('action')}" for cue in cues)
+
+
+def summary_cards(cards: Iterable[Any]) -> Node:
+    """Roster overview cards from ``dealcast.cards.CardSummary`` records."""
+    return h(
+        "div",
+        "summary-grid",
+        [
+            h(
+                "div",
+                "summary-card",
+                h("div", "summary-company", card.company),
+                h("div", "summary-meta", " · ".join(part for part in (card.industry, card.stage, card.revenue) if part)),
+                h("div", "summary-headline", card.headline),
+                h("div", "summary-signal", card.signal),
+            )
+            for card in cards
+        ],
+    )
+
+
+# ---------------------------------------------------------------- panels
+
+
+def render_company_meta(prospect: Prospect) -> Node:
+    return section("Company Capsule", stat_grid(prospect))
+
+
+def render_personas(prospect: Prospect) -> Node:
+    return section("Personas", persona_cards(prospect.personas))
+
+
+def render_tech_stack(prospect: Prospect) -> Node:
+    return section("Tech Stack", tech_stack_cards(prospect.tech_stack))
+
+
+def render_challenges(prospect: Prospect) -> Node:
+    return section("Challenges", bullet_list(prospect.challenges))
+
+
+def render_triggers(prospect: Prospect) -> Node:
+    return section("Buying Triggers", bullet_list(prospect.triggers))
+
+
+def render_competition(prospect: Prospect) -> Node:
+    return section("Competitive Notes", bullet_list(prospect.competitive_notes))
+
+
+# Panel id -> builder, in layout order. The ids are the containers' ids in
+# the app and in the static pages.
+PROSPECT_PANELS: dict[str, Callable[[Prospect], Node]] = {
+    "company-meta": render_company_meta,
+    "personas": render_personas,
+    "tech-stack": render_tech_stack,
+    "challenges": render_challenges,
+    "triggers": render_triggers,
+    "competition": render_competition,
+}
+
+
+def prospect_panels_json(prospect: Prospect) -> dict[str, Any]:
+    """Every prospect panel as to_json output, keyed by panel id."""
+    return {panel: to_json(render(prospect)) for panel, render in PROSPECT_PANELS.items()}
+
+
+def prospect_panels_html(prospect: Prospect) -> dict[str, str]:
+    """Every prospect panel as to_html output, keyed by panel id."""
+    return {panel: to_html(render(prospect)) for panel, render in PROSPECT_PANELS.items()}
+
+
+def render_snippet_feed(snippets: Sequence[Snippet], paged=whole) -> Node:
+    return section("Knowledge Snippets", paged("snippet-feed", snippets, snippet_cards))
+
+
+def render_intel(scenario: Scenario, citations: Any = None) -> Node:
+    intel = scenario.intel_scout_brief
+    children = [
+        h("div", "intel-headline", intel.get("headline")),
+        h("p", "intel-why", cited(intel.get("why_now"), citations)),
+        subheading("Signal Stack"),
+        signal_stack(intel.get("signal_stack", []), citations),
+        subheading("Risks"),
+        bullet_list(intel.get("risk_flags", []), citations),
+        subheading("Gaps"),
+        bullet_list(intel.get("gaps", []), citations),
+    ]
+    if citations is not None and citations.dangling:
+        children.append(h("div", "citation-warning", f"Unresolved citations: {', '.join(citations.dangling)}"))
+    return section("Intel Scout", children)
+
+
+def render_playbook(scenario: Scenario, citations: Any = None) -> Node:
+    playbook = scenario.playbook
+    return section(
+        "Playbook Crafter",
+        h("p", "intel-why", cited(playbook.get("opening_angle"), citations)),
+        subheading("Talk Tracks"),
+        talk_tracks(playbook.get("talk_tracks", []), citations),
+        subheading("CTA Blocks"),
+        cta_blocks(playbook.get("cta_blocks", [])),
+        subheading("Producer Notes"),
+        h("p", "intel-why", playbook.get("producer_notes")),
+    )
+
+
+def render_call_studio(scenario: Scenario, citations: Any = None, paged=whole) -> Node:
+    call = scenario.call_studio
+    return section(
+        "Call Studio",
+        subheading("Host Script"),
+        paged("host-script", call.get("host_script", []), lambda rows: host_script(rows, citations)),
+        subheading("Cue Sheet"),
+        paged("cue-sheet", call.get("cue_sheet", []), cue_sheet),
+        subheading("Safety Checks"),
+        bullet_list(call.get("safety_checks", [])),
+        subheading("Fallback"),
+        h("p", "intel-why", call.get("fallback_line")),
+    )
+
+
+def render_roster(cards: Sequence[Any], paged=whole) -> Node:
+    if not cards:
+        return section(
+            "Roster Overview",
+            h("p", "intel-why", "No summary cards yet. Run scripts/build_cards.py to derive them."),
+        )
+    return section(f"Roster Overview · {len(cards)} prospects", paged("roster-grid", cards, summary_cards))
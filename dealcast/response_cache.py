@@ -0,0 +1,157 @@
+"""On-disk cache of serialised Dash callback responses.
+
+Rehearsals replay the same (prospect, scenario) pairs over and over. The
+cache stores the JSON body Dash sent back the first time and answers the
+same request from SQLite before Dash builds a single component, so a hit
+costs one indexed read. The database is a plain file in WAL mode, so every
+worker process on the host shares it; entries are evicted least recently
+used once the stored bodies exceed the size budget.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from dealcast.config import CACHE_DIR
+
+UPDATE_PATH = "/_dash-update-component"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_used ON responses (used);
+"""
+
+
+def cache_key(*parts: Any) -> str:
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def source_version(paths: Iterable[Path]) -> str:
+    """Digest of the source files that build the cached responses.
+
+    The cache file outlives deploys; with this digest in every key, an
+    upgrade misses instead of serving markup the old code rendered.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(Path(path) for path in paths):
+        digest.update(path.name.encode("utf-8") + b"\0" + path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+class ResponseCache:
+    """Size-bounded LRU of response bodies in a SQLite file."""
+
+    def __init__(self, path: Path = CACHE_DIR / "responses.sqlite", max_bytes: int = 256 << 20):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as db:
+            db.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread and per process: connections must not
+        # cross threads or survive a fork into a gunicorn worker.
+        db = getattr(self._local, "db", None)
+        if db is None or self._local.pid != os.getpid():
+            db = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db, self._local.pid = db, os.getpid()
+        return db
+
+    def get(self, key: str) -> bytes | None:
+        db = self._connection()
+        row = db.execute("SELECT body FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        try:
+            db.execute("UPDATE responses SET used = ? WHERE key = ?", (time.time(), key))
+        except sqlite3.OperationalError:
+            pass  # another worker holds the write lock; recency is best effort
+        return row[0]
+
+    def put(self, key: str, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        db = self._connection()
+        try:
+            db.execute(
+                "INSERT OR REPLACE INTO responses (key, body, size, used) VALUES (?, ?, ?, ?)",
+                (key, body, len(body), time.time()),
+            )
+            self._evict(db)
+        except sqlite3.OperationalError:
+            pass
+
+    def _evict(self, db: sqlite3.Connection) -> None:
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Trim to 90% so a full cache does not evict on every insert.
+        excess = total - int(self.max_bytes * 0.9)
+        freed = 0
+        doomed = []
+        for key, size in db.execute("SELECT key, size FROM responses ORDER BY used"):
+            doomed.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        db.executemany("DELETE FROM responses WHERE key = ?", doomed)
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM responses")
+
+    def stats(self) -> dict:
+        count, size = self._connection().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        return {"entries": count, "bytes": size, "hits": self.hits, "misses": self.misses}
+
+
+def install_response_cache(server, cache: ResponseCache, key_for: Callable[[dict], str | None]) -> None:
+    """Serve Dash callback responses from ``cache`` on a Flask ``server``.
+
+    ``key_for`` receives the callback request body and returns a cache key,
+    or None for requests that must always reach Dash.
+    """
+    import flask
+
+    @server.before_request
+    def _serve_cached_response():
+        request = flask.request
+        if request.method != "POST" or not request.path.endswith(UPDATE_PATH):
+            return None
+        body = request.get_json(silent=True)
+        key = key_for(body) if isinstance(body, dict) else None
+        if key is None:
+            return None
+        cached = cache.get(key)
+        if cached is not None:
+            return flask.Response(cached, mimetype="application/json")
+        flask.g.response_cache_key = key
+        return None
+
+    @server.after_request
+    def _store_response(response):
+        key = flask.g.pop("response_cache_key", None)
+        if key is not None and response.status_code == 200 and not response.headers.get("Content-Encoding"):
+            cache.put(key, response.get_data())
+        return response
@@ -0,0 +1,245 @@
+"""Discover scenario files and load their bodies on demand.
+
+Each scenario JSON carries a ``session_context`` header. The registry reads
+only that member of every file (usually the first few hundred bytes) to
+build its index, persists the index so restarts only look at new or edited
+files, and parses full scenario bodies into a bounded LRU when a session
+actually selects them.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+import json
+import logging
+import mmap
+from pathlib import Path
+import re
+from typing import Iterable, NamedTuple
+
+from dealcast.cache import LRUCache
+from dealcast.config import CACHE_DIR, file_version
+from dealcast.datapack import DataPack
+from dealcast.jsonspan import SpanError, find_member
+from dealcast.records import Scenario
+from dealcast.schema import SCENARIO
+
+log = logging.getLogger(__name__)
+
+INDEX_FORMAT = 1
+# Request ids carry the air date: dc-2026-02-15-helio.
+_REQUEST_DATE = re.compile(r"(?<!\d)\d{4}-\d{2}-\d{2}(?!\d)")
+
+
+class ScenarioEntry(NamedTuple):
+    request_id: str
+    segment: str
+    host: str
+    target_duration_seconds: int | None
+    path: Path
+    version: tuple[int, int]
+
+    @property
+    def label(self) -> str:
+        return f"{self.segment} — {self.request_id} ({self.host})"
+
+    @property
+    def date(self) -> str | None:
+        """The ISO date in the request id, or None when it carries no valid one."""
+        match = _REQUEST_DATE.search(self.request_id)
+        try:
+            return date.fromisoformat(match.group()).isoformat() if match else None
+        except ValueError:
+            return None
+
+
+def read_session_context(path: Path, strict: bool = False) -> dict | None:
+    """Return the ``session_context`` of a scenario file without parsing the body.
+
+    A file that is empty or not a JSON object reads as "not a scenario"
+    (None), unless ``strict`` is set: then it raises SpanError.
+    """
+    with path.open("rb") as handle:
+        if path.stat().st_size == 0:
+            if strict:
+                raise SpanError("empty file")
+            return None
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            try:
+                span = find_member(buf, "session_context")
+            except SpanError:
+                if strict:
+                    raise
+                return None
+            if span is None:
+                return None
+            context = json.loads(buf[span[0]:span[1]])
+    return context if isinstance(context, dict) else None
+
+
+class ScenarioRegistry:
+    """Index of every scenario file in a directory, keyed by ``request_id``."""
+
+    def __init__(
+        self,
+        directory: Path,
+        exclude: Iterable[str] = (),
+        cache_size: int = 64,
+        index_dir: Path = CACHE_DIR,
+        pack: DataPack | None = None,
+    ):
+        self.directory = Path(directory)
+        self.exclude = frozenset(exclude)
+        self.pack = pack
+        self.index_path = Path(index_dir) / "scenarios.index.json"
+        self._bodies = LRUCache(cache_size)
+        # path name -> (version, session_context or None for non-scenario JSON)
+        self._headers: dict[str, tuple[tuple[int, int], dict | None]] = {}
+        self._entries: dict[str, ScenarioEntry] = {}
+        self.scan()
+
+    def _candidates(self) -> list[Path]:
+        return sorted(
+            path for path in self.directory.glob("*.json") if path.name not in self.exclude
+        )
+
+    def _read_index(self) -> dict[str, tuple[tuple[int, int], dict | None]]:
+        try:
+            payload = json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if payload.get("format") != INDEX_FORMAT or payload.get("directory") != str(self.directory):
+            return {}
+        return {name: (tuple(row["version"]), row["context"]) for name, row in payload["files"].items()}
+
+    def _write_index(self) -> None:
+        payload = {
+            "format": INDEX_FORMAT,
+            "directory": str(self.directory),
+            "files": {
+                name: {"version": list(version), "context": context}
+                for name, (version, context) in self._headers.items()
+            },
+        }
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(payload, ensure_ascii=False))
+            tmp.replace(self.index_path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _entry(path: Path, version: tuple[int, int], context: dict) -> ScenarioEntry:
+        return ScenarioEntry(
+            request_id=str(context.get("request_id") or path.stem),
+            segment=context.get("segment") or context.get("show_block") or "Unassigned",
+            host=context.get("host") or "Unassigned",
+            target_duration_seconds=context.get("target_duration_seconds"),
+            path=path,
+            version=version,
+        )
+
+    def _publish(self, headers: dict[str, tuple[tuple[int, int], dict | None]]) -> None:
+        entries: dict[str, ScenarioEntry] = {}
+        for name in sorted(headers):
+            version, context = headers[name]
+            if context is None:
+                continue
+            entry = self._entry(self.directory / name, version, context)
+            if entry.request_id in entries:
+                log.warning("Duplicate scenario %s in %s; keeping the later file", entry.request_id, name)
+            entries[entry.request_id] = entry
+        # Newest first: by the air date in the request id, then by file mtime;
+        # scenarios without a date follow the dated ones.
+        ordered = sorted(entries.values(), key=lambda entry: (entry.date or "", entry.version[0]), reverse=True)
+        self._headers, self._entries = headers, {entry.request_id: entry for entry in ordered}
+
+    def scan(self) -> None:
+        """Index every scenario file, reusing headers of files that did not change."""
+        known = self._headers or self._read_index()
+        headers = {}
+        for path in self._candidates():
+            version = file_version(path)
+            cached = known.get(path.name)
+            if cached and cached[0] == version:
+                headers[path.name] = cached
+            else:
+                headers[path.name] = (version, read_session_context(path))
+        dirty = headers != known
+        self._publish(headers)
+        if dirty:
+            self._write_index()
+
+    def refresh(self, path: Path) -> set[str]:
+        """Reindex one file and return the request ids whose content may have changed."""
+        path = Path(path)
+        if path.name in self.exclude:
+            return set()
+        before = {rid for rid, entry in self._entries.items() if entry.path.name == path.name}
+        headers = dict(self._headers)
+        body = None
+        if path.exists():
+            version, context = file_version(path), read_session_context(path)
+            if context is not None:
+                # Check the whole drop before publishing it; a SchemaError
+                # leaves the previous entry (and its cached body) in place.
+                body = SCENARIO.validate(json.loads(path.read_bytes()), path)
+            headers[path.name] = (version, context)
+        else:
+            headers.pop(path.name, None)
+        self._publish(headers)
+        self._write_index()
+        after = {rid for rid, entry in self._entries.items() if entry.path.name == path.name}
+        for request_id in before | after:
+            self._bodies.discard(request_id)
+        for request_id in after:
+            entry = self._entries[request_id]
+            if body is not None and entry.version == version:
+                self._bodies.put(request_id, (entry.version, Scenario.from_dict(body, request_id)))
+        return before | after
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, request_id: object) -> bool:
+        return request_id in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    @property
+    def default(self) -> str:
+        return next(iter(self._entries))
+
+    def entry(self, request_id: str) -> ScenarioEntry | None:
+        return self._entries.get(request_id)
+
+    def entries(self, segment: str | None = None, host: str | None = None) -> list[ScenarioEntry]:
+        return [
+            entry
+            for entry in self._entries.values()
+            if (not segment or entry.segment == segment) and (not host or entry.host == host)
+        ]
+
+    def segments(self) -> list[str]:
+        return sorted({entry.segment for entry in self._entries.values()})
+
+    def hosts(self) -> list[str]:
+        return sorted({entry.host for entry in self._entries.values()})
+
+    def get(self, request_id: str) -> Scenario | None:
+        entry = self._entries.get(request_id)
+        if entry is None:
+            return None
+        cached = self._bodies.get(request_id)
+        if cached is not None and cached[0] == entry.version:
+            return cached[1]
+        scenario = None
+        if self.pack is not None and self.pack.source_version(entry.path.name) == entry.version:
+            scenario = self.pack.collection("scenarios").get(request_id)
+        if scenario is None:
+            scenario = SCENARIO.validate(json.loads(entry.path.read_bytes()), entry.path)
+        scenario = Scenario.from_dict(scenario, request_id)
+        self._bodies.put(request_id, (entry.version, scenario))
+        return scenario
@@ -0,0 +1,275 @@
+"""Validate prospect, snippet and scenario records before they reach a renderer.
+
+The shapes follow the data contract in ``dealcast-agent-prompts.md``. Each
+schema is written as a small literal and compiled once, at import, into
+nested closures, so checking a record is a walk over prebuilt checks
+rather than a reinterpretation of the schema. Unknown keys are allowed;
+the contract grows.
+
+Schema literals:
+
+* a type (``str``, ``int``) matches that type (``bool`` is not an ``int``);
+* ``(spec, None)`` also accepts null;
+* ``[spec]`` is a list whose items match ``spec``;
+* ``{"key": spec, "key?": spec}`` is an object with required and optional
+  (``?``) keys;
+* ``MapOf(spec)`` is an object with arbitrary keys and ``spec`` values.
+
+Knowledge snippets come in two shapes: the contract's ``excerpt``/``source``
+and the library's older ``snippet``/``path``. ``normalize_snippet`` folds
+both into the contract shape as records load, so nothing downstream has to
+care which one a file used.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, NamedTuple
+
+from dealcast.streaming import iter_documents, iter_prospects
+
+Check = Callable[[Any, str, list], None]
+
+
+class MapOf(NamedTuple):
+    values: Any
+
+
+class Issue(NamedTuple):
+    """One problem: which record (number and name, when known) and where in it."""
+
+    record: int
+    name: str | None
+    field: str
+    message: str
+
+    def __str__(self) -> str:
+        where = f"record {self.record}" + (f" ({self.name})" if self.name else "")
+        return f"{where}: {self.field or '<record>'}: {self.message}"
+
+
+class SchemaError(ValueError):
+    """Raised when records in ``source`` do not match their schema."""
+
+    def __init__(self, source: Path | str, issues: list[Issue]):
+        self.source = source
+        self.issues = issues
+        lines = "\n".join(f"  {issue}" for issue in issues)
+        super().__init__(f"{source}: {len(issues)} schema problem(s)\n{lines}")
+
+
+def _type_name(value: Any) -> str:
+    return "null" if value is None else type(value).__name__
+
+
+def compile_schema(spec: Any) -> Check:
+    """Turn a schema literal into ``check(value, path, issues)``."""
+    if spec is int:
+        def check(value, path, issues):
+            if type(value) is not int:
+                issues.append((path, f"expected int, got {_type_name(value)}"))
+        return check
+    if isinstance(spec, type):
+        def check(value, path, issues):
+            if not isinstance(value, spec):
+                issues.append((path, f"expected {spec.__name__}, got {_type_name(value)}"))
+        return check
+    if isinstance(spec, MapOf):
+        values = compile_schema(spec.values)
+
+        def check(value, path, issues):
+            if not isinstance(value, dict):
+                issues.append((path, f"expected object, got {_type_name(value)}"))
+                return
+            for key, entry in value.items():
+                values(entry, f"{path}.{key}" if path else key, issues)
+        return check
+    if isinstance(spec, tuple):
+        inner = compile_schema(spec[0])
+
+        def check(value, path, issues):
+            if value is not None:
+                inner(value, path, issues)
+        return check
+    if isinstance(spec, list):
+        item = compile_schema(spec[0])
+
+        def check(value, path, issues):
+            if not isinstance(value, list):
+                issues.append((path, f"expected list, got {_type_name(value)}"))
+                return
+            for position, entry in enumerate(value):
+                item(entry, f"{path}[{position}]", issues)
+        return check
+    if isinstance(spec, dict):
+        required = tuple((key, compile_schema(value)) for key, value in spec.items() if not key.endswith("?"))
+        optional = tuple((key[:-1], compile_schema(value)) for key, value in spec.items() if key.endswith("?"))
+
+        def check(value, path, issues):
+            if not isinstance(value, dict):
+                issues.append((path, f"expected object, got {_type_name(value)}"))
+                return
+            prefix = f"{path}." if path else ""
+            for key, field in required:
+                if key not in value:
+                    issues.append((prefix + key, "missing"))
+                else:
+                    field(value[key], prefix + key, issues)
+            for key, field in optional:
+                if key in value:
+                    field(value[key], prefix + key, issues)
+        return check
+    raise TypeError(f"not a schema literal: {spec!r}")
+
+
+def normalize_snippet(record: Any) -> Any:
+    """The contract shape of a snippet: ``excerpt`` and ``source``, never ``snippet``/``path``."""
+    if not isinstance(record, dict) or ("snippet" not in record and "path" not in record):
+        return record
+    snippet = {key: value for key, value in record.items() if key not in ("snippet", "path")}
+    snippet.setdefault("excerpt", record.get("snippet"))
+    snippet.setdefault("source", record.get("path"))
+    return snippet
+
+
+def normalize_scenario(record: Any) -> Any:
+    snippets = record.get("knowledge_snippets") if isinstance(record, dict) else None
+    if not isinstance(snippets, list):
+        return record
+    return {**record, "knowledge_snippets": [normalize_snippet(snippet) for snippet in snippets]}
+
+
+class Schema:
+    """A compiled schema plus how to normalize and name its records."""
+
+    def __init__(
+        self,
+        name: str,
+        spec: Any,
+        normalize: Callable[[Any], Any] | None = None,
+        label: Callable[[Any], str | None] | None = None,
+    ):
+        self.name = name
+        self._check = compile_schema(spec)
+        self._normalize = normalize
+        self._label = label
+
+    def issues(self, record: Any, number: int = 0) -> list[Issue]:
+        found: list[tuple[str, str]] = []
+        self._check(record, "", found)
+        if not found:
+            return []
+        name = self._label(record) if self._label and isinstance(record, dict) else None
+        return [Issue(number, name, field, message) for field, message in found]
+
+    def validate(self, record: Any, source: Path | str = "<record>", number: int = 0) -> Any:
+        """The normalized record, or SchemaError."""
+        if self._normalize is not None:
+            record = self._normalize(record)
+        issues = self.issues(record, number)
+        if issues:
+            raise SchemaError(source, issues)
+        return record
+
+    def stream(self, records: Iterable[Any], source: Path | str, max_issues: int = 1) -> Iterator[Any]:
+        """Normalize and check ``records`` in one pass, yielding each good record.
+
+        Raises SchemaError as soon as ``max_issues`` problems have been seen
+        (the first bad record, by default), or at the end if fewer turned up.
+        """
+        collected: list[Issue] = []
+        normalize = self._normalize
+        for number, record in enumerate(records):
+            if normalize is not None:
+                record = normalize(record)
+            issues = self.issues(record, number)
+            if issues:
+                collected.extend(issues)
+                if len(collected) >= max_issues:
+                    raise SchemaError(source, collected[:max_issues])
+                continue
+            yield record
+        if collected:
+            raise SchemaError(source, collected)
+
+
+_OPTIONAL_TEXT = (str, None)
+
+SNIPPET_SPEC = {
+    "id?": str,
+    "title": str,
+    "excerpt": str,
+    "source?": _OPTIONAL_TEXT,
+    "type?": _OPTIONAL_TEXT,
+    "url?": _OPTIONAL_TEXT,
+    "freshness?": _OPTIONAL_TEXT,
+}
+
+SNIPPET = Schema(
+    "snippet",
+    SNIPPET_SPEC,
+    normalize=normalize_snippet,
+    label=lambda record: record.get("id") or record.get("title"),
+)
+
+PROSPECT = Schema(
+    "prospect",
+    {
+        "companyName": str,
+        "industry?": str,
+        "headquarters?": str,
+        "annualRevenue?": str,
+        "growthStage?": str,
+        "techStack": MapOf(str),
+        "challenges": [str],
+        "buyingTriggers": [str],
+        "competitiveNotes": [str],
+        "personas": [{"name": str, "title": str, "personaBio?": _OPTIONAL_TEXT}],
+    },
+    label=lambda record: record.get("companyName"),
+)
+
+SCENARIO = Schema(
+    "scenario",
+    {
+        "session_context": {
+            "request_id?": str,
+            "segment?": _OPTIONAL_TEXT,
+            "show_block?": _OPTIONAL_TEXT,
+            "host?": _OPTIONAL_TEXT,
+            "target_duration_seconds?": (int, None),
+        },
+        "knowledge_snippets?": [SNIPPET_SPEC],
+        "intel_scout_brief?": {
+            "headline": str,
+            "why_now": str,
+            "signal_stack": [{"label": str, "detail": str}],
+            "risk_flags": [str],
+            "gaps": [str],
+        },
+        "playbook?": {
+            "opening_angle": str,
+            "talk_tracks": [{"title": str, "beats": [str], "overlay?": _OPTIONAL_TEXT}],
+            "cta_blocks": [{"label": str, "microcopy?": _OPTIONAL_TEXT, "asset?": _OPTIONAL_TEXT}],
+            "producer_notes?": _OPTIONAL_TEXT,
+        },
+        "call_studio?": {
+            "host_script": [{"timestamp": str, "copy": str, "delivery?": _OPTIONAL_TEXT}],
+            "cue_sheet": [{"time": str, "action": str}],
+            "safety_checks?": [str],
+            "fallback_line?": _OPTIONAL_TEXT,
+        },
+    },
+    normalize=normalize_scenario,
+    label=lambda record: (record.get("session_context") or {}).get("request_id"),
+)
+
+
+def iter_valid_prospects(path: Path, max_issues: int = 1) -> Iterator[dict]:
+    """Stream ``prospects.json``, rejecting it at the first bad record."""
+    return PROSPECT.stream(iter_prospects(path), path, max_issues)
+
+
+def iter_valid_snippets(path: Path, max_issues: int = 1) -> Iterator[dict]:
+    """Stream the snippet library in the contract shape, rejecting it at the first bad record."""
+    return SNIPPET.stream(iter_documents(path), path, max_issues)
@@ -0,0 +1,138 @@
+"""Split the prospect roster into fixed-size JSON shards for static hosting.
+
+The static bundles fetch ``prospects-index.<hash>.json`` (names plus the
+summary fields the selector needs) up front and pull a shard only when one
+of its prospects is opened, so page weight does not grow with the roster.
+Shards are named by their content hash and the index lists those names, so
+every data file can be cached indefinitely; a changed roster publishes new
+names instead of rewriting old ones.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from string import Template
+from typing import Any, Callable, Iterable
+
+from dealcast.assets import content_hash
+from dealcast.records import Prospect
+
+INDEX_STEM = "prospects-index"
+SHARD_DIR = "shards"
+
+# Browser side of the format. The loader defines loadProspect(name) -> Promise
+# and caches each shard after its first fetch; the boot script fills the
+# #prospect-select element from the index and hydrates the first prospect.
+_LOADER_JS = Template(
+    """const DATA_ROOT = '$data_root';
+    const SHARDS = new Map();
+    let PROSPECT_INDEX = {};
+    function loadShard(file) {
+      if (!SHARDS.has(file)) {
+        SHARDS.set(file, fetch(DATA_ROOT + '/$shard_dir/' + file).then(response => response.json()));
+      }
+      return SHARDS.get(file);
+    }
+    const loadProspect = async (companyName) => (await loadShard(PROSPECT_INDEX[companyName].shard))[companyName];"""
+)
+
+_BOOT_JS = Template(
+    """const selector = document.getElementById('prospect-select');
+    selector.addEventListener('change', (event) => hydrate(event.target.value));
+    fetch(DATA_ROOT + '/' + $index_name)
+      .then(response => response.json())
+      .then(({ prospects }) => {
+        PROSPECT_INDEX = Object.fromEntries(prospects.map(entry => [entry.name, entry]));
+        prospects.forEach(entry => selector.add(new Option(entry.name, entry.name)));
+        hydrate(prospects[0].name);
+      });"""
+)
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _write_new(path: Path, data: bytes) -> bool:
+    """Write a content-named file unless it already exists; the name vouches for the bytes."""
+    if path.exists() and path.stat().st_size == len(data):
+        return False
+    path.write_bytes(data)
+    return True
+
+
+def _prune(directory: Path, pattern: str, keep: set[str]) -> None:
+    """Delete files matching ``pattern`` (and their .gz/.br siblings) whose base name is not in ``keep``."""
+    for path in directory.glob(pattern):
+        if path.name.removesuffix(".gz").removesuffix(".br") not in keep:
+            path.unlink()
+
+
+def write_shards(
+    prospects: Iterable[Prospect],
+    out_dir: Path,
+    shard_size: int = 1,
+    payload: Callable[[Prospect], Any] = Prospect.to_dict,
+) -> dict:
+    """Write the index and shard files under ``out_dir``; return a summary.
+
+    ``shard_size=1`` writes one file per prospect. ``payload`` is what a shard
+    holds per prospect: the record itself by default, or the pre-built panels
+    (``dealcast.render.prospect_panels_json``) the static bundles draw.
+    Unchanged files are not rewritten and files of earlier rosters are
+    removed. The summary's ``index`` is the index file name to hand to
+    ``client_boot_js``.
+    """
+    if shard_size < 1:
+        raise ValueError("shard_size must be at least 1")
+    shard_dir = out_dir / SHARD_DIR
+    shard_dir.mkdir(parents=True, exist_ok=True)
+
+    index: list[dict] = []
+    # Index entries of the shard being filled; its file name is known once it is full.
+    pending: list[dict] = []
+    shard: dict[str, Any] = {}
+    files: list[str] = []
+    written = 0
+
+    def flush() -> None:
+        nonlocal written
+        data = _encode(shard)
+        name = f"{content_hash(data)}.json"
+        written += _write_new(shard_dir / name, data)
+        files.append(name)
+        for entry in pending:
+            entry["shard"] = name
+        pending.clear()
+        shard.clear()
+
+    for prospect in prospects:
+        entry = {
+            "name": prospect.name,
+            "industry": prospect.industry,
+            "stage": prospect.stage,
+            "revenue": prospect.revenue,
+        }
+        index.append(entry)
+        pending.append(entry)
+        shard[prospect.name] = payload(prospect)
+        if len(shard) == shard_size:
+            flush()
+    if shard:
+        flush()
+
+    data = _encode({"shardSize": shard_size, "prospects": index})
+    index_name = f"{INDEX_STEM}.{content_hash(data)}.json"
+    written += _write_new(out_dir / index_name, data)
+    _prune(shard_dir, "*", set(files))
+    _prune(out_dir, f"{INDEX_STEM}*", {index_name})
+    return {"prospects": len(index), "shards": len(files), "written": written, "index": index_name}
+
+
+def client_loader_js(data_root: str) -> str:
+    return _LOADER_JS.substitute(data_root=data_root, shard_dir=SHARD_DIR)
+
+
+def client_boot_js(index_name: str) -> str:
+    return _BOOT_JS.substitute(index_name=json.dumps(index_name))
@@ -0,0 +1,157 @@
+"""Ranked full-text retrieval over the knowledge snippet library.
+
+An inverted index over each document's ``title`` and ``excerpt`` text,
+scored with BM25. Documents are validated and normalized to the contract
+shape (``dealcast.schema``) as they load and kept as ``Snippet`` records.
+The per-document term counts are persisted next to the other caches and
+keyed by a content hash, so when the snippet file changes only new or
+edited documents are tokenised again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Iterable
+
+from dealcast.config import CACHE_DIR, file_version
+from dealcast.datapack import iter_collection
+from dealcast.records import Prospect, Snippet
+from dealcast.schema import iter_valid_snippets
+
+INDEX_FORMAT = 1
+TEXT_FIELDS = ("title", "excerpt")
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:[.+#][a-z0-9]+)*")
+_STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have in into is it its of on or our "
+    "that the their this to was were will with across new needs current upcoming".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    return [token for token in _TOKEN.findall(text.casefold()) if len(token) > 1 and token not in _STOPWORDS]
+
+
+def document_text(document: dict) -> str:
+    return " ".join(str(document.get(field) or "") for field in TEXT_FIELDS)
+
+
+def document_key(document: dict) -> str:
+    """Content hash of a document; unchanged documents keep their term counts."""
+    payload = json.dumps(document, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()
+
+
+def prospect_query(prospect: Prospect) -> str:
+    """Query text for a prospect: industry, tech stack, challenges and buying triggers."""
+    parts = [prospect.industry or ""]
+    parts.extend(value for _, value in prospect.tech_stack)
+    parts.extend(prospect.challenges)
+    parts.extend(prospect.triggers)
+    return " ".join(parts)
+
+
+class SnippetIndex:
+    """BM25 index over a snippet file, reloaded in place when the file changes."""
+
+    def __init__(self, path: Path, index_dir: Path = CACHE_DIR, k1: float = 1.2, b: float = 0.75):
+        self.path = Path(path)
+        self.index_path = Path(index_dir) / f"{self.path.stem}.index.json"
+        self.k1 = k1
+        self.b = b
+        self._counts: dict[str, dict[str, int]] = {}
+        self._load()
+
+    def _read_index(self) -> dict[str, dict[str, int]]:
+        try:
+            payload = json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if payload.get("format") != INDEX_FORMAT:
+            return {}
+        return payload["documents"]
+
+    def _write_index(self, version: tuple[int, int], counts: dict[str, dict[str, int]]) -> None:
+        payload = {"format": INDEX_FORMAT, "version": list(version), "documents": counts}
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+            tmp.replace(self.index_path)
+        except OSError:
+            pass
+
+    def _load(self) -> None:
+        version = file_version(self.path)
+        known = self._counts or self._read_index()
+        documents: list[Snippet] = []
+        counts: dict[str, dict[str, int]] = {}
+        keys: list[str] = []
+        for document in iter_collection(self.path, "documents", iter_valid_snippets):
+            key = document_key(document)
+            if key not in counts:
+                counts[key] = known.get(key) or dict(Counter(tokenize(document_text(document))))
+            documents.append(Snippet.from_dict(document))
+            keys.append(key)
+
+        postings: dict[str, list[tuple[int, int]]] = {}
+        lengths = []
+        for number, key in enumerate(keys):
+            terms = counts[key]
+            lengths.append(sum(terms.values()))
+            for term, count in terms.items():
+                postings.setdefault(term, []).append((number, count))
+
+        if counts.keys() != known.keys():
+            self._write_index(version, counts)
+        average = (sum(lengths) / len(lengths)) if lengths else 0.0
+        # One assignment so concurrent searches never see a half-built index.
+        self._state = (version, documents, postings, lengths, average)
+        self._counts = counts
+
+    def reload(self) -> None:
+        self._load()
+
+    @property
+    def version(self) -> tuple[int, int]:
+        return self._state[0]
+
+    @property
+    def documents(self) -> list[Snippet]:
+        return self._state[1]
+
+    def __len__(self) -> int:
+        return len(self._state[1])
+
+    def _scores(self, state: tuple, terms: Iterable[str]) -> dict[int, float]:
+        _, documents, postings, lengths, average = state
+        total = len(documents)
+        scores: dict[int, float] = {}
+        for term, weight in Counter(terms).items():
+            matches = postings.get(term)
+            if not matches:
+                continue
+            idf = math.log(1 + (total - len(matches) + 0.5) / (len(matches) + 0.5))
+            for number, count in matches:
+                norm = self.k1 * (1 - self.b + self.b * lengths[number] / average)
+                scores[number] = scores.get(number, 0.0) + weight * idf * count * (self.k1 + 1) / (count + norm)
+        return scores
+
+    def search(self, query: str, limit: int = 12) -> list[Snippet]:
+        """The ``limit`` best-matching documents for ``query``, best first."""
+        state = self._state
+        documents = state[1]
+        scores = self._scores(state, tokenize(query))
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [documents[number] for number, _ in best]
+
+    def for_prospect(self, prospect: Prospect | None, limit: int = 12) -> list[Snippet]:
+        """Top snippets for a prospect, or the first ``limit`` when nothing matches."""
+        ranked = self.search(prospect_query(prospect), limit) if prospect else []
+        return ranked or self.documents[:limit]
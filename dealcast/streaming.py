@@ -0,0 +1,137 @@
+"""Stream records out of large JSON exports one at a time.
+
+``prospects.json`` and ``knowledge-snippets.json`` are a single object
+wrapping one big array (``{"prospects": [...]}``). The reader here pulls the
+file in fixed-size chunks through an incremental UTF-8 decoder and decodes
+one array item at a time with ``json.JSONDecoder.raw_decode``, so memory is
+bounded by the largest record rather than by the file.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+from pathlib import Path
+from typing import Any, Iterator
+
+CHUNK_SIZE = 1 << 16
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]}:"
+
+
+class _ChunkedReader:
+    def __init__(self, handle, chunk_size: int):
+        self._handle = handle
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._chunk_size = chunk_size
+        self._json = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size: int | None = None) -> bool:
+        """Append the next chunk to the buffer; return False at end of file."""
+        if self.eof:
+            return False
+        # Drop what has been consumed so the buffer stays around one record.
+        if self.pos > self._chunk_size:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        data = self._handle.read(size or self._chunk_size)
+        if not data:
+            self.buffer += self._decoder.decode(b"", final=True)
+            self.eof = True
+            return False
+        self.buffer += self._decoder.decode(data)
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, token: str) -> None:
+        found = self.peek()
+        if found != token:
+            raise ValueError(f"expected {token!r}, found {found or 'end of file'!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value, reading more input as needed."""
+        self.peek()
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = self._json.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill(size):
+                    raise
+                size *= 2
+                continue
+            # A number cut at the chunk edge ("12" of "12.5") decodes fine on
+            # its own; only accept a value once a delimiter follows it.
+            truncated = end == len(self.buffer) or self.buffer[end] not in _DELIMITERS
+            if truncated and not self.eof and self.fill(size):
+                continue
+            self.pos = end
+            return value
+
+    def skip_array(self) -> None:
+        for _ in self.items():
+            pass
+
+    def items(self) -> Iterator[Any]:
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            token = self.peek()
+            self.pos += 1
+            if token == "]":
+                return
+            if token != ",":
+                raise ValueError(f"expected ',' or ']', found {token or 'end of file'!r}")
+
+
+def iter_records(path: Path, key: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """Yield each item of the top-level array ``key`` in ``path``.
+
+    Members before ``key`` are skipped without being kept (arrays item by
+    item). A missing ``key`` yields nothing.
+    """
+    with Path(path).open("rb") as handle:
+        reader = _ChunkedReader(handle, chunk_size)
+        reader.expect("{")
+        if reader.peek() == "}":
+            return
+        while True:
+            member = reader.value()
+            reader.expect(":")
+            if member == key:
+                yield from reader.items()
+                return
+            if reader.peek() == "[":
+                reader.skip_array()
+            else:
+                reader.value()
+            token = reader.peek()
+            reader.pos += 1
+            if token == "}":
+                return
+            if token != ",":
+                raise ValueError(f"expected ',' or '}}', found {token or 'end of file'!r}")
+
+
+def iter_prospects(path: Path) -> Iterator[dict]:
+    return iter_records(path, "prospects")
+
+
+def iter_documents(path: Path) -> Iterator[dict]:
+    return iter_records(path, "documents")
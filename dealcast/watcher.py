@@ -0,0 +1,123 @@
+"""Background reloading of the JSON data drops under ``data/``.
+
+A single daemon thread polls file versions (mtime + size) and calls the
+handler registered for each changed file, so only that file is reparsed.
+Handlers are expected to build the new structure first and then publish it
+with one assignment, and to record the version they loaded in
+:class:`DataVersions` so render caches keyed on it stop serving stale
+fragments.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import logging
+import os
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Callable
+
+from dealcast.config import file_version
+
+log = logging.getLogger(__name__)
+
+Handler = Callable[[Path], None]
+
+
+class DataVersions:
+    """The file version (mtime_ns, size) each source was last loaded from.
+
+    Unlike reload counters these agree across worker processes: every worker
+    that serves the same files reports the same snapshot, including one that
+    just restarted, and a worker whose reload failed reports the data it
+    still serves.
+    """
+
+    def __init__(self):
+        self._versions: dict[str, tuple[int, int]] = {}
+        self._lock = Lock()
+
+    def __getitem__(self, source: str) -> tuple[int, int] | None:
+        return self._versions.get(source)
+
+    def set(self, source: str, version: tuple[int, int] | None) -> None:
+        """Record a successful (re)load of ``source``; None drops a removed source."""
+        with self._lock:
+            versions = dict(self._versions)
+            if version is None:
+                versions.pop(source, None)
+            else:
+                versions[source] = tuple(version)
+            self._versions = versions
+
+    def snapshot(self) -> dict[str, list[int]]:
+        """JSON-ready versions, as the browser-side data-version store holds them."""
+        return {source: list(version) for source, version in self._versions.items()}
+
+
+class DataWatcher:
+    """Poll a directory and dispatch changed files to their handlers."""
+
+    def __init__(self, directory: Path, interval: float = 1.0):
+        self.directory = Path(directory)
+        self.interval = interval
+        self._handlers: list[tuple[str, Handler]] = []
+        self._seen: dict[Path, tuple[int, int]] = {}
+        self._stop = Event()
+        self._thread: Thread | None = None
+
+    def on(self, pattern: str, handler: Handler) -> None:
+        """Call ``handler(path)`` when a file matching ``pattern`` changes."""
+        self._handlers.append((pattern, handler))
+
+    def _handler_for(self, name: str) -> Handler | None:
+        for pattern, handler in self._handlers:
+            if fnmatch.fnmatch(name, pattern):
+                return handler
+        return None
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        versions = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file() and self._handler_for(entry.name):
+                    path = Path(entry.path)
+                    try:
+                        versions[path] = file_version(path)
+                    except FileNotFoundError:
+                        continue
+        return versions
+
+    def poll(self) -> list[Path]:
+        """Dispatch every file added, changed or removed since the last poll."""
+        current = self._scan()
+        changed = [path for path, version in current.items() if self._seen.get(path) != version]
+        changed += [path for path in self._seen if path not in current]
+        self._seen = current
+        for path in changed:
+            handler = self._handler_for(path.name)
+            try:
+                handler(path)
+            except Exception:
+                # Usually a file caught mid-write; the finished write bumps
+                # the mtime again and we retry on that poll.
+                log.exception("Reload of %s failed; keeping previous data", path)
+        return changed
+
+    def start(self) -> "DataWatcher":
+        if self._thread is not None:
+            return self
+        self._seen = self._scan()
+        self._thread = Thread(target=self._run, name="dealcast-data-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except OSError:
+                log.exception("Polling %s failed", self.directory)
@@ -0,0 +1,44 @@
+"""gunicorn settings for the DealCast control surface.
+
+    pip install -r requirements-prod.txt
+    gunicorn -c gunicorn.conf.py
+
+DEALCAST_BIND, DEALCAST_WORKERS and DEALCAST_THREADS override the defaults.
+"""
+
+import gc
+import multiprocessing
+import os
+
+from dealcast.config import METRICS_ENABLED
+from dealcast.metrics import configure_logging
+
+wsgi_app = "wsgi:server"
+bind = os.environ.get("DEALCAST_BIND", "0.0.0.0:8050")
+workers = int(os.environ.get("DEALCAST_WORKERS", multiprocessing.cpu_count()))
+threads = int(os.environ.get("DEALCAST_THREADS", "4"))
+worker_class = "gthread"
+# Load the app (and all data) in the master before forking.
+preload_app = True
+timeout = 60
+keepalive = 5
+accesslog = "-"
+
+# gunicorn sets up only its own loggers; the per-callback and data-load lines
+# go to dealcast.metrics and need a handler before the app is preloaded.
+if METRICS_ENABLED:
+    configure_logging()
+
+
+def when_ready(server):
+    # Move everything loaded so far out of the collector's reach; otherwise
+    # the first collection in each worker touches every object and turns the
+    # shared pages into private copies.
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    # Threads do not survive fork, so each worker runs its own watcher.
+    from wsgi import start_data_watcher
+
+    start_data_watcher()
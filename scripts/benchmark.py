@@ -0,0 +1,350 @@
+"""Benchmark the load, render and export hot paths on synthetic data.
+
+For each roster size this generates a synthetic data directory (prospects,
+a knowledge snippet library and scenario files derived from the samples in
+data/), then measures in a fresh interpreter:
+
+* cold and warm start: importing the app with an empty and a primed cache;
+* JSON loading: a full streamed pass (with and without schema checks) and a
+  plain ``json.load`` of the roster;
+* per-callback render: ``refresh_view`` for prospect and scenario picks with
+  the fragment cache cleared, plus each ``dealcast.render`` building block
+  emitted as Dash components, and the prospect panels as JSON and HTML;
+* serialized payload size of those callback responses;
+* static build: ``build_static_site.build_html`` on the whole data set;
+* peak resident memory after each phase, and the traced size of the whole
+  roster held as parsed dicts versus as ``dealcast.records`` records.
+
+Results are written as JSON (``--out``, default stdout) so runs can be
+diffed between commits:
+
+    python scripts/benchmark.py --prospects 10,1000,100000 --snippets 10000 --out bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextvars
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+SAMPLE_DIR = BASE_DIR / "data"
+
+INDUSTRIES = [
+    "Autonomous Agriculture Robotics", "Personalized Biologics Manufacturing", "Urban eVTOL Mobility Networks",
+    "Federal Health IT", "Regional Banking", "Industrial IoT", "Retail Media Networks", "Grid Storage",
+    "Clinical Trials SaaS", "Satellite Broadband", "Cold Chain Logistics", "Quantum Security",
+]
+STAGES = ["Seed", "Series A", "Series B", "Series C", "Series D", "Pre-IPO", "Public"]
+WORDS = (
+    "cloud migration finops observability kubernetes compliance fedramp soc2 latency edge fleet telemetry "
+    "governance privileged access zero trust data pipeline lakehouse analytics budget board mandate audit "
+    "expansion acquisition outage resilience disaster recovery ai agents retrieval cost overrun hiring"
+).split()
+
+
+# --------------------------------------------------------------- generators
+
+
+def _sentence(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def _write_array(path: Path, key: str, records) -> None:
+    """Write ``{key: [...]}`` one record at a time so 100k rosters stay cheap."""
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write(f'{{"{key}": [\n')
+        for number, record in enumerate(records):
+            if number:
+                handle.write(",\n")
+            handle.write(json.dumps(record, ensure_ascii=False))
+        handle.write("\n]}\n")
+
+
+def synthetic_prospects(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    template = json.loads((SAMPLE_DIR / "prospects.json").read_text())["prospects"]
+    for number in range(count):
+        prospect = json.loads(json.dumps(template[number % len(template)]))
+        prospect["companyName"] = f"Bench Prospect {number:06d}"
+        prospect["industry"] = rng.choice(INDUSTRIES)
+        prospect["growthStage"] = rng.choice(STAGES)
+        prospect["annualRevenue"] = f"{rng.randint(5, 900)}M"
+        prospect["challenges"] = [_sentence(rng) for _ in range(rng.randint(1, 5))]
+        prospect["buyingTriggers"] = [_sentence(rng) for _ in range(rng.randint(1, 5))]
+        yield prospect
+
+
+def synthetic_snippets(count: int, seed: int = 11):
+    rng = random.Random(seed)
+    for number in range(count):
+        yield {
+            "id": f"src-bench-{number}",
+            "title": _sentence(rng, 5),
+            "path": f"knowledge/bench/{number:06d}.md",
+            "snippet": _sentence(rng, 40),
+        }
+
+
+def synthetic_scenarios(count: int, snippets: int, seed: int = 13):
+    rng = random.Random(seed)
+    templates = [
+        json.loads(path.read_text())
+        for path in sorted(SAMPLE_DIR.glob("*.json"))
+        if path.name not in {"prospects.json", "knowledge-snippets.json"}
+    ]
+    for number in range(count):
+        scenario = json.loads(json.dumps(templates[number % len(templates)]))
+        scenario["session_context"]["request_id"] = f"bench-{number:04d}"
+        scenario["session_context"]["segment"] = f"Bench Segment {number % 4}"
+        scenario.pop("knowledge_snippets", None)
+        for signal in scenario.get("intel_scout_brief", {}).get("signal_stack", []):
+            signal["detail"] = f"{_sentence(rng)} [src-bench-{rng.randrange(max(snippets, 1))}]"
+        yield scenario
+
+
+def generate(directory: Path, prospects: int, snippets: int, scenarios: int) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    _write_array(directory / "prospects.json", "prospects", synthetic_prospects(prospects))
+    _write_array(directory / "knowledge-snippets.json", "documents", synthetic_snippets(snippets))
+    for scenario in synthetic_scenarios(scenarios, snippets):
+        path = directory / f"{scenario['session_context']['request_id']}.json"
+        path.write_text(json.dumps(scenario, ensure_ascii=False))
+
+
+# --------------------------------------------------------------- measuring
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1 << 20 if sys.platform == "darwin" else 1 << 10), 1)
+
+
+def _traced_mb(function) -> float:
+    """Memory still allocated by what ``function`` returns, while it is alive."""
+    tracemalloc.start()
+    try:
+        kept = function()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del kept
+    return round(size / (1 << 20), 2)
+
+
+def _timings(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+    return {
+        "n": len(ordered),
+        "median_ms": round(statistics.median(ordered) * 1000, 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def _timed(function, *args) -> tuple[float, object]:
+    started = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - started, result
+
+
+def run_worker(samples: int) -> dict:
+    """Measure inside a fresh interpreter whose DEALCAST_* env points at the synthetic data."""
+    from dash._callback_context import context_value
+    from dash._utils import AttributeDict
+    from plotly.io.json import to_json_plotly
+
+    result: dict = {}
+    import_time, dealcast_app = _timed(__import__, "app")
+    result["start_s"] = round(import_time, 3)
+    result["rss_after_start_mb"] = _peak_rss_mb()
+
+    from dealcast import render
+    from dealcast.config import DATA_DIR
+    from dealcast.records import Prospect
+    from dealcast.render import to_dash, to_html
+    from dealcast.schema import iter_valid_prospects
+    from dealcast.streaming import iter_prospects
+
+    prospects_path = DATA_DIR / "prospects.json"
+    seconds, count = _timed(lambda: sum(1 for _ in iter_prospects(prospects_path)))
+    result["stream_prospects_s"] = round(seconds, 3)
+    seconds, _ = _timed(lambda: sum(1 for _ in iter_valid_prospects(prospects_path)))
+    result["validate_prospects_s"] = round(seconds, 3)
+    seconds, _ = _timed(lambda: json.loads(prospects_path.read_bytes()))
+    result["json_load_prospects_s"] = round(seconds, 3)
+    result["prospects"] = count
+    result["prospects_file_mb"] = round(prospects_path.stat().st_size / (1 << 20), 2)
+    # The whole roster held as parsed dicts versus as slotted records.
+    result["roster_dicts_mb"] = _traced_mb(lambda: list(iter_valid_prospects(prospects_path)))
+    result["roster_records_mb"] = _traced_mb(
+        lambda: [Prospect.from_dict(record) for record in iter_valid_prospects(prospects_path)]
+    )
+
+    rng = random.Random(3)
+    names = dealcast_app.PROSPECTS.names()
+    scenario_ids = list(dealcast_app.SCENARIOS)
+
+    def refresh(trigger, prospect, scenario_id):
+        def call():
+            context_value.set(AttributeDict(triggered_inputs=[{"prop_id": trigger, "value": None}]))
+            return dealcast_app.refresh_view(prospect, scenario_id, None)
+
+        dealcast_app.FRAGMENTS.clear()
+        return contextvars.copy_context().run(call)
+
+    for trigger in ("prospect-select.value", "scenario-select.value"):
+        times, sizes = [], []
+        for _ in range(samples):
+            seconds, outputs = _timed(refresh, trigger, rng.choice(names), rng.choice(scenario_ids))
+            times.append(seconds)
+            sizes.append(len(to_json_plotly({"response": list(outputs)}).encode("utf-8")))
+        key = trigger.split("-")[0]
+        result[f"refresh_{key}"] = _timings(times)
+        result[f"refresh_{key}_payload_bytes"] = {"median": int(statistics.median(sizes)), "max": max(sizes)}
+
+    prospect = dealcast_app.PROSPECTS.get(names[0])
+    scenario = dealcast_app.SCENARIOS.get(scenario_ids[0])
+    citations = dealcast_app.ScenarioCitations(scenario, dealcast_app.LIBRARY_CITATIONS)
+    intel, playbook, call_studio = scenario.sections
+    builders = {
+        "stat_grid": lambda: to_dash(render.stat_grid(prospect)),
+        "persona_cards": lambda: to_dash(render.persona_cards(prospect.personas)),
+        "tech_stack_cards": lambda: to_dash(render.tech_stack_cards(prospect.tech_stack)),
+        "snippet_cards": lambda: to_dash(
+            render.snippet_cards(dealcast_app.SNIPPETS.for_prospect(prospect, dealcast_app.SNIPPET_LIMIT))
+        ),
+        "signal_stack": lambda: to_dash(render.signal_stack(intel.get("signal_stack", []), citations)),
+        "talk_tracks": lambda: to_dash(render.talk_tracks(playbook.get("talk_tracks", []), citations)),
+        "cta_blocks": lambda: to_dash(render.cta_blocks(playbook.get("cta_blocks", []))),
+        "host_script": lambda: to_dash(render.host_script(call_studio.get("host_script", []), citations)),
+        "cue_sheet": lambda: to_dash(render.cue_sheet(call_studio.get("cue_sheet", []))),
+        "prospect_panels_json": lambda: render.prospect_panels_json(prospect),
+        "prospect_panels_html": lambda: [to_html(build(prospect)) for build in render.PROSPECT_PANELS.values()],
+    }
+    result["builders"] = {
+        name: _timings([_timed(builder)[0] for _ in range(samples)]) for name, builder in builders.items()
+    }
+    result["rss_after_render_mb"] = _peak_rss_mb()
+
+    sys.path.insert(0, str(BASE_DIR / "scripts"))
+    import build_static_site
+
+    prospects = list(build_static_site.iter_prospect_records())
+    snippets = list(build_static_site.iter_snippet_records())
+    seconds, page = _timed(build_static_site.build_html, prospects, snippets)
+    # The builder must have read the synthetic roster, not the samples in data/.
+    options = page.count("<option value=")
+    if options != count:
+        raise SystemExit(f"static page lists {options} prospects, expected the synthetic {count}")
+    result["static_build_html_s"] = round(seconds, 3)
+    result["static_html_mb"] = round(len(page.encode("utf-8")) / (1 << 20), 2)
+    result["rss_peak_mb"] = _peak_rss_mb()
+    return result
+
+
+def _run_phase(data_dir: Path, cache_dir: Path, samples: int) -> dict:
+    env = dict(
+        os.environ,
+        DEALCAST_DATA_DIR=str(data_dir),
+        DEALCAST_SCENARIO_DIR=str(data_dir),
+        DEALCAST_CACHE_DIR=str(cache_dir),
+        DEALCAST_PACK=str(cache_dir / "dealcast.pack"),
+        PYTHONPATH=os.pathsep.join(filter(None, [str(BASE_DIR), os.environ.get("PYTHONPATH")])),
+    )
+    for name in ("DEALCAST_RESPONSE_CACHE_MB", "DEALCAST_CLIENTSIDE_PROSPECTS", "DEALCAST_COMPRESS"):
+        env.pop(name, None)
+    completed = subprocess.run(
+        [sys.executable, __file__, "--worker", "--samples", str(samples)],
+        env=env,
+        cwd=BASE_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode:
+        raise SystemExit(f"benchmark worker failed:\n{completed.stderr}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=BASE_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prospects", default="10,1000,100000", help="comma-separated roster sizes")
+    parser.add_argument("--snippets", type=int, default=10000, help="snippet library size")
+    parser.add_argument("--scenarios", type=int, default=20, help="scenario files")
+    parser.add_argument("--samples", type=int, default=30, help="repetitions per render timing")
+    parser.add_argument("--out", type=Path, help="write results here instead of stdout")
+    parser.add_argument("--keep", type=Path, help="generate data under this directory and keep it")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_worker(args.samples)))
+        return
+
+    runs = []
+    with tempfile.TemporaryDirectory(prefix="dealcast-bench-") as scratch:
+        root = args.keep or Path(scratch)
+        for size in [int(value) for value in args.prospects.split(",") if value]:
+            data_dir = root / f"prospects-{size}" / "data"
+            cache_dir = root / f"prospects-{size}" / "cache"
+            started = time.perf_counter()
+            generate(data_dir, size, args.snippets, args.scenarios)
+            generated = time.perf_counter() - started
+            cold = _run_phase(data_dir, cache_dir, args.samples)
+            warm = _run_phase(data_dir, cache_dir, args.samples)
+            run = {
+                "prospects": size,
+                "snippets": args.snippets,
+                "scenarios": args.scenarios,
+                "generate_s": round(generated, 3),
+                "cold_start_s": cold.pop("start_s"),
+                "warm_start_s": warm["start_s"],
+                **warm,
+            }
+            del run["start_s"]
+            runs.append(run)
+            print(
+                f"{size} prospects: cold start {run['cold_start_s']}s, warm {run['warm_start_s']}s, "
+                f"prospect pick p95 {run['refresh_prospect']['p95_ms']}ms",
+                file=sys.stderr,
+            )
+
+    report = {
+        "format": 1,
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": runs,
+    }
+    payload = json.dumps(report, indent=2)
+    if args.out:
+        args.out.write_text(payload + "\n")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
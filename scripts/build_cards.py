@@ -0,0 +1,49 @@
+"""Derive prospect-summary-cards.json from the prospect roster and the scenarios.
+
+Only cards whose prospect record or matched scenario changed since the last
+run are derived again; the rest are carried over from the current file.
+Cards marked ``"curated": true`` are never replaced.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+import time
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE_DIR))
+
+from dealcast.cards import STATE_PATH, build_cards  # noqa: E402
+from dealcast.config import CARDS_PATH, DATA_DIR, SCENARIO_DIR  # noqa: E402
+from dealcast.datapack import open_pack  # noqa: E402
+from dealcast.scenario_registry import ScenarioRegistry  # noqa: E402
+
+PROSPECTS_PATH = DATA_DIR / "prospects.json"
+SNIPPETS_PATH = DATA_DIR / "knowledge-snippets.json"
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", type=Path, default=CARDS_PATH, help=f"card file to write (default: {CARDS_PATH})")
+    parser.add_argument(
+        "--force", action="store_true", help="ignore the saved hashes and derive every card not marked curated"
+    )
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    registry = ScenarioRegistry(SCENARIO_DIR, exclude={PROSPECTS_PATH.name, SNIPPETS_PATH.name}, pack=open_pack())
+    # Registry order is newest first, so a company named by several shows gets the latest.
+    scenarios = (registry.get(entry.request_id) for entry in registry.entries())
+    result = build_cards(PROSPECTS_PATH, scenarios, args.out, STATE_PATH, force=args.force)
+    elapsed = time.perf_counter() - started
+    status = "Wrote" if result.written else "Unchanged:"
+    print(
+        f"{status} {args.out} ({result.cards} cards: {result.derived} derived, {result.reused} reused, "
+        f"{result.curated} curated) in {elapsed:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,100 +1,229 @@
 from __future__ import annotations
 
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+import hashlib
+from html import escape
 import json
+import os
 from pathlib import Path
+import re
+import shutil
 from string import Template
-import textwrap
+import sys
+from typing import Iterable
 
 
 BASE_DIR = Path(__file__).resolve().parents[1]
-DATA_DIR = BASE_DIR / "data"
 DIST_DIR = BASE_DIR / "dist"
 
+sys.path.insert(0, str(BASE_DIR))
 
-def load_data() -> tuple[list[dict], list[dict]]:
-    prospects = json.loads((DATA_DIR / "prospects.json").read_text())['prospects']
-    snippets = json.loads((DATA_DIR / "knowledge-snippets.json").read_text())['documents']
-    return prospects, snippets
+from dealcast.config import DATA_DIR, SCENARIO_DIR  # noqa: E402
+from dealcast.assets import (  # noqa: E402
+    AssetStage,
+    minify_css,
+    minify_js,
+    precompress,
+    remove_precompressed,
+    vendor_fonts,
+)
+from dealcast.citations import CitationIndex, ScenarioCitations  # noqa: E402
+from dealcast.datapack import iter_collection  # noqa: E402
+from dealcast.prospect_store import open_prospect_store  # noqa: E402
+from dealcast.records import Prospect, Scenario, Snippet  # noqa: E402
+from dealcast.render import (  # noqa: E402
+    CLIENT_RENDER_JS,
+    PROSPECT_PANELS,
+    container,
+    prospect_panels_html,
+    prospect_panels_json,
+    render_call_studio,
+    render_intel,
+    render_playbook,
+    render_snippet_feed,
+    snippet_card,
+    to_html,
+)
+from dealcast.scenario_registry import ScenarioRegistry  # noqa: E402
+from dealcast.schema import SCENARIO, iter_valid_prospects, iter_valid_snippets  # noqa: E402
+from dealcast.shards import client_boot_js, client_loader_js, write_shards  # noqa: E402
 
+PROSPECTS_PATH = DATA_DIR / "prospects.json"
+SNIPPETS_PATH = DATA_DIR / "knowledge-snippets.json"
+# The app's stylesheet, inlined into every page, and the package the page is
+# built with: renderers, loader and boot scripts, record and schema parsing.
+STYLESHEET_PATH = BASE_DIR / "assets" / "dealcast.css"
+PACKAGE_DIR = BASE_DIR / "dealcast"
 
-def build_snippet_cards(snippets: list[dict]) -> str:
+# Incremental build state lives next to the output so CI can cache dist/ as a unit.
+BUILD_DIR = DIST_DIR / ".build"
+MANIFEST_PATH = BUILD_DIR / "manifest.json"
+MANIFEST_FORMAT = 1
+
+# Sharded bundles write prospect data here, relative to DIST_DIR.
+SHARDED_DATA_DIR = "data"
+# --assets publishes fingerprinted CSS, JS and fonts here, relative to DIST_DIR.
+ASSETS_DIR = "assets"
+
+FONTS_URL = "https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600&family=Space+Grotesk:wght@500&display=swap"
+FONT_LINKS = f"""<link rel="preconnect" href="https://fonts.googleapis.com" />
+  <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin />
+  <link href="{escape(FONTS_URL)}" rel="stylesheet" />"""
+
+# Scenario pages land in dist/scenarios/<request_id>/.
+SCENARIO_PAGES_DIR = "scenarios"
+# Prospects handed to one worker task in --per-prospect mode.
+PROSPECT_CHUNK = 256
+
+# Prospect panel ids per layout column, as in the app.
+LEFT_PANELS = ("company-meta", "personas", "tech-stack")
+RIGHT_PANELS = ("challenges", "triggers", "competition")
+
+# Which inputs each template fragment is rendered from. Every fragment also
+# depends on this script and the dealcast package (builder_sources), so
+# template, panel or loader edits invalidate everything. "shards" is not part
+# of the page; it stands for the files under dist/data/. It comes before
+# "boot", which fetches the content-hashed index the shards step names.
+FRAGMENT_INPUTS = {
+    "css": ("stylesheet",),
+    "options": ("prospects", "mode"),
+    "snippets": ("snippets",),
+    "left": ("prospects", "mode"),
+    "right": ("prospects", "mode"),
+    "loader": ("prospects", "mode"),
+    "render": ("mode",),
+    "shards": ("prospects", "mode"),
+    "boot": ("prospects", "mode"),
+}
+
+# Client-side data access. Both variants expose loadProspect(name) -> Promise
+# of {panel id: render.to_json tree}, which CLIENT_RENDER_JS draws.
+INLINE_LOADER = Template(
+    """const PANELS = $panels_json;
+    const loadProspect = (companyName) => Promise.resolve(PANELS[companyName]);"""
+)
+
+# --prerender: the panels are HTML from build time and the client never
+# builds markup. Inline pages hold every prospect's panels, all but the shown
+# one hidden, and switching toggles two elements per panel. Sharded pages hold
+# the first prospect's and swap in the pre-rendered fragments of the shards.
+PRERENDERED_TOGGLE_JS = Template(
+    """const PANEL_IDS = $panel_ids;
+    let shown = 0;
+    function hydrate(companyName) {
+      const selector = document.getElementById('prospect-select');
+      const index = Array.prototype.findIndex.call(selector.options, option => option.value === companyName);
+      if (index < 0 || index === shown) {
+        return;
+      }
+      PANEL_IDS.forEach(id => {
+        const panels = document.getElementById(id).children;
+        panels[shown].hidden = true;
+        panels[index].hidden = false;
+      });
+      shown = index;
+    }"""
+)
+
+PRERENDERED_FETCH_JS = Template(
+    """const PANEL_IDS = $panel_ids;
+    let shown = document.getElementById(PANEL_IDS[0]).dataset.prospect;
+    async function hydrate(companyName) {
+      if (companyName === shown) {
+        return;
+      }
+      const panels = await loadProspect(companyName);
+      if (!panels || document.getElementById('prospect-select').value !== companyName) {
+        return;
+      }
+      Object.entries(panels).forEach(([id, markup]) => { document.getElementById(id).innerHTML = markup; });
+      shown = companyName;
+    }"""
+)
+
+INLINE_BOOT = """const selector = document.getElementById('prospect-select');
+    selector.addEventListener('change', (event) => hydrate(event.target.value));
+    hydrate(selector.value || selector.options[0].value);"""
+
+
+def iter_prospect_records() -> Iterable[Prospect]:
+    """Prospects from the compiled pack when it is current, else streamed from JSON."""
+    return map(Prospect.from_dict, iter_collection(PROSPECTS_PATH, "prospects", iter_valid_prospects))
+
+
+def iter_snippet_records(path: Path = SNIPPETS_PATH) -> Iterable[Snippet]:
+    return map(Snippet.from_dict, iter_collection(path, "documents", iter_valid_snippets))
+
+
+def load_prospects() -> list[Prospect]:
+    return list(iter_prospect_records())
+
+
+def load_snippets() -> list[Snippet]:
+    return list(iter_snippet_records())
+
+
+def load_data() -> tuple[list[Prospect], list[Snippet]]:
+    return load_prospects(), load_snippets()
+
+
+def digest(data: bytes | str) -> str:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def builder_sources() -> list[Path]:
+    """This script and every dealcast module; an edit to any of them rebuilds every fragment."""
+    return [Path(__file__), *sorted(PACKAGE_DIR.glob("*.py"))]
+
+
+def build_snippet_card(snippet: Snippet) -> str:
+    return to_html(snippet_card(snippet))
+
+
+def build_snippet_cards(snippets: Iterable[Snippet], card_cache: dict[str, str] | None = None) -> str:
+    """Render snippet cards, reusing ``card_cache`` entries keyed by snippet hash.
+
+    When a cache is passed it is updated in place to hold exactly the cards
+    of this build, so removed snippets drop out of the manifest.
+    """
+    if card_cache is None:
+        return "\n".join(build_snippet_card(snippet) for snippet in snippets)
+    previous = dict(card_cache)
+    card_cache.clear()
     cards = []
     for snippet in snippets:
-        cards.append(
-            f"""
-        <div class=\"snippet-card\">
-          <div class=\"snippet-title\">{snippet['title']}</div>
-          <p class=\"snippet-body\">{snippet['snippet']}</p>
-          <div class=\"snippet-footnote\">{snippet['path']}</div>
-        </div>
-        """.strip()
-        )
+        key = digest(json.dumps(snippet.to_dict(), sort_keys=True, ensure_ascii=False))
+        card = previous.get(key)
+        if card is None:
+            card = build_snippet_card(snippet)
+        card_cache[key] = card
+        cards.append(card)
     return "\n".join(cards)
 
 
-def build_options(prospects: list[dict]) -> str:
+def build_options(prospects: Iterable[Prospect]) -> str:
     return "\n".join(
-        f"<option value=\"{prospect['companyName']}\">{prospect['companyName']}</option>"
+        f'<option value="{escape(prospect.name)}">{escape(prospect.name, quote=False)}</option>'
         for prospect in prospects
     )
 
 
 def build_css() -> str:
-    return textwrap.dedent(
-        """
-        body {background:#05060a;margin:0;font-family:'Inter', sans-serif;color:#e8e9ee;}
-        .app-shell {min-height:100vh;padding:32px 48px;box-sizing:border-box;background:radial-gradient(circle at top,#10121c,#05060a 60%);} 
-        .hero {display:flex;justify-content:space-between;align-items:flex-end;gap:24px;margin-bottom:32px;border-bottom:1px solid rgba(255,255,255,0.08);padding-bottom:24px;}
-        .hero-title {font-family:'Space Grotesk', sans-serif;font-size:48px;margin:4px 0;color:#f8f9ff;}
-        .eyebrow {text-transform:uppercase;letter-spacing:0.3em;font-size:12px;color:#a3a7d1;}
-        .hero-copy {color:#cfd2ff;font-size:16px;max-width:520px;}
-        .selector label {display:block;margin-bottom:8px;color:#9ba1c5;font-size:13px;text-transform:uppercase;letter-spacing:0.14em;}
-        #prospect-select {color:#05060a;}
-        .layout-grid {display:flex;gap:24px;}
-        .column {flex:1;display:flex;flex-direction:column;gap:20px;}
-        .left {flex:0.9;}
-        .right {flex:1.1;}
-        .stat-grid {display:grid;grid-template-columns:repeat(auto-fit,minmax(180px,1fr));gap:16px;}
-        .stat-card {padding:18px;border:1px solid rgba(255,255,255,0.08);border-radius:16px;background:rgba(255,255,255,0.02);} 
-        .stat-label {font-size:12px;text-transform:uppercase;letter-spacing:0.16em;color:#8f93b8;margin-bottom:6px;}
-        .stat-value {font-size:20px;font-weight:600;color:#f8f9ff;}
-        .section-card {padding:22px;border:1px solid rgba(255,255,255,0.08);border-radius:20px;background:rgba(11,13,23,0.9);box-shadow:0 10px 30px rgba(3,4,8,0.6);}
-        .section-title {font-size:15px;text-transform:uppercase;letter-spacing:0.2em;color:#7e85b5;margin-bottom:16px;}
-        .bullet-list {padding-left:20px;margin:0;display:flex;flex-direction:column;gap:8px;color:#e4e6ff;}
-        .bullet-list li {line-height:1.4;}
-        .tech-grid {display:grid;grid-template-columns:repeat(auto-fit,minmax(160px,1fr));gap:14px;}
-        .tech-card {padding:16px;border-radius:14px;background:rgba(255,255,255,0.04);border:1px solid rgba(255,255,255,0.04);} 
-        .tech-label {font-size:13px;font-weight:500;color:#b2b7e4;margin-bottom:8px;}
-        .tech-value {font-size:15px;color:#f7f8ff;line-height:1.4;}
-        .persona-grid {display:grid;grid-template-columns:repeat(auto-fit,minmax(240px,1fr));gap:16px;}
-        .persona-card {padding:18px;border-radius:18px;background:rgba(23,25,45,0.9);border:1px solid rgba(255,255,255,0.05);} 
-        .persona-name {font-size:18px;font-weight:600;color:#fff;margin-bottom:4px;}
-        .persona-title {font-size:14px;color:#9ba1c5;margin-bottom:10px;}
-        .persona-bio {margin:0;color:#d8dbff;line-height:1.5;font-size:14px;}
-        .chip-row {display:flex;flex-wrap:wrap;gap:8px;}
-        .chip {padding:6px 12px;border-radius:999px;background:rgba(126,133,181,0.18);font-size:13px;color:#c5c8f2;border:1px solid rgba(197,200,242,0.3);}
-        .snippet-grid {display:grid;grid-template-columns:repeat(auto-fit,minmax(240px,1fr));gap:14px;}
-        .snippet-card {padding:16px;border-radius:14px;background:rgba(255,255,255,0.03);border:1px solid rgba(255,255,255,0.05);}
-        .snippet-title {font-size:15px;font-weight:600;margin-bottom:8px;color:#fdfdff;}
-        .snippet-body {margin:0;color:#d5d8ff;font-size:14px;line-height:1.5;min-height:72px;}
-        .snippet-footnote {margin-top:12px;font-size:12px;color:#8a8fb4;}
-        @media(max-width:1024px){.hero{flex-direction:column;align-items:flex-start;}.layout-grid{flex-direction:column;}}
-        """
-    ).strip()
+    return STYLESHEET_PATH.read_text(encoding="utf-8").strip()
 
 
-def build_html(prospects: list[dict], snippets: list[dict]) -> str:
-    template = Template(
-        """<!doctype html>
+PAGE_TEMPLATE = Template(
+    """<!doctype html>
 <html lang=\"en\">
 <head>
   <meta charset=\"utf-8\" />
   <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
   <title>DealCast Control Surface</title>
-  <link rel=\"preconnect\" href=\"https://fonts.googleapis.com\" />
-  <link rel=\"preconnect\" href=\"https://fonts.gstatic.com\" crossorigin />
-  <link href=\"https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600&family=Space+Grotesk:wght@500&display=swap\" rel=\"stylesheet\" />
-  <style>$css</style>
+  $head
 </head>
 <body>
   <div class=\"app-shell\">
@@ -113,16 +242,12 @@ def build_html(prospects: list[dict], snippets: list[dict]) -> str:
     </div>
     <div class=\"layout-grid\">
       <div class=\"column left\">
-        <div id=\"company-meta\"></div>
-        <div id=\"tech-stack\"></div>
-        <div id=\"personas\"></div>
+        $left
       </div>
       <div class=\"column right\">
-        <div id=\"challenges\"></div>
-        <div id=\"buying-triggers\"></div>
-        <div id=\"competitive-notes\"></div>
-        <div class=\"section-card\">
-          <div class=\"section-title\">Knowledge Signals</div>
+        $right
+        <div class=\"section-card\" id=\"snippet-feed\">
+          <div class=\"section-title\">Knowledge Snippets</div>
           <div class=\"snippet-grid\">
             $snippets
           </div>
@@ -130,112 +255,561 @@ def build_html(prospects: list[dict], snippets: list[dict]) -> str:
       </div>
     </div>
   </div>
-  <script>
-    const PROSPECTS = $prospects_json;
-    const PROSPECT_LOOKUP = Object.fromEntries(PROSPECTS.map(p => [p.companyName, p]));
-
-    function buildStat(label, value) {
-      return `
-        <div class="stat-card">
-          <div class="stat-label">$${label}</div>
-          <div class="stat-value">$${value}</div>
-        </div>
-      `;
-    }
+  $scripts
+</body>
+</html>
+        """
+)
 
-    function buildListSection(title, items) {
-      const itemsMarkup = items.map(item => `<li>$${item}</li>`).join('');
-      return `
-        <div class="section-card">
-          <div class="section-title">$${title}</div>
-          <ul class="bullet-list">$${itemsMarkup}</ul>
-        </div>
-      `;
+
+def build_panels_json(prospects: Iterable[Prospect]) -> str:
+    """Company name -> prospect panels, as a JS literal safe inside <script>."""
+    entries = ",".join(
+        json.dumps(prospect.name, ensure_ascii=False)
+        + ":"
+        + json.dumps(prospect_panels_json(prospect), ensure_ascii=False, separators=(",", ":"))
+        for prospect in prospects
+    )
+    return ("{" + entries + "}").replace("</", "<\\/")
+
+
+def build_panel_column(
+    panel_ids: Iterable[str],
+    prospects: Iterable[Prospect] | None,
+    shard_size: int = 0,
+    prerender: bool = False,
+) -> str:
+    """The column's panel containers: empty for the client to draw, or pre-rendered.
+
+    Pre-rendered inline pages carry every prospect's panel, all but the first
+    hidden; sharded ones carry only the first prospect's.
+    """
+    if not prerender:
+        return "\n".join(to_html(container(panel)) for panel in panel_ids)
+    rendered: dict[str, list[str]] = {panel: [] for panel in panel_ids}
+    first = None
+    for prospect in prospects:
+        for panel, markup in rendered.items():
+            node = PROSPECT_PANELS[panel](prospect)
+            markup.append(to_html(node if first is None else node._replace(attrs={"hidden": ""})))
+        if first is None:
+            first = prospect.name
+            if shard_size:
+                break
+    attrs = f' data-prospect="{escape(first)}"' if first is not None else ""
+    return "\n".join(
+        f'<div class="section-card" id="{panel}"{attrs}>{"".join(markup)}</div>' for panel, markup in rendered.items()
+    )
+
+
+def build_loader(prospects: Iterable[Prospect] | None, shard_size: int = 0, prerender: bool = False) -> str:
+    if shard_size:
+        return client_loader_js(SHARDED_DATA_DIR)
+    if prerender:
+        return ""
+    return INLINE_LOADER.substitute(panels_json=build_panels_json(prospects))
+
+
+def build_render(shard_size: int = 0, prerender: bool = False) -> str:
+    if not prerender:
+        return CLIENT_RENDER_JS
+    script = PRERENDERED_FETCH_JS if shard_size else PRERENDERED_TOGGLE_JS
+    return script.substitute(panel_ids=json.dumps(list(PROSPECT_PANELS)))
+
+
+def build_boot(shard_size: int = 0, shards: str = "") -> str:
+    """The boot script; sharded pages fetch the index named in the ``shards`` summary."""
+    if shard_size:
+        return client_boot_js(json.loads(shards)["index"])
+    return INLINE_BOOT
+
+
+INLINE_SCRIPTS = Template(
+    """<script>
+    $loader
+
+    $render
+
+    $boot
+  </script>"""
+)
+
+
+def publish_stylesheet(css: str, stage: AssetStage, font_subsets: tuple = ()) -> str:
+    """Publish ``css`` (with the vendored font faces for ``font_subsets``) and return its URL."""
+    if font_subsets:
+        css = vendor_fonts(FONTS_URL, stage, font_subsets) + "\n" + css
+    return stage.publish("dealcast", ".css", minify_css(css))
+
+
+def stylesheet_head(href: str, vendored_fonts: bool = False) -> str:
+    """The <head> links of a page styled by the published stylesheet at ``href``."""
+    head = "" if vendored_fonts else FONT_LINKS + "\n  "
+    return head + f'<link href="{href}" rel="stylesheet" />'
+
+
+def assemble_page(
+    fragments: dict[str, str],
+    stage: AssetStage | None = None,
+    font_subsets: tuple = (),
+    stylesheet: str | None = None,
+) -> str:
+    """PAGE_TEMPLATE filled from ``fragments``.
+
+    Without a ``stage`` the CSS and scripts are inlined. With one they are
+    minified and published as fingerprinted files. The prospect data gets its
+    own script, so a data drop leaves the app script's URL, and so its cached
+    copy, alone. ``font_subsets`` vendors the web fonts as well.
+    ``stylesheet`` is the URL of an already published stylesheet.
+    """
+    if stage is None:
+        head = f"{FONT_LINKS}\n  <style>{fragments['css']}</style>"
+        return PAGE_TEMPLATE.substitute(fragments, head=head, scripts=INLINE_SCRIPTS.substitute(fragments))
+    if stylesheet is None:
+        stylesheet = publish_stylesheet(fragments["css"], stage, font_subsets)
+    head = stylesheet_head(stylesheet, bool(font_subsets))
+    scripts = []
+    if fragments["loader"]:
+        scripts.append(stage.publish("prospects", ".js", minify_js(fragments["loader"])))
+    scripts.append(stage.publish("dealcast", ".js", minify_js(fragments["render"] + "\n" + fragments["boot"])))
+    # Deferred classic scripts run in order and share top-level declarations.
+    tags = "\n  ".join(f'<script src="{src}" defer></script>' for src in scripts)
+    return PAGE_TEMPLATE.substitute(fragments, head=head, scripts=tags)
+
+
+def build_html(
+    prospects: list[Prospect] | None,
+    snippets: Iterable[Snippet],
+    shard_size: int = 0,
+    prerender: bool = False,
+    shards: str = "",
+) -> str:
+    """The whole page in one pass.
+
+    With ``shard_size`` the roster lives in the shards; ``shards`` is the
+    summary build_shards returned, and ``prospects`` need only hold the first
+    record, which ``prerender`` puts in the page.
+    """
+    fragments = {
+        "css": build_css(),
+        "options": "" if shard_size else build_options(prospects),
+        "snippets": build_snippet_cards(snippets),
+        "left": build_panel_column(LEFT_PANELS, prospects, shard_size, prerender),
+        "right": build_panel_column(RIGHT_PANELS, prospects, shard_size, prerender),
+        "loader": build_loader(None if shard_size else prospects, shard_size, prerender),
+        "render": build_render(shard_size, prerender),
+        "boot": build_boot(shard_size, shards),
     }
+    return assemble_page(fragments)
 
-    function buildTechStack(tech) {
-      const cards = Object.entries(tech)
-        .map(([lane, value]) => {
-          const label = lane.charAt(0).toUpperCase() + lane.slice(1);
-          return `
-            <div class="tech-card">
-              <div class="tech-label">$${label}</div>
-              <div class="tech-value">$${value}</div>
-            </div>
-          `;
-        })
-        .join('');
-
-      return `
-        <div class="section-card">
-          <div class="section-title">Tech Stack Lanes</div>
-          <div class="tech-grid">$${cards}</div>
-        </div>
-      `;
+
+def build_shards(prospects: Iterable[Prospect], shard_size: int, prerender: bool = False) -> str:
+    """Write dist/data/ for sharded bundles; the returned summary is cached as the fragment."""
+    if not shard_size:
+        return ""
+    payload = prospect_panels_html if prerender else prospect_panels_json
+    summary = write_shards(prospects, DIST_DIR / SHARDED_DATA_DIR, shard_size, payload=payload)
+    return json.dumps(summary)
+
+
+def remove_shards() -> None:
+    """Delete dist/data/ and its .gz/.br siblings after a build that writes no shards.
+
+    dist/ is restored from the CI cache, so an earlier sharded build's files
+    would otherwise be published, and cached, next to the inline page.
+    """
+    shutil.rmtree(DIST_DIR / SHARDED_DATA_DIR, ignore_errors=True)
+
+
+def load_manifest() -> dict:
+    try:
+        manifest = json.loads(MANIFEST_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+    return manifest if manifest.get("format") == MANIFEST_FORMAT else {}
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write ``content`` unless ``path`` already holds the same bytes."""
+    data = content.encode("utf-8")
+    if path.exists() and path.stat().st_size == len(data) and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+def build_incremental(
+    force: bool = False,
+    shard_size: int = 0,
+    prerender: bool = False,
+    assets: bool = False,
+    font_subsets: tuple = (),
+) -> tuple[list[str], bool]:
+    """Re-render the fragments whose inputs changed and return (rebuilt, written).
+
+    With ``shard_size`` the page carries no prospect data; it fetches the
+    content-hashed ``dist/data/prospects-index.<hash>.json`` and one shard
+    per opened prospect.
+    With ``prerender`` the panels are HTML from build time, in the page or
+    in the shards. ``assets`` moves CSS and JS into fingerprinted files under
+    ``dist/assets/`` and precompresses the page and its data (see assemble_page).
+    """
+    manifest = {} if force else load_manifest()
+    inputs = {
+        "builder": digest(b"".join(path.read_bytes() for path in builder_sources())),
+        "stylesheet": digest(STYLESHEET_PATH.read_bytes()),
+        "prospects": digest(PROSPECTS_PATH.read_bytes()),
+        "snippets": digest(SNIPPETS_PATH.read_bytes()),
+        "mode": digest(f"shard_size={shard_size} prerender={prerender} assets={assets} fonts={','.join(font_subsets)}"),
     }
+    output_path = DIST_DIR / "index.html"
+    cached_fragments = manifest.get("fragments", {})
 
-    function buildPersonas(personas) {
-      const cards = personas
-        .map(persona => `
-          <div class="persona-card">
-            <div class="persona-name">$${persona.name}</div>
-            <div class="persona-title">$${persona.title}</div>
-            <p class="persona-bio">$${persona.personaBio}</p>
-          </div>
-        `)
-        .join('');
+    fragments: dict[str, str] = {}
+    fragment_state: dict[str, dict] = {}
+    stale: list[str] = []
+    for name, deps in FRAGMENT_INPUTS.items():
+        key = digest("|".join(inputs[dep] for dep in ("builder", *deps)))
+        fragment_path = BUILD_DIR / f"{name}.fragment"
+        cached = cached_fragments.get(name)
+        if cached and cached["key"] == key and fragment_path.exists():
+            fragments[name] = fragment_path.read_text(encoding="utf-8")
+            fragment_state[name] = cached
+        else:
+            stale.append(name)
+            fragment_state[name] = {"key": key}
 
-      return `
-        <div class="section-card">
-          <div class="section-title">Personas</div>
-          <div class="persona-grid">$${cards}</div>
-        </div>
-      `;
+    if not stale and manifest.get("output") and output_path.exists():
+        if digest(output_path.read_bytes()) == manifest["output"]:
+            return [], False
+
+    # Each renderer streams its own pass over the source, so only one record
+    # is held at a time while fragments and shards are written.
+    card_cache = dict(manifest.get("cards", {}))
+    renderers = {
+        "css": build_css,
+        "options": lambda: "" if shard_size else build_options(iter_prospect_records()),
+        "snippets": lambda: build_snippet_cards(iter_snippet_records(), card_cache),
+        "left": lambda: build_panel_column(LEFT_PANELS, iter_prospect_records(), shard_size, prerender),
+        "right": lambda: build_panel_column(RIGHT_PANELS, iter_prospect_records(), shard_size, prerender),
+        "loader": lambda: build_loader(None if shard_size else iter_prospect_records(), shard_size, prerender),
+        "render": lambda: build_render(shard_size, prerender),
+        "shards": lambda: build_shards(iter_prospect_records(), shard_size, prerender),
+        "boot": lambda: build_boot(shard_size, fragments["shards"]),
     }
+    for name in stale:
+        fragments[name] = renderers[name]()
+        fragment_state[name]["hash"] = digest(fragments[name])
+        write_if_changed(BUILD_DIR / f"{name}.fragment", fragments[name])
 
-    function hydrate(companyName) {
-      const prospect = PROSPECT_LOOKUP[companyName];
-      const meta = [
-        ['Industry', prospect.industry],
-        ['HQ', prospect.headquarters],
-        ['Revenue', prospect.annualRevenue],
-        ['Stage', prospect.growthStage]
-      ].map(([label, value]) => buildStat(label, value)).join('');
-      document.getElementById('company-meta').innerHTML = '<div class="stat-grid">' + meta + '</div>';
-      document.getElementById('tech-stack').innerHTML = buildTechStack(prospect.techStack);
-      document.getElementById('personas').innerHTML = buildPersonas(prospect.personas);
-      document.getElementById('challenges').innerHTML = buildListSection('Challenges in Play', prospect.challenges);
-      document.getElementById('buying-triggers').innerHTML = buildListSection('Buying Triggers', prospect.buyingTriggers);
-      document.getElementById('competitive-notes').innerHTML = buildListSection('Competitive Notes', prospect.competitiveNotes);
+    stage = AssetStage(DIST_DIR, ASSETS_DIR) if assets else None
+    # Recorded in the manifest: the scenario pages link the same stylesheet.
+    stylesheet = publish_stylesheet(fragments["css"], stage, font_subsets) if stage is not None else None
+    html = assemble_page(fragments, stage, font_subsets, stylesheet)
+    written = write_if_changed(output_path, html)
+    if shard_size:
+        data_files = sorted((DIST_DIR / SHARDED_DATA_DIR).rglob("*.json"))
+    else:
+        data_files = []
+        remove_shards()
+    if stage is not None:
+        stage.precompress([output_path, *data_files])
+        stage.prune()
+    else:
+        # Leftovers of an earlier --assets build; stale siblings would shadow the new page on precompressing hosts.
+        remove_precompressed([output_path, *data_files])
+        shutil.rmtree(DIST_DIR / ASSETS_DIR, ignore_errors=True)
+    new_manifest = {
+        "format": MANIFEST_FORMAT,
+        "inputs": inputs,
+        "fragments": fragment_state,
+        "cards": card_cache,
+        "output": digest(html),
+        "stylesheet": stylesheet,
     }
+    write_if_changed(MANIFEST_PATH, json.dumps(new_manifest, indent=2, ensure_ascii=False))
+    return stale, written
 
-    const selector = document.getElementById('prospect-select');
-    selector.addEventListener('change', (event) => hydrate(event.target.value));
-    hydrate(selector.value || PROSPECTS[0].companyName);
-  </script>
+
+def slugify(value: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-") or "page"
+
+
+def check_slugs(values: Iterable[str], kind: str, reserved: Iterable[str] = ()) -> None:
+    """Stop the build when two ``values`` (or a value and a ``reserved`` slug) share a file name."""
+    seen = {slug: f"the {slug}.html page" for slug in reserved}
+    for value in values:
+        slug = slugify(value)
+        other = seen.setdefault(slug, repr(value))
+        if other != repr(value):
+            raise SystemExit(f"{kind} {value!r} and {other} both map to {slug!r}; rename one of them")
+
+
+def render_prospect_sections(prospect: Prospect) -> str:
+    return "".join(to_html(container(panel, build(prospect))) for panel, build in PROSPECT_PANELS.items())
+
+
+def render_scenario_sections(scenario: Scenario, fallback_snippets: list[Snippet], library: CitationIndex) -> str:
+    citations = ScenarioCitations(scenario, library)
+    snippets = scenario.knowledge_snippets or fallback_snippets
+    return "".join(
+        [
+            to_html(container("intel-brief", render_intel(scenario, citations))),
+            to_html(container("playbook", render_playbook(scenario, citations))),
+            to_html(container("call-studio", render_call_studio(scenario, citations))),
+            to_html(container("snippet-feed", render_snippet_feed(snippets))),
+        ]
+    )
+
+
+SCENARIO_TEMPLATE = Template(
+    """<!doctype html>
+<html lang="en">
+<head>
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <title>$title</title>
+  $head
+</head>
+<body>
+  <div class="app-shell">
+    <div class="hero">
+      <div>
+        <div class="eyebrow">$eyebrow</div>
+        <h1 class="hero-title">$heading</h1>
+        <p class="hero-copy">$subheading</p>
+      </div>
+    </div>
+    <div class="layout-grid">
+      <div class="column left">$left</div>
+      <div class="column right">$right</div>
+    </div>
+  </div>
 </body>
 </html>
-        """
+"""
+)
+
+# Per-process state for the scenario workers, filled by _init_scenario_worker.
+_WORKER: dict = {}
+
+
+def _init_scenario_worker(prospects_path: str, snippets_path: str, dist_dir: str, head: str, compress: bool) -> None:
+    _WORKER["prospects"] = open_prospect_store(Path(prospects_path))
+    _WORKER["snippets"] = list(iter_snippet_records(Path(snippets_path)))
+    _WORKER["citations"] = CitationIndex(_WORKER["snippets"])
+    _WORKER["dist"] = Path(dist_dir)
+    _WORKER["head"] = head
+    _WORKER["compress"] = compress
+
+
+def render_scenario_task(task: tuple[str, str, str | None, list[str] | None]) -> list[tuple[str, str | None]]:
+    """Render and write the pages of one scenario; return (url path, lastmod) pairs.
+
+    ``prospect_names`` of ``None`` writes a single scenario page, otherwise one
+    page per (scenario, prospect) pair.
+    """
+    scenario_path, request_id, lastmod, prospect_names = task
+    path = Path(scenario_path)
+    scenario = Scenario.from_dict(SCENARIO.validate(json.loads(path.read_bytes()), path), request_id)
+    context = scenario.session_context
+    out_dir = _WORKER["dist"] / SCENARIO_PAGES_DIR / slugify(request_id)
+    scenario_html = render_scenario_sections(scenario, _WORKER["snippets"], _WORKER["citations"])
+    headline = scenario.intel_scout_brief.get("headline") or request_id
+    eyebrow = " • ".join(str(value) for value in (context.get("segment"), context.get("host")) if value)
+
+    pages = []
+    for name in prospect_names or [None]:
+        prospect = _WORKER["prospects"].get(name) if name else None
+        html = SCENARIO_TEMPLATE.substitute(
+            title=escape(f"{headline} — DealCast"),
+            head=_WORKER["head"],
+            eyebrow=escape(eyebrow or "DealCast"),
+            heading=escape(name or headline),
+            subheading=escape(headline if name else context.get("request_id", request_id)),
+            left=render_prospect_sections(prospect) if prospect else "",
+            right=scenario_html,
+        )
+        filename = f"{slugify(name)}.html" if name else "index.html"
+        write_if_changed(out_dir / filename, html)
+        # Compressing here spreads the work over the pool, like the rendering.
+        if _WORKER["compress"]:
+            precompress(out_dir / filename)
+        else:
+            remove_precompressed([out_dir / filename])
+        pages.append((f"{SCENARIO_PAGES_DIR}/{slugify(request_id)}/{filename}", lastmod))
+    return pages
+
+
+def write_sitemap(pages: list[tuple[str, str | None]], base_url: str) -> Path:
+    base = base_url.rstrip("/") + "/" if base_url else ""
+    entries = "\n".join(
+        f"  <url><loc>{escape(base + url)}</loc>"
+        + (f"<lastmod>{lastmod}</lastmod>" if lastmod else "")
+        + "</url>"
+        for url, lastmod in sorted(pages)
     )
+    sitemap = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+        f"{entries}\n</urlset>\n"
+    )
+    path = DIST_DIR / "sitemap.xml"
+    write_if_changed(path, sitemap)
+    return path
+
+
+def prune_scenario_pages(pages: Iterable[str]) -> int:
+    """Delete files under dist/scenarios/ that this run did not write, then empty directories.
+
+    dist/ is restored from the CI cache, so pages of deleted scenarios (or
+    prospects) would otherwise be published forever. The .gz/.br siblings of
+    the pages that were written stay.
+    """
+    root = DIST_DIR / SCENARIO_PAGES_DIR
+    if not root.is_dir():
+        return 0
+    keep = {DIST_DIR / url for url in pages}
+    removed = 0
+    for path in sorted(root.rglob("*"), reverse=True):
+        if path.is_dir():
+            if not any(path.iterdir()):
+                path.rmdir()
+        elif path not in keep and not (path.suffix in (".gz", ".br") and path.with_suffix("") in keep):
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def build_scenario_pages(
+    per_prospect: bool = False,
+    jobs: int | None = None,
+    base_url: str = "",
+    stylesheet: str | None = None,
+    vendored_fonts: bool = False,
+) -> tuple[int, int]:
+    """Render every scenario (optionally crossed with every prospect) across a process pool.
+
+    Returns the number of pages written and the number of stale pages removed.
+    A page's sitemap ``lastmod`` is the date in its scenario's request id, so
+    it does not move with checkout times. ``stylesheet`` is the URL of the
+    --assets stylesheet published for the index page; the pages then link it
+    instead of inlining the CSS and, like the sitemap, get .gz/.br siblings.
+    """
+    registry = ScenarioRegistry(SCENARIO_DIR, exclude={PROSPECTS_PATH.name, SNIPPETS_PATH.name})
+    entries = registry.entries()
+    check_slugs((entry.request_id for entry in entries), "Scenario")
+    if per_prospect:
+        names = open_prospect_store(PROSPECTS_PATH).names()
+        check_slugs(names, "Prospect", reserved=("index",))
+        # The leading None keeps the per-scenario overview page alongside the pairs.
+        chunks = [None] + [names[start:start + PROSPECT_CHUNK] for start in range(0, len(names), PROSPECT_CHUNK)]
+    else:
+        chunks = [None]
+    tasks = [
+        (str(entry.path), entry.request_id, entry.date, chunk)
+        for entry in entries
+        for chunk in chunks
+    ]
+    if stylesheet:
+        # Pages sit in dist/scenarios/<request_id>/, two levels below the asset URLs' root.
+        head = stylesheet_head(f"../../{stylesheet}", vendored_fonts)
+    else:
+        head = f"{FONT_LINKS}\n  <style>{build_css()}</style>"
+    initargs = (str(PROSPECTS_PATH), str(SNIPPETS_PATH), str(DIST_DIR), head, bool(stylesheet))
+    with ProcessPoolExecutor(
+        max_workers=jobs or os.cpu_count(),
+        initializer=_init_scenario_worker,
+        initargs=initargs,
+    ) as pool:
+        pages = [page for result in pool.map(render_scenario_task, tasks) for page in result]
+
+    removed = prune_scenario_pages(url for url, _ in pages)
+    index_mtime = (DIST_DIR / "index.html").stat().st_mtime
+    index_lastmod = datetime.fromtimestamp(index_mtime, tz=timezone.utc).date().isoformat()
+    sitemap = write_sitemap([("index.html", index_lastmod), *pages], base_url)
+    if stylesheet:
+        precompress(sitemap)
+    else:
+        remove_precompressed([sitemap])
+    return len(pages), removed
 
-    snippets_html = build_snippet_cards(snippets)
-    options_html = build_options(prospects)
-    css = build_css()
 
-    return template.substitute(
-        css=css,
-        options=options_html,
-        snippets=snippets_html,
-        prospects_json=json.dumps(prospects, ensure_ascii=False)
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Build the static DealCast bundle into dist/.")
+    parser.add_argument("--force", action="store_true", help="ignore the build manifest and re-render everything")
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=0,
+        help="fetch prospects on demand from dist/data/ in shards of this many records (1 = one file per prospect)",
     )
+    parser.add_argument(
+        "--prerender",
+        action="store_true",
+        help="render the prospect panels to HTML at build time; the page only switches between them",
+    )
+    parser.add_argument(
+        "--assets",
+        action="store_true",
+        help="move CSS and JS into minified, content-hashed files under dist/assets/ with .gz/.br siblings",
+    )
+    parser.add_argument(
+        "--vendor-fonts",
+        nargs="?",
+        const="latin",
+        default=None,
+        metavar="SUBSETS",
+        help="with --assets, serve Inter and Space Grotesk from dist/assets/, keeping these comma-separated "
+        "unicode-range subsets (default: latin)",
+    )
+    parser.add_argument(
+        "--scenarios",
+        action="store_true",
+        help="also render one static page per scenario under dist/scenarios/ and a merged sitemap.xml",
+    )
+    parser.add_argument(
+        "--per-prospect",
+        action="store_true",
+        help="with --scenarios, render one page per (scenario, prospect) pair",
+    )
+    parser.add_argument("--jobs", type=int, default=None, help="scenario worker processes (default: CPU count)")
+    parser.add_argument("--base-url", default="", help="absolute site URL used for sitemap <loc> entries")
+    args = parser.parse_args(argv)
+    if args.shard_size < 0:
+        parser.error("--shard-size must be positive")
+    if args.vendor_fonts and not args.assets:
+        parser.error("--vendor-fonts needs --assets")
+    font_subsets = tuple(subset.strip() for subset in (args.vendor_fonts or "").split(",") if subset.strip())
 
+    rebuilt, written = build_incremental(
+        force=args.force,
+        shard_size=args.shard_size,
+        prerender=args.prerender,
+        assets=args.assets,
+        font_subsets=font_subsets,
+    )
+    output_path = DIST_DIR / "index.html"
+    if written:
+        print(f"Wrote {output_path} (re-rendered: {', '.join(rebuilt)})")
+    elif rebuilt:
+        print(f"{output_path} unchanged (re-rendered: {', '.join(rebuilt)})")
+    else:
+        print(f"{output_path} is up to date")
 
-def main() -> None:
-    prospects, snippets = load_data()
-    html = build_html(prospects, snippets)
-    DIST_DIR.mkdir(parents=True, exist_ok=True)
-    (DIST_DIR / "index.html").write_text(html)
-    print(f"Wrote {DIST_DIR / 'index.html'}")
+    if args.scenarios:
+        count, removed = build_scenario_pages(
+            per_prospect=args.per_prospect,
+            jobs=args.jobs,
+            base_url=args.base_url,
+            stylesheet=load_manifest().get("stylesheet") if args.assets else None,
+            vendored_fonts=bool(font_subsets),
+        )
+        print(
+            f"Rendered {count} scenario pages into {DIST_DIR / SCENARIO_PAGES_DIR}"
+            f" (removed {removed} stale) and wrote sitemap.xml"
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,57 @@
+"""Compile the JSON data files into the binary pack the app and builders read.
+
+The pack records the version of every source it was built from; readers fall
+back to the JSON for any source edited since, so re-running this is an
+optimisation rather than a required step.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+import time
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE_DIR))
+
+from dealcast.config import DATA_DIR, PACK_PATH, SCENARIO_DIR  # noqa: E402
+from dealcast.datapack import write_pack  # noqa: E402
+from dealcast.scenario_registry import ScenarioRegistry  # noqa: E402
+from dealcast.schema import SCENARIO, iter_valid_prospects, iter_valid_snippets  # noqa: E402
+
+PROSPECTS_PATH = DATA_DIR / "prospects.json"
+SNIPPETS_PATH = DATA_DIR / "knowledge-snippets.json"
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", type=Path, default=PACK_PATH, help=f"pack file to write (default: {PACK_PATH})")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    registry = ScenarioRegistry(SCENARIO_DIR, exclude={PROSPECTS_PATH.name, SNIPPETS_PATH.name})
+    scenarios = registry.entries()
+    counts = write_pack(
+        args.out,
+        {
+            "prospects": ((prospect["companyName"], prospect) for prospect in iter_valid_prospects(PROSPECTS_PATH)),
+            # Documents are read in order, so key them by position.
+            "documents": (
+                (f"{number:08d}", document) for number, document in enumerate(iter_valid_snippets(SNIPPETS_PATH))
+            ),
+            "scenarios": (
+                (entry.request_id, SCENARIO.validate(json.loads(entry.path.read_bytes()), entry.path))
+                for entry in scenarios
+            ),
+        },
+        sources=[PROSPECTS_PATH, SNIPPETS_PATH, *(entry.path for entry in scenarios)],
+    )
+    elapsed = time.perf_counter() - started
+    summary = ", ".join(f"{count} {name}" for name, count in counts.items())
+    print(f"Wrote {args.out} ({args.out.stat().st_size} bytes: {summary}) in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Batch-render the instant kits (outline, follow-up emails, Slack digest) per show.
+
+Every template in ``instant-kit-templates.md`` is compiled once and bound
+to each scenario; follow-up emails are then rendered for every persona of
+every prospect in the roster and streamed to
+``<out>/<request_id>/follow-up-email.jsonl``. Values the data does not
+carry (sender, guest, assets, ticker...) come from ``--context`` and
+``--set``; anything still unresolved stays as its ``{{placeholder}}`` and
+is listed at the end.
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+from pathlib import Path
+import sys
+import time
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE_DIR))
+
+from dealcast.citations import CitationIndex  # noqa: E402
+from dealcast.config import DATA_DIR, SCENARIO_DIR  # noqa: E402
+from dealcast.datapack import iter_collection  # noqa: E402
+from dealcast.kits import KIT_TEMPLATES_PATH, load_kit_templates, merge_context, render_show_kits  # noqa: E402
+from dealcast.records import Prospect, Snippet  # noqa: E402
+from dealcast.scenario_registry import ScenarioRegistry  # noqa: E402
+from dealcast.schema import iter_valid_prospects, iter_valid_snippets  # noqa: E402
+
+PROSPECTS_PATH = DATA_DIR / "prospects.json"
+SNIPPETS_PATH = DATA_DIR / "knowledge-snippets.json"
+KITS_DIR = BASE_DIR / "dist" / "kits"
+
+
+def parse_assignment(text: str) -> dict:
+    """``a.b.c=value`` as the nested mapping ``{"a": {"b": {"c": "value"}}}``."""
+    path, separator, value = text.partition("=")
+    if not separator or not path:
+        raise argparse.ArgumentTypeError(f"expected path=value, got {text!r}")
+    for key in reversed(path.strip().split(".")):
+        value = {key: value}
+    return value
+
+
+def render_task(task: tuple[str, str, str, str, dict]) -> tuple[str, dict]:
+    scenario_path, request_id, templates_path, out_dir, extra = task
+    registry = ScenarioRegistry(Path(scenario_path).parent, exclude={PROSPECTS_PATH.name, SNIPPETS_PATH.name})
+    scenario = registry.get(request_id)
+    citations = CitationIndex(map(Snippet.from_dict, iter_collection(SNIPPETS_PATH, "documents", iter_valid_snippets)))
+    prospects = map(Prospect.from_dict, iter_collection(PROSPECTS_PATH, "prospects", iter_valid_prospects))
+    summary = render_show_kits(
+        load_kit_templates(Path(templates_path)),
+        scenario,
+        prospects,
+        Path(out_dir) / request_id,
+        extra=extra,
+        citations=citations,
+    )
+    return request_id, summary
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", action="append", help="request_id to render (repeatable; default: every scenario)")
+    parser.add_argument("--templates", type=Path, default=KIT_TEMPLATES_PATH, help="kit template markdown")
+    parser.add_argument("--out", type=Path, default=KITS_DIR, help=f"output directory (default: {KITS_DIR})")
+    parser.add_argument("--context", type=Path, help="JSON file of extra placeholder values, e.g. sender and guest")
+    parser.add_argument(
+        "--set",
+        dest="assignments",
+        action="append",
+        default=[],
+        type=parse_assignment,
+        metavar="PATH=VALUE",
+        help="one extra placeholder value, e.g. sender.name='Ava Chen' (repeatable; wins over --context)",
+    )
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes, one show each (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    extra: dict = json.loads(args.context.read_text(encoding="utf-8")) if args.context else {}
+    for assignment in args.assignments:
+        extra = merge_context(extra, assignment)
+
+    registry = ScenarioRegistry(SCENARIO_DIR, exclude={PROSPECTS_PATH.name, SNIPPETS_PATH.name})
+    wanted = args.scenario or [entry.request_id for entry in registry.entries()]
+    missing = [request_id for request_id in wanted if request_id not in registry]
+    if missing:
+        parser.error(f"unknown scenario(s): {', '.join(missing)}")
+    tasks = [
+        (str(registry.entry(request_id).path), request_id, str(args.templates), str(args.out), extra)
+        for request_id in wanted
+    ]
+
+    started = time.perf_counter()
+    if len(tasks) == 1:
+        results = [render_task(tasks[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=args.jobs or os.cpu_count()) as pool:
+            results = list(pool.map(render_task, tasks))
+
+    for request_id, summary in results:
+        for name, entry in summary.items():
+            print(f"{request_id}/{name}: {entry['rendered']} {entry['scope']} render(s)")
+            if entry["unresolved"]:
+                print(f"  unresolved: {' '.join(entry['unresolved'])}")
+    print(f"Wrote {args.out} in {time.perf_counter() - started:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""Check the data files against the DealCast data contract.
+
+Streams ``prospects.json`` and ``knowledge-snippets.json`` record by record
+and parses every scenario file, reporting each problem with its file,
+record and field. Exits non-zero when anything fails, so it can gate a
+data drop before the app or a static build picks it up.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+import time
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE_DIR))
+
+from dealcast.config import DATA_DIR, SCENARIO_DIR  # noqa: E402
+from dealcast.scenario_registry import read_session_context  # noqa: E402
+from dealcast.schema import SCENARIO, Issue, SchemaError, iter_valid_prospects, iter_valid_snippets  # noqa: E402
+
+PROSPECTS_PATH = DATA_DIR / "prospects.json"
+SNIPPETS_PATH = DATA_DIR / "knowledge-snippets.json"
+
+
+def check_stream(records) -> tuple[int, SchemaError | None]:
+    count = 0
+    try:
+        for _ in records:
+            count += 1
+    except SchemaError as error:
+        return count, error
+    return count, None
+
+
+def check_scenario(path: Path) -> SchemaError | None:
+    try:
+        SCENARIO.validate(json.loads(path.read_bytes()), path)
+    except SchemaError as error:
+        return error
+    except ValueError as error:
+        return SchemaError(path, [Issue(0, None, "", f"not valid JSON: {error}")])
+    return None
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--max-issues",
+        type=int,
+        default=50,
+        help="stop reading a file after this many problems (default: 50)",
+    )
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    failures: list[SchemaError] = []
+    for label, records in (
+        ("prospects", iter_valid_prospects(PROSPECTS_PATH, args.max_issues)),
+        ("snippets", iter_valid_snippets(SNIPPETS_PATH, args.max_issues)),
+    ):
+        count, error = check_stream(records)
+        if error is not None:
+            failures.append(error)
+        print(f"{label}: {count} valid record(s)" + (f", {len(error.issues)} problem(s)" if error else ""))
+
+    scenarios = 0
+    for path in sorted(SCENARIO_DIR.glob("*.json")):
+        if path in (PROSPECTS_PATH, SNIPPETS_PATH):
+            continue
+        try:
+            context = read_session_context(path, strict=True)
+        except ValueError as error:
+            # The registry skips such a file without a word, so a truncated scenario would just vanish.
+            scenarios += 1
+            failures.append(SchemaError(path, [Issue(0, None, "", f"not valid JSON: {error}")]))
+            continue
+        # Same rule as the registry: JSON without a session_context is not a scenario.
+        if context is None:
+            continue
+        scenarios += 1
+        error = check_scenario(path)
+        if error is not None:
+            failures.append(error)
+    print(f"scenarios: {scenarios} file(s) checked")
+
+    for error in failures:
+        print(error, file=sys.stderr)
+    print(f"Done in {time.perf_counter() - started:.2f}s")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Pre-render refresh_view responses for rehearsal into the on-disk cache.
+
+Replays the callback requests the browser sends when a prospect or a
+scenario is picked, for every scenario crossed with its best-fitting
+prospects, so the first click of a rehearsal is already a cache hit.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+import sys
+import time
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE_DIR))
+
+# The cache is opt-in for the server; warming it implies wanting it.
+os.environ.setdefault("DEALCAST_RESPONSE_CACHE_MB", "256")
+
+import app as dealcast_app  # noqa: E402
+
+# What the browser reports as changed for: initial load, prospect pick, scenario pick.
+TRIGGERS = ([], ["prospect-select.value"], ["scenario-select.value"])
+
+
+def refresh_request(prospect: str, scenario_id: str, triggered: list[str]) -> dict:
+    callback = dealcast_app.app.callback_map[dealcast_app.REFRESH_OUTPUT]
+    values = {
+        "prospect-select": prospect,
+        "scenario-select": scenario_id,
+        "data-version": {"versions": dealcast_app.DATA_VERSIONS.snapshot(), "changed": []},
+    }
+    return {
+        "output": dealcast_app.REFRESH_OUTPUT,
+        "outputs": [
+            {"id": output.component_id, "property": output.component_property} for output in callback["output"]
+        ],
+        "inputs": [{**item, "value": values[item["id"]]} for item in callback["inputs"]],
+        "changedPropIds": triggered,
+        "state": [],
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prospects", type=int, default=20, help="prospects per scenario, best fit first (default: 20)")
+    parser.add_argument("--all", action="store_true", help="warm every prospect for every scenario")
+    parser.add_argument("--clear", action="store_true", help="drop existing entries first")
+    args = parser.parse_args(argv)
+
+    cache = dealcast_app.RESPONSES
+    if cache is None:
+        parser.error("DEALCAST_RESPONSE_CACHE_MB is 0; the response cache is disabled")
+    if args.clear:
+        cache.clear()
+    client = dealcast_app.app.server.test_client()
+    started = time.perf_counter()
+    requests = failures = 0
+    for scenario_id in dealcast_app.SCENARIOS:
+        if args.all:
+            prospects = dealcast_app.PROSPECTS.names()
+        else:
+            profile = dealcast_app.RANKER.profile_for_scenario(dealcast_app.SCENARIOS.get(scenario_id))
+            prospects = dealcast_app.RANKER.top(profile, limit=args.prospects)
+        for prospect in prospects:
+            for triggered in TRIGGERS:
+                response = client.post("/_dash-update-component", json=refresh_request(prospect, scenario_id, triggered))
+                requests += 1
+                failures += response.status_code != 200
+    elapsed = time.perf_counter() - started
+    stats = cache.stats()
+    print(
+        f"Warmed {requests} responses in {elapsed:.1f}s ({failures} failed); "
+        f"cache holds {stats['entries']} entries, {stats['bytes'] / (1 << 20):.1f} MB at {cache.path}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+"""Shared setup: import the package and scripts from the checkout, cache into a temp dir."""
+
+from pathlib import Path
+import os
+import sys
+import tempfile
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE_DIR))
+sys.path.insert(0, str(BASE_DIR / "scripts"))
+
+# dealcast.config reads this at import; tests must not touch .dealcast-cache.
+os.environ.setdefault("DEALCAST_CACHE_DIR", tempfile.mkdtemp(prefix="dealcast-tests-"))
@@ -0,0 +1,39 @@
+import pytest
+
+import build_static_site
+
+
+@pytest.fixture
+def dist(tmp_path, monkeypatch):
+    """Build from the checked-in data into a temporary dist/."""
+    dist = tmp_path / "dist"
+    monkeypatch.setattr(build_static_site, "DIST_DIR", dist)
+    monkeypatch.setattr(build_static_site, "BUILD_DIR", dist / ".build")
+    monkeypatch.setattr(build_static_site, "MANIFEST_PATH", dist / ".build" / "manifest.json")
+    return dist
+
+
+def data_files(dist):
+    return sorted(path.name for path in (dist / build_static_site.SHARDED_DATA_DIR).rglob("*") if path.is_file())
+
+
+def test_sharded_build_writes_data_files(dist):
+    build_static_site.build_incremental(shard_size=1)
+    assert any(name.startswith("prospects-index.") for name in data_files(dist))
+
+
+@pytest.mark.parametrize("assets", [False, True])
+def test_inline_build_removes_earlier_shards(dist, assets):
+    build_static_site.build_incremental(shard_size=1, assets=True)
+    assert any(name.endswith(".json.gz") for name in data_files(dist))
+
+    build_static_site.build_incremental(assets=assets)
+    assert not (dist / build_static_site.SHARDED_DATA_DIR).exists()
+    assert "prospects-index" not in (dist / "index.html").read_text()
+
+
+def test_up_to_date_build_keeps_the_shards(dist):
+    build_static_site.build_incremental(shard_size=1)
+    before = data_files(dist)
+    assert build_static_site.build_incremental(shard_size=1) == ([], False)
+    assert data_files(dist) == before
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from dealcast.cards import build_cards, match_scenario
+from dealcast.records import Scenario
+
+
+def prospect(name, revenue="10M"):
+    return {
+        "companyName": name,
+        "industry": "Robotics",
+        "headquarters": "Austin, TX",
+        "annualRevenue": revenue,
+        "growthStage": "Series B",
+        "personas": [],
+        "techStack": {},
+        "challenges": [f"{name} challenge"],
+        "buyingTriggers": [f"{name} trigger"],
+        "competitiveNotes": [],
+    }
+
+
+def scenario(request_id, headline, opening_angle="Lead with the audit trail"):
+    return Scenario.from_dict(
+        {
+            "session_context": {"request_id": request_id},
+            "intel_scout_brief": {"headline": headline},
+            "playbook": {"opening_angle": opening_angle},
+            "call_studio": {},
+        },
+        request_id,
+    )
+
+
+@pytest.fixture
+def paths(tmp_path):
+    roster = tmp_path / "prospects.json"
+    roster.write_text(json.dumps({"prospects": [prospect("Acme"), prospect("Globex Labs")]}))
+    return roster, tmp_path / "cards.json", tmp_path / "cards.state.json"
+
+
+def read_cards(path):
+    return {card["company"]: card for card in json.loads(path.read_text())["cards"]}
+
+
+def test_scenario_angle_only_for_the_company_it_names(paths):
+    roster, out, state = paths
+    build_cards(roster, [scenario("dc-1", "Globex is ready to buy")], out, state)
+    cards = read_cards(out)
+    assert cards["Globex Labs"]["opportunity_angle"]["scenario"] == "dc-1"
+    assert cards["Globex Labs"]["opportunity_angle"]["headline"] == "Globex is ready to buy"
+    assert cards["Acme"]["opportunity_angle"]["scenario"] is None
+    assert cards["Acme"]["opportunity_angle"]["headline"] == "Acme challenge"
+
+
+def test_match_scenario_needs_the_whole_name():
+    shows = [("dc-1", "acmeville expands"), ("dc-2", "acme inc. signs")]
+    assert match_scenario("Acme Inc", shows) == "dc-2"
+    assert match_scenario("Initech", shows) is None
+
+
+def test_rebuild_reuses_unchanged_cards(paths):
+    roster, out, state = paths
+    build_cards(roster, [], out, state)
+    result = build_cards(roster, [], out, state)
+    assert (result.derived, result.reused, result.written) == (0, 2, False)
+
+
+@pytest.mark.parametrize("force", [False, True])
+def test_roster_drift_reaches_cards_written_earlier(paths, force):
+    roster, out, state = paths
+    # A card file the builder has no state for, e.g. one committed by hand.
+    out.write_text(json.dumps({"cards": [{"company": "Acme", "company_capsule": {"scale": {"annual_revenue": "62M"}}}]}))
+    roster.write_text(json.dumps({"prospects": [prospect("Acme", "99M"), prospect("Globex Labs")]}))
+    result = build_cards(roster, [], out, state, force=force)
+    assert result.curated == 0
+    assert read_cards(out)["Acme"]["company_capsule"]["scale"]["annual_revenue"] == "99M"
+
+
+def test_curated_cards_survive_force(paths):
+    roster, out, state = paths
+    build_cards(roster, [], out, state)
+    cards = read_cards(out)
+    cards["Acme"].update(curated=True, note="hand-written")
+    out.write_text(json.dumps({"cards": list(cards.values())}))
+    roster.write_text(json.dumps({"prospects": [prospect("Acme", "99M"), prospect("Globex Labs", "99M")]}))
+    result = build_cards(roster, [], out, state, force=True)
+    cards = read_cards(out)
+    assert (result.curated, result.derived) == (1, 1)
+    assert cards["Acme"]["note"] == "hand-written"
+    assert cards["Globex Labs"]["company_capsule"]["scale"]["annual_revenue"] == "99M"
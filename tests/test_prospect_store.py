@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from dealcast.prospect_store import ProspectStore
+from dealcast.schema import SchemaError
+
+
+def prospect(name, revenue="10M"):
+    return {
+        "companyName": name,
+        "industry": "Robotics",
+        "headquarters": "Austin, TX",
+        "annualRevenue": revenue,
+        "growthStage": "Series B",
+        "personas": [],
+        "techStack": {},
+        "challenges": [],
+        "buyingTriggers": [],
+        "competitiveNotes": [],
+    }
+
+
+def write_roster(path, prospects):
+    path.write_text(json.dumps({"prospects": prospects}))
+
+
+@pytest.fixture
+def roster(tmp_path):
+    path = tmp_path / "prospects.json"
+    write_roster(path, [prospect("Acme"), prospect("Globex"), prospect("Initech")])
+    return path
+
+
+def test_get_reads_records_by_name(roster, tmp_path):
+    store = ProspectStore(roster, index_dir=tmp_path / "cache")
+    assert store.names() == ["Acme", "Globex", "Initech"]
+    assert store.get("Globex").name == "Globex"
+    assert store.get("Nobody") is None
+
+
+def test_rejected_rewrite_keeps_serving_the_indexed_bytes(roster, tmp_path):
+    store = ProspectStore(roster, index_dir=tmp_path / "cache")
+    # Longer names shift every record's offset in the new file.
+    roster.write_text(json.dumps({"prospects": [{"companyName": "A much longer first name"}, prospect("Globex")]}))
+    with pytest.raises(SchemaError):
+        store.reload()
+    assert [store.get(name).name for name in ("Acme", "Globex", "Initech")] == ["Acme", "Globex", "Initech"]
+
+
+def test_lookups_before_the_reload_see_the_old_roster(roster, tmp_path):
+    store = ProspectStore(roster, index_dir=tmp_path / "cache")
+    write_roster(roster, [prospect("A much longer first name"), prospect("Acme", "99M")])
+    assert store.get("Acme").revenue == "10M"
+    store.reload()
+    assert store.names() == ["A much longer first name", "Acme"]
+    assert store.get("Acme").revenue == "99M"
+
+
+def test_cached_index_is_reused_against_a_fresh_copy(roster, tmp_path):
+    ProspectStore(roster, index_dir=tmp_path / "cache")
+    store = ProspectStore(roster, index_dir=tmp_path / "cache")
+    assert store.get("Initech").name == "Initech"
@@ -0,0 +1,23 @@
+import pytest
+
+from dealcast.citations import Citation
+from dealcast.records import Snippet
+from dealcast.render import citation_chip, to_html
+
+
+def chip(url):
+    return to_html(citation_chip(Citation("src-1", Snippet("Field notes", "Excerpt", id="src-1", url=url))))
+
+
+@pytest.mark.parametrize("url", ["https://example.com/a?b=1", "http://example.com", "/docs/notes", "notes.html"])
+def test_citation_links_web_and_relative_urls(url):
+    assert chip(url).startswith('<a class="citation-chip"')
+
+
+@pytest.mark.parametrize(
+    "url", ["javascript:alert(1)", " JavaScript:alert(1)", "java\tscript:alert(1)", "data:text/html,x", "vbscript:x"]
+)
+def test_citation_with_other_schemes_is_plain_text(url):
+    html = chip(url)
+    assert html.startswith('<span class="citation-chip"')
+    assert "href" not in html and "script:" not in html
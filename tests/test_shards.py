@@ -0,0 +1,57 @@
+import json
+
+from dealcast.records import Prospect
+from dealcast.shards import INDEX_STEM, SHARD_DIR, write_shards
+
+
+def roster(*names):
+    return [
+        Prospect.from_dict(
+            {
+                "companyName": name,
+                "industry": "Robotics",
+                "headquarters": "Austin, TX",
+                "annualRevenue": "10M",
+                "growthStage": "Series B",
+                "personas": [],
+                "techStack": {},
+                "challenges": [],
+                "buyingTriggers": [],
+                "competitiveNotes": [],
+            }
+        )
+        for name in names
+    ]
+
+
+def test_files_are_named_by_content(tmp_path):
+    summary = write_shards(roster("Acme", "Globex", "Initech"), tmp_path, shard_size=2)
+    assert summary["prospects"] == 3 and summary["shards"] == 2
+    index = json.loads((tmp_path / summary["index"]).read_text())
+    assert summary["index"].startswith(f"{INDEX_STEM}.")
+    assert [entry["name"] for entry in index["prospects"]] == ["Acme", "Globex", "Initech"]
+    shards = sorted(path.name for path in (tmp_path / SHARD_DIR).iterdir())
+    assert sorted({entry["shard"] for entry in index["prospects"]}) == shards
+
+    again = write_shards(roster("Acme", "Globex", "Initech"), tmp_path, shard_size=2)
+    assert again["index"] == summary["index"] and again["written"] == 0
+
+
+def test_files_of_earlier_rosters_are_removed_with_their_siblings(tmp_path):
+    old = write_shards(roster("Acme", "Globex"), tmp_path, shard_size=1)
+    old_files = [tmp_path / old["index"], *(tmp_path / SHARD_DIR).iterdir()]
+    for path in old_files:
+        for suffix in (".gz", ".br"):
+            path.with_name(path.name + suffix).write_bytes(b"stale")
+
+    new = write_shards(roster("Acme", "Initech"), tmp_path, shard_size=1)
+    index = json.loads((tmp_path / new["index"]).read_text())
+    current = {new["index"], *(f"{SHARD_DIR}/{entry['shard']}" for entry in index["prospects"])}
+    # Acme's shard did not change, so it keeps its siblings; Globex's go with it.
+    left = {
+        path.relative_to(tmp_path).as_posix().removesuffix(".gz").removesuffix(".br")
+        for path in tmp_path.rglob("*")
+        if path.is_file()
+    }
+    assert left == current
+    assert not (tmp_path / (old["index"] + ".gz")).exists()
@@ -0,0 +1,24 @@
+import json
+
+import pytest
+
+import validate_data
+
+
+@pytest.fixture
+def scenario_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(validate_data, "SCENARIO_DIR", tmp_path)
+    (tmp_path / "notes.json").write_text(json.dumps({"owner": "ops"}))
+    return tmp_path
+
+
+def test_json_without_session_context_is_not_a_scenario(scenario_dir, capsys):
+    assert validate_data.main([]) == 0
+    assert "scenarios: 0 file(s) checked" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("content", ["", '{"session_context": {"request_id": "dc-1"', "[1, 2]"])
+def test_unreadable_scenario_file_fails(scenario_dir, capsys, content):
+    (scenario_dir / "dc-1.json").write_text(content)
+    assert validate_data.main([]) == 1
+    assert "dc-1.json" in capsys.readouterr().err
@@ -0,0 +1,17 @@
+"""Production entry point: ``gunicorn -c gunicorn.conf.py``.
+
+Importing this module loads every data source once. With ``preload_app``
+that happens in the gunicorn master, so forked workers share the parsed
+roster, indexes and mapped data pack copy-on-write instead of each parsing
+the JSON again. Dash dev tools stay off because ``app.run`` is never called.
+"""
+
+import os
+
+os.environ.setdefault("DEALCAST_COMPRESS", "1")
+
+from app import app, start_data_watcher  # noqa: E402
+
+server = app.server
+
+__all__ = ["app", "server", "start_data_watcher"]